@@ -144,6 +144,10 @@ STAGE_2_TIMEOUT = 300
 WRAP_UP_TIMEOUT = 300
 COOLDOWN_TIME = 60
 
+# Number of components preloaded at the same time, one import executor
+# worker is left for the imports of the integrations being set up
+PRELOAD_COMPONENTS_JOBS = core.IMPORT_EXECUTOR_WORKERS - 1
+
 # Core integrations are unconditionally loaded
 CORE_INTEGRATIONS = {"homeassistant", "persistent_notification"}
 
@@ -449,6 +453,7 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template.async_load_compile_cache(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
@@ -805,14 +810,26 @@ async def _async_resolve_domains_and_preload(
         for deps in integrations_after_dependencies.values()
         for dep in deps.difference(integrations_requirements)
     )
-    all_requirements = set(chain.from_iterable(integrations_requirements.values()))
+    integrations_requirements.update(
+        (domain, itg.requirements)
+        for domain, itg in all_integrations_to_setup.items()
+        if domain not in integrations_requirements
+    )
 
     # Optimistically check if requirements are already installed
-    # ahead of setting up the integrations so we can prime the cache
+    # ahead of setting up the integrations so we can prime the cache,
+    # then import the components of all integrations we are going to
+    # set up whose requirements are already installed so the setup
+    # process mostly finds them already imported.
     # We do not wait for this since it's an optimization only
     hass.async_create_background_task(
-        requirements.async_load_installed_versions(hass, all_requirements),
-        "check installed requirements",
+        _async_preload_components(
+            hass,
+            all_integrations_to_setup,
+            integrations_requirements,
+            integrations_after_dependencies,
+        ),
+        "preload components",
         eager_start=True,
     )
 
@@ -847,6 +864,43 @@ async def _async_resolve_domains_and_preload(
     return integrations_to_setup, all_integrations_to_setup
 
 
+async def _async_preload_components(
+    hass: core.HomeAssistant,
+    integrations: dict[str, Integration],
+    integrations_requirements: dict[str, list[str]],
+    integrations_after_dependencies: dict[str, set[str]],
+) -> None:
+    """Preload components once the installed requirements are known.
+
+    An integration is only preloaded when the requirements of the
+    integration, its dependencies and its after dependencies are already
+    installed, so a component is never imported while setup may still
+    be installing a package it imports.
+    """
+    await requirements.async_load_installed_versions(
+        hass, set(chain.from_iterable(integrations_requirements.values()))
+    )
+    installed = {
+        domain
+        for domain, reqs in integrations_requirements.items()
+        if requirements.async_requirements_installed(hass, reqs)
+    }
+    await loader.async_preload_components(
+        [
+            itg
+            for domain, itg in integrations.items()
+            if installed.issuperset(
+                (
+                    domain,
+                    *itg.all_dependencies,
+                    *integrations_after_dependencies.get(domain, ()),
+                )
+            )
+        ],
+        PRELOAD_COMPONENTS_JOBS,
+    )
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -962,6 +1016,11 @@ async def _async_set_up_integrations(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+        import_time = loader.async_get_import_timings(hass)
+        _LOGGER.debug(
+            "Integration import times: %s",
+            dict(sorted(import_time.items(), key=itemgetter(1), reverse=True)),
+        )
 
 
 class _WatchPendingSetups:
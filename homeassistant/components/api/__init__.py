@@ -2,12 +2,13 @@
 
 import asyncio
 from asyncio import shield, timeout
+from collections.abc import Iterable
 from functools import lru_cache
 from http import HTTPStatus
 import logging
 from typing import Any
 
-from aiohttp import web
+from aiohttp import hdrs, web
 from aiohttp.web_exceptions import HTTPBadRequest
 import voluptuous as vol
 
@@ -204,6 +205,14 @@ class APIConfigView(HomeAssistantView):
         return self.json(request.app[KEY_HASS].config.as_dict())
 
 
+def _states_etag(user: User, version: int) -> str:
+    """Return the ETag of the states a user can read at a version."""
+    if user.is_admin:
+        return f"{version}-admin"
+    groups = ",".join(sorted(group.id for group in user.groups))
+    return f"{version}-{user.id}-{groups}"
+
+
 class APIStatesView(HomeAssistantView):
     """View to handle States requests."""
 
@@ -212,9 +221,29 @@ class APIStatesView(HomeAssistantView):
 
     @ha.callback
     def get(self, request: web.Request) -> web.Response:
-        """Get current states."""
+        """Get current states.
+
+        The version of the state machine and the permissions of the user are
+        sent as ETag so clients can poll with If-None-Match, or with since to
+        get only the changed states.
+        """
         user: User = request[KEY_HASS_USER]
         hass = request.app[KEY_HASS]
+        version = hass.states.version
+        etag = _states_etag(user, version)
+        headers = {hdrs.ETAG: f'"{etag}"'}
+        if (since := request.query.get("since")) is not None:
+            try:
+                since_version = int(since)
+            except ValueError:
+                return self.json_message(
+                    "Invalid since specified.", HTTPStatus.BAD_REQUEST
+                )
+            return self._changes_since(hass, user, version, since_version, headers)
+        if (if_none_match := request.if_none_match) and any(
+            match.value == etag for match in if_none_match
+        ):
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
         if user.is_admin:
             states = (state.as_dict_json for state in hass.states.async_all())
         else:
@@ -227,11 +256,49 @@ class APIStatesView(HomeAssistantView):
         response = web.Response(
             body=b"".join((b"[", b",".join(states), b"]")),
             content_type=CONTENT_TYPE_JSON,
+            headers=headers,
             zlib_executor_size=32768,
         )
         response.enable_compression()
         return response
 
+    @ha.callback
+    def _changes_since(
+        self,
+        hass: HomeAssistant,
+        user: User,
+        version: int,
+        since: int,
+        headers: dict[str, str],
+    ) -> web.Response:
+        """Return the states changed since a version.
+
+        All states are returned with reset set when the changes since the
+        version are no longer known.
+        """
+        if (changes := hass.states.async_changes_since(since)) is None:
+            changed: Iterable[ha.State] = hass.states.async_all()
+            removed: list[str] = []
+        else:
+            changed, removed = changes
+        if not user.is_admin:
+            entity_perm = user.permissions.check_entity
+            changed = [
+                state for state in changed if entity_perm(state.entity_id, "read")
+            ]
+            removed = [
+                entity_id for entity_id in removed if entity_perm(entity_id, "read")
+            ]
+        return self.json(
+            {
+                "version": version,
+                "reset": changes is None,
+                "changed": [json_fragment(state.as_dict_json) for state in changed],
+                "removed": removed,
+            },
+            headers=headers,
+        )
+
 
 class APIEntityStateView(HomeAssistantView):
     """View to handle EntityState requests."""
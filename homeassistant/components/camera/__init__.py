@@ -275,6 +275,20 @@ async def async_get_mjpeg_stream(
     return stream
 
 
+def _mjpeg_frame(img_bytes: bytes, content_type: str) -> bytes:
+    """Return an image as a frame of an MJPEG stream."""
+    return (
+        bytes(
+            "--frameboundary\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(img_bytes)}\r\n\r\n",
+            "utf-8",
+        )
+        + img_bytes
+        + b"\r\n"
+    )
+
+
 async def async_get_still_stream(
     request: web.Request,
     image_cb: Callable[[], Awaitable[bytes | None]],
@@ -291,16 +305,7 @@ async def async_get_still_stream(
 
     async def write_to_mjpeg_stream(img_bytes: bytes) -> None:
         """Write image to stream."""
-        await response.write(
-            bytes(
-                "--frameboundary\r\n"
-                f"Content-Type: {content_type}\r\n"
-                f"Content-Length: {len(img_bytes)}\r\n\r\n",
-                "utf-8",
-            )
-            + img_bytes
-            + b"\r\n"
-        )
+        await response.write(_mjpeg_frame(img_bytes, content_type))
 
     last_image = None
 
@@ -332,6 +337,111 @@ async def async_get_still_stream(
     return response
 
 
+class _SharedStillStream:
+    """Fetch camera images once and share them with all MJPEG viewers.
+
+    A single task fetches the images while there are viewers. Each viewer
+    has a queue holding only the latest image, so slow viewers skip images
+    instead of delaying the others. An error fetching an image ends the
+    stream and is raised in the handlers of the current viewers.
+    """
+
+    def __init__(self, camera: Camera, interval: float) -> None:
+        """Initialize the shared still stream."""
+        self._camera = camera
+        self._interval = interval
+        self._queues: set[asyncio.Queue[bytes | Exception | None]] = set()
+        self._last_image: bytes | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def idle(self) -> bool:
+        """Return if there are no viewers."""
+        return not self._queues
+
+    @callback
+    def _async_subscribe(self) -> asyncio.Queue[bytes | Exception | None]:
+        """Add a viewer and start fetching images if needed."""
+        queue: asyncio.Queue[bytes | Exception | None] = asyncio.Queue(maxsize=1)
+        self._queues.add(queue)
+        if self._last_image is not None:
+            queue.put_nowait(self._last_image)
+        if self._task is None:
+            self._task = self._camera.hass.async_create_background_task(
+                self._async_fetch_images(),
+                f"camera {self._camera.entity_id} still stream",
+                eager_start=False,
+            )
+        return queue
+
+    @callback
+    def _async_unsubscribe(self, queue: asyncio.Queue[bytes | Exception | None]) -> None:
+        """Remove a viewer and stop fetching images after the last one."""
+        self._queues.discard(queue)
+        if not self._queues and self._task is not None:
+            self._task.cancel()
+            self._task = None
+            self._last_image = None
+
+    @callback
+    def _async_publish(self, item: bytes | Exception | None) -> None:
+        """Replace the pending image of each viewer."""
+        for queue in self._queues:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(item)
+
+    async def _async_fetch_images(self) -> None:
+        """Fetch images while there are viewers."""
+        end: Exception | None = None
+        try:
+            while True:
+                last_fetch = time.monotonic()
+                if not (img_bytes := await self._camera.async_camera_image()):
+                    break
+                if img_bytes != self._last_image:
+                    self._last_image = img_bytes
+                    self._async_publish(img_bytes)
+                next_fetch = last_fetch + self._interval
+                now = time.monotonic()
+                if next_fetch > now:
+                    await asyncio.sleep(next_fetch - now)
+        except Exception as err:  # noqa: BLE001
+            # Raised in the request handlers of the viewers
+            _LOGGER.debug(
+                "Error fetching image for still stream of %s: %s",
+                self._camera.entity_id,
+                err,
+            )
+            end = err
+        # Signal the end of the stream to the current viewers
+        self._task = None
+        self._last_image = None
+        self._async_publish(end)
+
+    async def async_handle(self, request: web.Request) -> web.StreamResponse:
+        """Generate an HTTP MJPEG stream from the shared images."""
+        response = web.StreamResponse()
+        response.content_type = CONTENT_TYPE_MULTIPART.format("--frameboundary")
+        await response.prepare(request)
+        content_type = self._camera.content_type
+        queue = self._async_subscribe()
+        try:
+            first = True
+            while item := await queue.get():
+                if isinstance(item, Exception):
+                    raise item
+                frame = _mjpeg_frame(item, content_type)
+                await response.write(frame)
+                # Send the first frame twice, see async_get_still_stream
+                if first:
+                    await response.write(frame)
+                    first = False
+        finally:
+            self._async_unsubscribe(queue)
+        return response
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the camera component."""
     component = hass.data[DATA_COMPONENT] = EntityComponent[Camera](
@@ -475,6 +585,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         self._warned_old_signature = False
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
+        self._still_streams: dict[float, _SharedStillStream] = {}
         self._webrtc_provider: CameraWebRTCProvider | None = None
         self._supports_native_async_webrtc = (
             type(self).async_handle_async_webrtc_offer
@@ -616,10 +727,19 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     async def handle_async_still_stream(
         self, request: web.Request, interval: float
     ) -> web.StreamResponse:
-        """Generate an HTTP MJPEG stream from camera images."""
-        return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
-        )
+        """Generate an HTTP MJPEG stream from camera images.
+
+        The images are fetched once for all viewers with the same interval.
+        """
+        if (still_stream := self._still_streams.get(interval)) is None:
+            still_stream = self._still_streams[interval] = _SharedStillStream(
+                self, interval
+            )
+        try:
+            return await still_stream.async_handle(request)
+        finally:
+            if still_stream.idle:
+                self._still_streams.pop(interval, None)
 
     async def handle_async_mjpeg_stream(
         self, request: web.Request
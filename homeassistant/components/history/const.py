@@ -1,7 +1,13 @@
 """History integration constants."""
 
+from datetime import timedelta
+
 DOMAIN = "history"
 
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# The historical part of a history stream is fetched and sent in
+# slices of this size so memory use does not grow with the period
+HISTORY_STREAM_CHUNK_TIME = timedelta(days=1)
@@ -38,7 +38,11 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import create_eager_task
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    HISTORY_STREAM_CHUNK_TIME,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_states_before
 
 _LOGGER = logging.getLogger(__name__)
@@ -161,7 +165,7 @@ async def ws_get_history_during_period(
     minimal_response = msg["minimal_response"]
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_significant_states,
             hass,
             msg["id"],
@@ -225,8 +229,7 @@ def _generate_historical_response(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
-    send_empty: bool,
-) -> tuple[float, dt | None, bytes | None]:
+) -> tuple[dt | None, bytes | None]:
     """Generate a historical response."""
     states = cast(
         dict[str, list[dict[str, Any]]],
@@ -253,17 +256,10 @@ def _generate_historical_response(
             last_time_ts = cast(float, state_last_time)
 
     if last_time_ts == 0:
-        # If we did not send any states ever, we need to send an empty response
-        # so the websocket client knows it should render/process/consume the
-        # data.
-        if not send_empty:
-            return last_time_ts, None, None
-        last_time_dt = end_time
-    else:
-        last_time_dt = dt_util.utc_from_timestamp(last_time_ts)
+        return None, None
 
+    last_time_dt = dt_util.utc_from_timestamp(last_time_ts)
     return (
-        last_time_ts,
         last_time_dt,
         _generate_websocket_response(msg_id, start_time, last_time_dt, states),
     )
@@ -282,24 +278,50 @@ async def _async_send_historical_states(
     no_attributes: bool,
     send_empty: bool,
 ) -> dt | None:
-    """Fetch history significant_states and send them to the client."""
+    """Fetch history significant_states and send them to the client.
+
+    The period is fetched in slices of HISTORY_STREAM_CHUNK_TIME and each
+    slice is sent as its own message so that only one slice is held in
+    memory at a time regardless of how long the requested period is.
+    """
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
-        _generate_historical_response,
-        hass,
-        msg_id,
-        start_time,
-        end_time,
-        entity_ids,
-        include_start_time_state,
-        significant_changes_only,
-        minimal_response,
-        no_attributes,
-        send_empty,
-    )
-    if payload:
-        connection.send_message(payload)
-    return last_time_dt if last_time_ts != 0 else None
+    last_time_dt: dt | None = None
+    chunk_start = start_time
+    while True:
+        chunk_end = min(chunk_start + HISTORY_STREAM_CHUNK_TIME, end_time)
+        chunk_last_time_dt, payload = await instance.async_add_read_executor_job(
+            _generate_historical_response,
+            hass,
+            msg_id,
+            chunk_start,
+            chunk_end,
+            entity_ids,
+            # Only the first slice needs the state at the start time
+            include_start_time_state and chunk_start == start_time,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+        if payload:
+            connection.send_message(payload)
+            last_time_dt = chunk_last_time_dt
+        if msg_id not in connection.subscriptions:
+            # Unsubscribe happened while sending historical states
+            return last_time_dt
+        if chunk_end >= end_time:
+            break
+        # The start time is exclusive, so move it back by one microsecond
+        # to avoid missing a state that happened exactly at the boundary
+        chunk_start = chunk_end - timedelta(microseconds=1)
+
+    if last_time_dt is None and send_empty:
+        # If we did not send any states ever, we need to send an empty response
+        # so the websocket client knows it should render/process/consume the
+        # data.
+        connection.send_message(
+            _generate_websocket_response(msg_id, start_time, end_time, {})
+        )
+    return last_time_dt
 
 
 def _history_compressed_state(state: State, no_attributes: bool) -> dict[str, Any]:
@@ -53,6 +53,7 @@ from .const import (
     CONF_CERTIFICATE,
     CONF_CLIENT_CERT,
     CONF_CLIENT_KEY,
+    CONF_COALESCE_STATE_WRITES,
     CONF_KEEPALIVE,
     CONF_TLS_INSECURE,
     CONF_TRANSPORT,
@@ -60,6 +61,7 @@ from .const import (
     CONF_WS_HEADERS,
     CONF_WS_PATH,
     DEFAULT_BIRTH,
+    DEFAULT_COALESCE_STATE_WRITES,
     DEFAULT_ENCODING,
     DEFAULT_KEEPALIVE,
     DEFAULT_PORT,
@@ -83,6 +85,7 @@ from .models import (
     PublishPayloadType,
     ReceiveMessage,
 )
+from .topic_trie import TopicTrie
 from .util import EnsureJobAfterCooldown, get_file_path, mqtt_config_entry_enabled
 
 if TYPE_CHECKING:
@@ -266,7 +269,6 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
@@ -389,6 +391,9 @@ class MQTT:
         self.config_entry = config_entry
         self.conf = conf
         self.is_mqttv5 = conf.get(CONF_PROTOCOL, DEFAULT_PROTOCOL) == PROTOCOL_5
+        self._coalesce_state_writes: bool = conf.get(
+            CONF_COALESCE_STATE_WRITES, DEFAULT_COALESCE_STATE_WRITES
+        )
 
         self._simple_subscriptions: defaultdict[str, set[Subscription]] = defaultdict(
             set
@@ -396,6 +401,7 @@ class MQTT:
         # To ensure the wildcard subscriptions order is preserved, we use a dict
         # with `None` values instead of a set.
         self._wildcard_subscriptions: dict[Subscription, None] = {}
+        self._wildcard_subscriptions_trie: TopicTrie[Subscription] = TopicTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -515,7 +521,19 @@ class MQTT:
     @callback
     def _async_reader_callback(self, client: mqtt.Client) -> None:
         """Handle reading data from the socket."""
-        if (status := client.loop_read(MAX_PACKETS_TO_READ)) != 0:
+        if not self._coalesce_state_writes:
+            status = client.loop_read(MAX_PACKETS_TO_READ)
+        else:
+            # Write the state of entities updated by several of the
+            # messages read in this pass only once, after all of them
+            # are processed.
+            state_write_requests = self._mqtt_data.state_write_requests
+            state_write_requests.async_start_coalescing()
+            try:
+                status = client.loop_read(MAX_PACKETS_TO_READ)
+            finally:
+                state_write_requests.async_stop_coalescing()
+        if status != 0:
             self._async_handle_callback_exception(status)
 
     @callback
@@ -642,8 +660,9 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return (
+            topic in self._simple_subscriptions
+            or self._wildcard_subscriptions_trie.has_topic_filter(topic)
         )
 
     async def async_publish(
@@ -785,6 +804,7 @@ class MQTT:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
             self._wildcard_subscriptions[subscription] = None
+            self._wildcard_subscriptions_trie.add(subscription.topic, subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -803,6 +823,7 @@ class MQTT:
                     del simple_subscriptions[topic]
             else:
                 del self._wildcard_subscriptions[subscription]
+                self._wildcard_subscriptions_trie.remove(topic, subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
@@ -873,9 +894,8 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -1086,13 +1106,7 @@ class MQTT:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        subscriptions.extend(self._wildcard_subscriptions_trie.matches(topic))
         return subscriptions
 
     @callback
@@ -1314,12 +1328,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    from paho.mqtt.matcher import MQTTMatcher  # noqa: PLC0415
-
-    matcher = MQTTMatcher()  # type: ignore[no-untyped-call]
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)  # type: ignore[no-untyped-call]
@@ -132,6 +132,7 @@ from .const import (
     CONF_CERTIFICATE,
     CONF_CLIENT_CERT,
     CONF_CLIENT_KEY,
+    CONF_COALESCE_STATE_WRITES,
     CONF_COLOR_MODE_STATE_TOPIC,
     CONF_COLOR_MODE_VALUE_TEMPLATE,
     CONF_COLOR_TEMP_COMMAND_TEMPLATE,
@@ -255,6 +256,7 @@ from .const import (
     CONFIG_ENTRY_MINOR_VERSION,
     CONFIG_ENTRY_VERSION,
     DEFAULT_BIRTH,
+    DEFAULT_COALESCE_STATE_WRITES,
     DEFAULT_DISCOVERY,
     DEFAULT_ENCODING,
     DEFAULT_KEEPALIVE,
@@ -2556,6 +2558,12 @@ class MQTTOptionsFlowHandler(OptionsFlow):
             if not user_input["will_enable"]:
                 options_config[CONF_WILL_MESSAGE] = {}
 
+            # Only store the opt-in option when it is enabled
+            if user_input.get(CONF_COALESCE_STATE_WRITES):
+                options_config[CONF_COALESCE_STATE_WRITES] = True
+            else:
+                options_config.pop(CONF_COALESCE_STATE_WRITES, None)
+
             if not bad_input:
                 return self.async_create_entry(data=options_config)
 
@@ -2623,6 +2631,15 @@ class MQTTOptionsFlowHandler(OptionsFlow):
             BOOLEAN_SELECTOR
         )
 
+        fields[
+            vol.Optional(
+                CONF_COALESCE_STATE_WRITES,
+                default=options_config.get(
+                    CONF_COALESCE_STATE_WRITES, DEFAULT_COALESCE_STATE_WRITES
+                ),
+            )
+        ] = BOOLEAN_SELECTOR
+
         return self.async_show_form(
             step_id="options",
             data_schema=vol.Schema(fields),
@@ -194,6 +194,7 @@ CONF_WHITE_SCALE = "white_scale"
 CONF_CERTIFICATE = "certificate"
 CONF_CLIENT_KEY = "client_key"
 CONF_CLIENT_CERT = "client_cert"
+CONF_COALESCE_STATE_WRITES = "coalesce_state_writes"
 CONF_COMPONENTS = "components"
 CONF_TLS_INSECURE = "tls_insecure"
 
@@ -215,6 +216,7 @@ DEFAULT_BRIGHTNESS = False
 DEFAULT_BRIGHTNESS_SCALE = 255
 DEFAULT_PREFIX = "homeassistant"
 DEFAULT_BIRTH_WILL_TOPIC = DEFAULT_PREFIX + "/status"
+DEFAULT_COALESCE_STATE_WRITES = False
 DEFAULT_DISCOVERY = True
 DEFAULT_EFFECT = False
 DEFAULT_ENCODING = "utf-8"
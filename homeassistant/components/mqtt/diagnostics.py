@@ -18,6 +18,7 @@ from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.device_registry import DeviceEntry
 
 from . import debug_info, is_connected
+from .models import DATA_MQTT
 
 REDACT_CONFIG = {CONF_PASSWORD, CONF_USERNAME}
 REDACT_STATE_DEVICE_TRACKER = {ATTR_LATITUDE, ATTR_LONGITUDE}
@@ -67,6 +68,7 @@ def _async_get_diagnostics(
                 )
             ],
             mqtt_debug_info=debug_info.info_for_config_entry(hass),
+            coalesced_state_writes=hass.data[DATA_MQTT].state_write_requests.coalesced,
         )
 
     return data
@@ -1305,6 +1305,9 @@ class MqttEntity(
     _attr_force_update = False
     _attr_has_entity_name = True
     _attr_should_poll = False
+    # Set by platforms whose state is a single latest value, so several
+    # messages read at once may be written as one state update.
+    _coalesce_state_writes = False
     _default_name: str | None
     _entity_id_format: str
 
@@ -1526,7 +1529,10 @@ class MqttEntity(
             return
 
         if attributes is not None and self._attrs_have_changed(attrs_snapshot):
-            mqtt_data.state_write_requests.write_state_request(self)
+            mqtt_data.state_write_requests.write_state_request(
+                self,
+                coalesce=self._coalesce_state_writes and not self._attr_force_update,
+            )
 
     def add_subscription(
         self,
@@ -351,17 +351,26 @@ class MqttValueTemplate:
 
 
 class EntityTopicState:
-    """Manage entity state write requests for subscribed topics."""
+    """Manage entity state write requests for subscribed topics.
+
+    While coalescing, the requests of entities that opted in to coalescing
+    are kept until all messages read from the socket in one pass are
+    processed, so each of these entities is written at most once per pass.
+    """
 
     def __init__(self) -> None:
         """Register topic."""
         self.subscribe_calls: dict[str, Entity] = {}
+        self.immediate_calls: dict[str, Entity] = {}
+        self.coalescing = False
+        self.coalesced = 0
+        self._last_msg: MQTTMessage | None = None
 
     @callback
-    def process_write_state_requests(self, msg: MQTTMessage) -> None:
-        """Process the write state requests."""
-        while self.subscribe_calls:
-            entity_id, entity = self.subscribe_calls.popitem()
+    def _write_states(self, calls: dict[str, Entity], msg: MQTTMessage) -> None:
+        """Write the states of the entities with a request."""
+        while calls:
+            entity_id, entity = calls.popitem()
             try:
                 entity.async_write_ha_state()
             except Exception:
@@ -374,9 +383,41 @@ class EntityTopicState:
                 )
 
     @callback
-    def write_state_request(self, entity: Entity) -> None:
-        """Register write state request."""
-        self.subscribe_calls[entity.entity_id] = entity
+    def process_write_state_requests(self, msg: MQTTMessage) -> None:
+        """Process the write state requests."""
+        self._write_states(self.immediate_calls, msg)
+        if self.coalescing:
+            self._last_msg = msg
+        else:
+            self._write_states(self.subscribe_calls, msg)
+
+    @callback
+    def async_start_coalescing(self) -> None:
+        """Start keeping write state requests until coalescing stops."""
+        self.coalescing = True
+
+    @callback
+    def async_stop_coalescing(self) -> None:
+        """Stop coalescing and process the kept write state requests."""
+        self.coalescing = False
+        if (msg := self._last_msg) is not None:
+            self._last_msg = None
+            self._write_states(self.subscribe_calls, msg)
+
+    @callback
+    def write_state_request(self, entity: Entity, coalesce: bool = False) -> None:
+        """Register write state request.
+
+        Only entities that report a single latest value, such as sensors,
+        set coalesce, all other entities write their state for every message.
+        """
+        entity_id = entity.entity_id
+        if not coalesce:
+            self.immediate_calls[entity_id] = entity
+            return
+        if self.coalescing and entity_id in self.subscribe_calls:
+            self.coalesced += 1
+        self.subscribe_calls[entity_id] = entity
 
 
 @dataclass
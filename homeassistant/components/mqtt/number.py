@@ -129,6 +129,7 @@ class MqttNumber(MqttEntity, RestoreNumber):
     _default_name = DEFAULT_NAME
     _entity_id_format = number.ENTITY_ID_FORMAT
     _attributes_extra_blocked = MQTT_NUMBER_ATTRIBUTES_BLOCKED
+    _coalesce_state_writes = True
 
     _optimistic: bool
     _command_template: Callable[[PublishPayloadType], PublishPayloadType]
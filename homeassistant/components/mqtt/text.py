@@ -114,6 +114,7 @@ class MqttTextEntity(MqttEntity, TextEntity):
 
     _attr_native_value: str | None = None
     _attributes_extra_blocked = MQTT_TEXT_ATTRIBUTES_BLOCKED
+    _coalesce_state_writes = True
     _default_name = DEFAULT_NAME
     _entity_id_format = text.ENTITY_ID_FORMAT
 
@@ -0,0 +1,100 @@
+"""Match MQTT topics against wildcard topic filters."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+
+
+class _TopicTrieNode[_T: Hashable]:
+    """Node of a topic trie for one level of a topic filter."""
+
+    __slots__ = ("children", "items")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode[_T]] = {}
+        # Items that subscribed with a topic filter ending at this node,
+        # mapped to the order they were added in.
+        self.items: dict[_T, int] = {}
+
+
+class TopicTrie[_T: Hashable]:
+    """Trie of topic filters split on their levels.
+
+    Matching a topic only visits the levels of the topic and the `+` and `#`
+    levels of the filters, instead of testing every filter. Items are
+    returned in the order they were added.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _TopicTrieNode[_T] = _TopicTrieNode()
+        self._counter = 0
+
+    def add(self, topic_filter: str, item: _T) -> None:
+        """Add an item for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        self._counter += 1
+        node.items[item] = self._counter
+
+    def remove(self, topic_filter: str, item: _T) -> None:
+        """Remove an item for a topic filter.
+
+        Raises KeyError if the item was not added for the topic filter.
+        """
+        path: list[tuple[_TopicTrieNode[_T], str]] = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        del node.items[item]
+        # Prune the nodes that no longer lead to any item
+        for parent, level in reversed(path):
+            if node.items or node.children:
+                break
+            del parent.children[level]
+            node = parent
+
+    def has_topic_filter(self, topic_filter: str) -> bool:
+        """Return if any item was added for exactly this topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.items)
+
+    def matches(self, topic: str) -> list[_T]:
+        """Return the items with a topic filter matching the topic."""
+        levels = topic.split("/")
+        last = len(levels)
+        # Wildcards at the first level do not match topics starting
+        # with $, such as $SYS topics.
+        wildcard_first_level = not topic.startswith("$")
+        matched: list[dict[_T, int]] = []
+        stack: list[tuple[_TopicTrieNode[_T], int]] = [(self._root, 0)]
+        while stack:
+            node, index = stack.pop()
+            children = node.children
+            wildcards = index > 0 or wildcard_first_level
+            if wildcards and (multi := children.get("#")) and multi.items:
+                # `#` also matches the parent level, so a/# matches a
+                matched.append(multi.items)
+            if index == last:
+                if node.items:
+                    matched.append(node.items)
+                continue
+            if child := children.get(levels[index]):
+                stack.append((child, index + 1))
+            if wildcards and (single := children.get("+")):
+                stack.append((single, index + 1))
+        if not matched:
+            return []
+        if len(matched) == 1:
+            return list(matched[0])
+        order = {item: added for items in matched for item, added in items.items()}
+        return sorted(order, key=order.__getitem__)
@@ -25,6 +25,8 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.template import Template
+from homeassistant.loader import async_get_import_timings
 
 from .const import DOMAIN
 
@@ -40,6 +42,8 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_LOG_TEMPLATE_RENDER_STATS = "log_template_render_stats"
+SERVICE_LOG_IMPORT_TIMES = "log_import_times"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,15 +67,23 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_LOG_TEMPLATE_RENDER_STATS,
+    SERVICE_LOG_IMPORT_TIMES,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 DEFAULT_MAX_OBJECTS = 5
 
+DEFAULT_MAX_TEMPLATES = 25
+
+DEFAULT_MAX_MODULES = 25
+
 CONF_ENABLED = "enabled"
 CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
+CONF_MAX_TEMPLATES = "max_templates"
+CONF_MAX_MODULES = "max_modules"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
 
@@ -231,6 +243,72 @@ async def async_setup_entry(  # noqa: C901
             notification_id="profile_lru_stats",
         )
 
+    def _log_template_render_stats(call: ServiceCall) -> None:
+        """Log the templates that took the most time to render."""
+        # Imports deferred to avoid loading modules
+        # in memory since usually only one part of this
+        # integration is used at a time
+        import objgraph  # noqa: PLC0415
+
+        # Identical templates used by multiple entities are
+        # grouped together since they render the same source
+        stats: dict[str, list[Any]] = {}
+        for template in objgraph.by_type(Template.__name__):
+            if not isinstance(template, Template) or not template._renders:  # noqa: SLF001
+                continue
+            template_stats = stats.setdefault(template.template, [0, 0, 0.0])
+            template_stats[0] += 1
+            template_stats[1] += template._renders  # noqa: SLF001
+            template_stats[2] += template._render_time  # noqa: SLF001
+
+        for source, (instances, renders, render_time) in sorted(
+            stats.items(), key=lambda item: item[1][2], reverse=True
+        )[: call.data[CONF_MAX_TEMPLATES]]:
+            _LOGGER.critical(
+                "Template rendered %s times by %s instances in %.6fs "
+                "(%.6fs per render): %s",
+                renders,
+                instances,
+                render_time,
+                render_time / renders,
+                source,
+            )
+
+        persistent_notification.create(
+            hass,
+            (
+                "Template render stats have been dumped to the log. See [the"
+                " logs](/config/logs) to review the stats."
+            ),
+            title="Template render stats completed",
+            notification_id="profile_template_render_stats",
+        )
+
+    @callback
+    def _async_log_import_times(call: ServiceCall) -> None:
+        """Log the integration modules that took the most time to import."""
+        import_times = async_get_import_timings(hass)
+        for module, import_time in sorted(
+            import_times.items(), key=lambda item: item[1], reverse=True
+        )[: call.data[CONF_MAX_MODULES]]:
+            _LOGGER.critical("Module %s imported in %.6fs", module, import_time)
+
+        _LOGGER.critical(
+            "Imported %s integration modules in %.6fs",
+            len(import_times),
+            sum(import_times.values()),
+        )
+
+        persistent_notification.async_create(
+            hass,
+            (
+                "Import times have been dumped to the log. See [the"
+                " logs](/config/logs) to review the times."
+            ),
+            title="Import times completed",
+            notification_id="profile_import_times",
+        )
+
     async def _async_dump_thread_frames(call: ServiceCall) -> None:
         """Log all thread frames."""
         frames = sys._current_frames()  # noqa: SLF001
@@ -382,6 +460,34 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_TEMPLATE_RENDER_STATS,
+        _log_template_render_stats,
+        schema=vol.Schema(
+            {
+                vol.Optional(
+                    CONF_MAX_TEMPLATES, default=DEFAULT_MAX_TEMPLATES
+                ): vol.Range(min=1, max=1024),
+            }
+        ),
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_IMPORT_TIMES,
+        _async_log_import_times,
+        schema=vol.Schema(
+            {
+                vol.Optional(CONF_MAX_MODULES, default=DEFAULT_MAX_MODULES): vol.Range(
+                    min=1, max=1024
+                ),
+            }
+        ),
+    )
+
     return True
 
 
@@ -62,6 +62,7 @@ DEFAULT_COMMIT_INTERVAL = 5
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
 CONF_DB_URL = "db_url"
+CONF_DB_READ_URL = "db_read_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
@@ -94,6 +95,15 @@ def validate_db_url(db_url: str) -> Any:
     return db_url
 
 
+def validate_db_read_url(db_url: str) -> Any:
+    """Validate read replica database URL."""
+    # SQLite reads already run on their own connections
+    if db_url.startswith(SQLITE_URL_PREFIX):
+        raise vol.Invalid("A read replica is not supported for SQLite")
+
+    return db_url
+
+
 CONFIG_SCHEMA = vol.Schema(
     {
         vol.Optional(DOMAIN, default=dict): vol.All(
@@ -108,6 +118,9 @@ CONFIG_SCHEMA = vol.Schema(
                     ),
                     vol.Optional(CONF_PURGE_INTERVAL, default=1): cv.positive_int,
                     vol.Optional(CONF_DB_URL): vol.All(cv.string, validate_db_url),
+                    vol.Optional(CONF_DB_READ_URL): vol.All(
+                        cv.string, validate_db_read_url
+                    ),
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
@@ -168,6 +181,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        read_uri=conf.get(CONF_DB_READ_URL),
     )
     get_instance.cache_clear()
     entity_registry.async_setup(hass)
@@ -41,6 +41,7 @@ MAX_IDS_FOR_INDEXED_GROUP_BY = 999
 DEFAULT_MAX_BIND_VARS = 4000
 
 DB_WORKER_PREFIX = "DbWorker"
+DB_READ_WORKER_PREFIX = "DbReadWorker"
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
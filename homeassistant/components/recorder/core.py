@@ -16,7 +16,14 @@ from typing import TYPE_CHECKING, Any, cast
 
 from propcache.api import cached_property
 import psutil_home_assistant as ha_psutil
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select, update
+from sqlalchemy import (
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
@@ -52,6 +59,7 @@ from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
 from .const import (
+    DB_READ_WORKER_PREFIX,
     DB_WORKER_PREFIX,
     DEFAULT_MAX_BIND_VARS,
     DOMAIN,
@@ -86,7 +94,7 @@ from .models import (
     StatisticMetaData,
     UnsupportedDialect,
 )
-from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .pool import POOL_SIZE, READ_POOL_SIZE, MutexPool, RecorderPool
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -150,6 +158,28 @@ CONNECTIVITY_ERR = "Error in database connectivity during commit"
 
 # Pool size must accommodate Recorder thread + All db executors
 MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1
+MAX_DB_READ_EXECUTOR_WORKERS = READ_POOL_SIZE
+
+# Columns of States that are set from a relationship
+# when the related row was pending in the same commit.
+_STATES_RELATIONSHIP_COLUMNS = (
+    ("metadata_id", "states_meta_rel", "metadata_id"),
+    ("attributes_id", "state_attributes", "attributes_id"),
+    ("old_state_id", "old_state", "state_id"),
+)
+
+
+def _state_row(dbstate: States, keys: Iterable[str]) -> dict[str, Any]:
+    """Return the row to insert for a pending state."""
+    row = {key: getattr(dbstate, key) for key in keys}
+    for key, relationship, related_key in _STATES_RELATIONSHIP_COLUMNS:
+        if (
+            key in row
+            and row[key] is None
+            and (related := getattr(dbstate, relationship)) is not None
+        ):
+            row[key] = getattr(related, related_key)
+    return row
 
 
 class Recorder(threading.Thread):
@@ -169,6 +199,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        read_uri: str | None = None,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -184,6 +215,7 @@ class Recorder(threading.Thread):
         self.commit_interval = commit_interval
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
         self.db_url = uri
+        self.db_read_url = read_uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
         self.database_engine: DatabaseEngine | None = None
@@ -196,6 +228,8 @@ class Recorder(threading.Thread):
         self.async_recorder_ready = asyncio.Event()
         self._queue_watch = threading.Event()
         self.engine: Engine | None = None
+        # Engine for the read replica, if one is configured
+        self.read_engine: Engine | None = None
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
         self._psutil: ha_psutil.PsutilWrapper | None = None
 
@@ -208,6 +242,9 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # States are not added to the event session, they are
+        # inserted in bulk when the event session is committed
+        self._pending_states: list[States] = []
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -219,12 +256,15 @@ class Recorder(threading.Thread):
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
+        self._get_read_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._db_read_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._read_worker_thread_ids: set[int] = set()
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -267,6 +307,19 @@ class Recorder(threading.Thread):
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
 
+    def get_read_session(self) -> Session:
+        """Get a new sqlalchemy session for read only queries.
+
+        Sessions created on the read workers use the read replica when
+        one is configured.
+        """
+        if (
+            self._get_read_session is not None
+            and threading.get_ident() in self._read_worker_thread_ids
+        ):
+            return self._get_read_session()
+        return self.get_session()
+
     def queue_task(self, task: RecorderTask | Event) -> None:
         """Add a task to the recorder queue."""
         self._queue.put(task)
@@ -284,6 +337,17 @@ class Recorder(threading.Thread):
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        self._db_read_executor = DBInterruptibleThreadPoolExecutor(
+            self.recorder_and_worker_thread_ids,
+            thread_name_prefix=DB_READ_WORKER_PREFIX,
+            max_workers=MAX_DB_READ_EXECUTOR_WORKERS,
+            initializer=self._init_read_worker,
+            shutdown_hook=self._shutdown_pool,
+        )
+
+    def _init_read_worker(self) -> None:
+        """Track the read worker threads."""
+        self._read_worker_thread_ids.add(threading.get_ident())
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
@@ -358,6 +422,18 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    @callback
+    def async_add_read_executor_job[_T](
+        self, target: Callable[..., _T], *args: Any
+    ) -> asyncio.Future[_T]:
+        """Add a read only executor job for an interactive query.
+
+        The read workers have their own connections so interactive
+        queries, like the ones for the frontend, do not queue behind
+        jobs on the db executor.
+        """
+        return self.hass.loop.run_in_executor(self._db_read_executor, target, *args)
+
     @callback
     def _async_check_queue(self, *_: Any) -> None:
         """Periodic check of the queue size to ensure we do not exhaust memory.
@@ -1093,6 +1169,7 @@ class Recorder(threading.Thread):
             event_data_manager.add_pending(dbevent_data)
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
+        event_data_manager.mark_used(shared_data, event.time_fired_timestamp)
 
         self._add_to_session(session, dbevent)
 
@@ -1175,8 +1252,10 @@ class Recorder(threading.Thread):
             state_attributes_manager.add_pending(dbstate_attributes)
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
+        state_attributes_manager.mark_used(shared_attrs, dbstate.last_updated_ts or 0)
 
-        self._add_to_session(session, dbstate)
+        self._event_session_has_pending_writes = True
+        self._pending_states.append(dbstate)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1224,6 +1303,12 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self._pending_states:
+            # The rows the pending states link to must have their ids
+            # allocated before the states can be inserted.
+            session.flush()
+            self._insert_pending_states(session)
+
         if (
             pending_last_reported
             := self.states_manager.get_pending_last_reported_timestamp()
@@ -1242,6 +1327,7 @@ class Recorder(threading.Thread):
         session.commit()
 
         self._event_session_has_pending_writes = False
+        self._pending_states.clear()
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1259,6 +1345,46 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             session.expire_all()
 
+    def _insert_pending_states(self, session: Session) -> None:
+        """Insert the pending states with as few statements as possible.
+
+        The states are inserted with executemany instead of going through
+        the unit of work. A new batch is only started when a state links to
+        an old state in the current batch since the state_id of the old state
+        has to be known first.
+        """
+        batch: list[States] = []
+        batch_ids: set[int] = set()
+        for dbstate in self._pending_states:
+            if (old_state := dbstate.old_state) and id(old_state) in batch_ids:
+                self._insert_states(session, batch)
+                batch = []
+                batch_ids = set()
+            batch.append(dbstate)
+            batch_ids.add(id(dbstate))
+        self._insert_states(session, batch)
+
+    def _insert_states(self, session: Session, dbstates: list[States]) -> None:
+        """Insert states and set the state_id on each of them."""
+        table = States.__table__
+        keys = [column.key for column in table.columns if column.key != "state_id"]
+        rows = [_state_row(dbstate, keys) for dbstate in dbstates]
+        if self.engine and (
+            self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        ):
+            state_ids = session.scalars(
+                insert(table).returning(table.c.state_id, sort_by_parameter_order=True),
+                rows,
+            ).all()
+        else:
+            # MySQL does not support RETURNING
+            state_ids = [
+                session.execute(insert(table), row).inserted_primary_key[0]
+                for row in rows
+            ]
+        for dbstate, state_id in zip(dbstates, state_ids, strict=True):
+            dbstate.state_id = state_id
+
     def _handle_sqlite_corruption(self, setup_run: bool) -> None:
         """Handle the sqlite3 database being corrupt."""
         try:
@@ -1274,6 +1400,7 @@ class Recorder(threading.Thread):
     def _close_event_session(self) -> None:
         """Close the event session."""
         self.states_manager.reset()
+        self._pending_states.clear()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
         self.event_type_manager.reset()
@@ -1450,12 +1577,64 @@ class Recorder(threading.Thread):
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
 
+        if self.db_read_url:
+            self._setup_read_connection(self.db_read_url)
+
+    def _setup_read_connection(self, db_read_url: str) -> None:
+        """Connect to the read replica.
+
+        The schema is managed through the primary database, so the
+        replica is only used once the primary is set up.
+        """
+        connect_args: dict[str, Any] = {}
+        if db_read_url.startswith(
+            (
+                MARIADB_URL_PREFIX,
+                MARIADB_PYMYSQL_URL_PREFIX,
+                MYSQLDB_URL_PREFIX,
+                MYSQLDB_PYMYSQL_URL_PREFIX,
+            )
+        ):
+            connect_args["charset"] = "utf8mb4"
+            if db_read_url.startswith((MARIADB_URL_PREFIX, MYSQLDB_URL_PREFIX)):
+                with contextlib.suppress(ImportError):
+                    connect_args["conv"] = build_mysqldb_conv()
+
+        assert not self.read_engine
+        self.read_engine = create_engine(
+            db_read_url,
+            connect_args=connect_args,
+            pool_size=READ_POOL_SIZE,
+            echo=False,
+            future=True,
+        )
+        sqlalchemy_event.listen(
+            self.read_engine, "connect", self._setup_read_recorder_connection
+        )
+        self._get_read_session = scoped_session(
+            sessionmaker(bind=self.read_engine, future=True)
+        )
+        _LOGGER.debug("Connected to recorder read replica")
+
+    def _setup_read_recorder_connection(
+        self, dbapi_connection: DBAPIConnection, connection_record: Any
+    ) -> None:
+        """Dbapi specific connection settings for the read replica."""
+        assert self.read_engine is not None
+        setup_connection_for_dialect(
+            self, self.read_engine.dialect.name, dbapi_connection, False
+        )
+
     def _close_connection(self) -> None:
         """Close the connection."""
         if self.engine:
             self.engine.dispose()
             self.engine = None
         self._get_session = None
+        if self.read_engine:
+            self.read_engine.dispose()
+            self.read_engine = None
+        self._get_read_session = None
 
     def _setup_run(self) -> None:
         """Log the start of the current run and schedule any needed jobs."""
@@ -1502,13 +1681,18 @@ class Recorder(threading.Thread):
         try:
             self._end_session()
         finally:
-            if self._db_executor:
+            executors = [
+                executor
+                for executor in (self._db_executor, self._db_read_executor)
+                if executor
+            ]
+            for executor in executors:
                 # We shutdown the executor without forcefully
                 # joining the threads until after we have tried
                 # to cleanly close the connection.
-                self._db_executor.shutdown(join_threads_or_timeout=False)
+                executor.shutdown(join_threads_or_timeout=False)
             self._close_connection()
-            if self._db_executor:
+            for executor in executors:
                 # After the connection is closed, we can join the threads
                 # or forcefully shutdown the threads if they take too long.
-                self._db_executor.join_threads_or_timeout()
+                executor.join_threads_or_timeout()
@@ -12,7 +12,7 @@ from sqlalchemy.orm.session import Session
 
 from homeassistant.util.collection import chunked_or_all
 
-from .db_schema import Events, States, StatesMeta
+from .db_schema import Events, States, StatesMeta, StatisticsShortTerm
 from .models import DatabaseEngine
 from .queries import (
     attributes_ids_exist_in_states,
@@ -41,6 +41,7 @@ from .queries import (
     find_statistics_runs_to_purge,
 )
 from .repack import repack_database
+from .statistics import get_statistics_during_period_cache
 from .util import retryable_database_job, session_scope
 
 if TYPE_CHECKING:
@@ -103,6 +104,10 @@ def purge_old_data(
 
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
+            session.commit()
+            get_statistics_during_period_cache(instance.hass).invalidate(
+                table=StatisticsShortTerm
+            )
 
         if has_more_to_purge or statistics_runs or short_term_statistics:
             # Return false, as we might not be done yet.
@@ -187,11 +192,6 @@ def _purge_states_and_attributes_ids(
     database_engine = instance.database_engine
     assert database_engine is not None
     has_remaining_state_ids_to_purge = True
-    # There are more states relative to attributes_ids so
-    # we purge enough state_ids to try to generate a full
-    # size batch of attributes_ids that will be around the size
-    # max_bind_vars
-    attributes_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
     for _ in range(states_batch_size):
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
@@ -201,9 +201,18 @@ def _purge_states_and_attributes_ids(
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
-        attributes_ids_batch = attributes_ids_batch | attributes_ids
+        # Attributes used by states which are not purged are still in use
+        attributes_ids -= instance.state_attributes_manager.ids_used_since(
+            attributes_ids, purge_before.timestamp()
+        )
+        # The attributes which are no longer used are purged in the same
+        # transaction as the states, so a failure in a later batch can not
+        # leave them behind without any states linking to them
+        _purge_unused_attributes_ids(instance, session, attributes_ids)
+        # Commit each batch to keep the transactions, and the locks and
+        # write ahead log they hold, small on large databases
+        session.commit()
 
-    _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
         has_remaining_state_ids_to_purge,
@@ -222,11 +231,6 @@ def _purge_events_and_data_ids(
     Returns true if there are more states to purge.
     """
     has_remaining_event_ids_to_purge = True
-    # There are more events relative to data_ids so
-    # we purge enough event_ids to try to generate a full
-    # size batch of data_ids that will be around the size
-    # max_bind_vars
-    data_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
     for _ in range(events_batch_size):
         event_ids, data_ids = _select_event_data_ids_to_purge(
@@ -236,9 +240,15 @@ def _purge_events_and_data_ids(
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
-        data_ids_batch = data_ids_batch | data_ids
+        # Event data used by events which are not purged is still in use
+        data_ids -= instance.event_data_manager.ids_used_since(
+            data_ids, purge_before.timestamp()
+        )
+        # Purge the unused event data and commit each batch,
+        # see _purge_states_and_attributes_ids
+        _purge_unused_data_ids(instance, session, data_ids)
+        session.commit()
 
-    _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
         "After purging event and data_ids remaining=%s",
         has_remaining_event_ids_to_purge,
@@ -649,6 +659,8 @@ def _purge_filtered_states(
         "Selected %s state_ids to remove that should be filtered", len(state_ids)
     )
     _purge_state_ids(instance, session, set(state_ids))
+    # States newer than the purge cutoff may have been removed
+    instance.state_attributes_manager.clear_used()
     # These are legacy events that are linked to a state that are no longer
     # created but since we did not remove them when we stopped adding new ones
     # we will need to purge them here.
@@ -702,7 +714,10 @@ def _purge_filtered_events(
         # created but since we did not remove them when we stopped adding new ones
         # we will need to purge them here.
         _purge_state_ids(instance, session, state_ids)
+        instance.state_attributes_manager.clear_used()
     _purge_event_ids(session, event_ids_set)
+    # Events newer than the purge cutoff may have been removed
+    instance.event_data_manager.clear_used()
     if unused_data_ids_set := _select_unused_event_data_ids(
         instance, session, set(data_ids), database_engine
     ):
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Hashable, Iterable, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
@@ -12,16 +12,20 @@ import logging
 import math
 from operator import itemgetter
 import re
+import threading
 from time import time as time_time
 from typing import TYPE_CHECKING, Any, Literal, Required, TypedDict, cast
 
+from lru import LRU
 from sqlalchemy import (
     Label,
     Select,
+    Table,
     and_,
     bindparam,
     case,
     func,
+    insert,
     lambda_stmt,
     select,
     text,
@@ -40,7 +44,6 @@ from homeassistant.helpers.singleton import singleton
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 from homeassistant.util import dt as dt_util
 from homeassistant.util.collection import chunked_or_all
-from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.unit_conversion import (
     AreaConverter,
     BaseUnitConverter,
@@ -228,6 +231,10 @@ UNIT_CLASSES = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_STATISTICS_DURING_PERIOD_CACHE = "recorder_statistics_during_period_cache"
+
+# The number of statistics_during_period results to cache in memory
+STATISTICS_DURING_PERIOD_CACHE_SIZE = 32
 
 
 def mean(values: list[float]) -> float | None:
@@ -291,6 +298,87 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+@dataclasses.dataclass(slots=True)
+class _StatisticsDuringPeriodEntry:
+    """A cached statistics_during_period result."""
+
+    statistic_ids: frozenset[str]
+    table: type[StatisticsBase]
+    # The end of the period aligned to the requested period, or None if open ended
+    end_ts: float | None
+    result: dict[str, list[StatisticsRow]]
+
+
+class StatisticsDuringPeriodCache:
+    """Cache for statistics_during_period results.
+
+    Results are evicted when statistics of their statistic_ids are written
+    before the end of the cached period. The cache is read from the
+    executor and invalidated from the recorder thread.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._entries: LRU[Hashable, _StatisticsDuringPeriodEntry] = LRU(
+            STATISTICS_DURING_PERIOD_CACHE_SIZE
+        )
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def generation(self) -> int:
+        """Return the number of invalidations so far."""
+        return self._generation
+
+    def get(self, key: Hashable) -> dict[str, list[StatisticsRow]] | None:
+        """Return a cached result."""
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry.result
+
+    def set(
+        self, key: Hashable, generation: int, entry: _StatisticsDuringPeriodEntry
+    ) -> None:
+        """Cache a result read when the cache was at generation."""
+        with self._lock:
+            # The result may be outdated if there was an invalidation
+            # while it was read
+            if generation == self._generation:
+                self._entries[key] = entry
+
+    def invalidate(
+        self,
+        statistic_ids: Iterable[str] | None = None,
+        start: datetime | None = None,
+        table: type[StatisticsBase] | None = None,
+    ) -> None:
+        """Evict results which statistics written from start may change.
+
+        Call after the statistics are committed. If statistic_ids, start or
+        table is None, the results for all of them are evicted.
+        """
+        ids = None if statistic_ids is None else set(statistic_ids)
+        start_ts = None if start is None else start.timestamp()
+        with self._lock:
+            self._generation += 1
+            for key, entry in self._entries.items():
+                if (
+                    (table is None or entry.table is table)
+                    and (ids is None or not ids.isdisjoint(entry.statistic_ids))
+                    and (
+                        start_ts is None
+                        or entry.end_ts is None
+                        or start_ts < entry.end_ts
+                    )
+                ):
+                    del self._entries[key]
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -509,10 +597,7 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
     if stats:
         for stat in stats:
             metadata_id, _min, _max, _mean, _mean_weight, _mean_type = stat
-            if (
-                try_parse_enum(StatisticMeanType, _mean_type)
-                is StatisticMeanType.CIRCULAR
-            ):
+            if _mean_type == StatisticMeanType.CIRCULAR:
                 # Normalize the circular mean to be in the range [0, 360)
                 _mean = _mean % 360
             summary[metadata_id] = {
@@ -546,14 +631,94 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
                     "sum": _sum,
                 }
 
-    # Insert compiled hourly statistics in the database
+    if not summary:
+        return
+
+    # Insert compiled hourly statistics in the database with a single
+    # executemany instead of adding one ORM object per statistic to the
+    # session, since the rows are never read back in this session.
     now_timestamp = time_time()
-    session.add_all(
-        Statistics.from_stats_ts(metadata_id, summary_item, now_timestamp)
-        for metadata_id, summary_item in summary.items()
+    session.execute(
+        insert(Statistics),
+        [
+            _statistics_row_from_stats_ts(metadata_id, summary_item, now_timestamp)
+            for metadata_id, summary_item in summary.items()
+        ],
     )
 
 
+def _insert_statistics_rows(
+    instance: Recorder,
+    session: Session,
+    table: type[StatisticsBase],
+    rows: list[dict[str, Any]],
+) -> list[int]:
+    """Insert statistics rows and return their ids in the order of the rows."""
+    if not rows:
+        return []
+    # We need to cast __table__ to Table, explanation in
+    # https://github.com/sqlalchemy/sqlalchemy/issues/9130
+    statistics_table = cast(Table, table.__table__)  # type: ignore[attr-defined]
+    if instance.engine and (
+        instance.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+    ):
+        return list(
+            session.scalars(
+                insert(statistics_table).returning(
+                    statistics_table.c.id, sort_by_parameter_order=True
+                ),
+                rows,
+            )
+        )
+    # MySQL does not support RETURNING
+    return [
+        session.execute(insert(statistics_table), row).inserted_primary_key[0]
+        for row in rows
+    ]
+
+
+def _statistics_row_from_stats(
+    metadata_id: int, stats: StatisticData, now_timestamp: float
+) -> dict[str, Any]:
+    """Return the column values for a statistics row from a statistic.
+
+    All rows have the same keys so they can be inserted in a single batch.
+    """
+    return {
+        "metadata_id": metadata_id,
+        "created_ts": now_timestamp,
+        "start_ts": stats["start"].timestamp(),
+        "mean": stats.get("mean"),
+        "mean_weight": stats.get("mean_weight"),
+        "min": stats.get("min"),
+        "max": stats.get("max"),
+        "last_reset_ts": datetime_to_timestamp_or_none(stats.get("last_reset")),
+        "state": stats.get("state"),
+        "sum": stats.get("sum"),
+    }
+
+
+def _statistics_row_from_stats_ts(
+    metadata_id: int, stats: StatisticDataTimestamp, now_timestamp: float
+) -> dict[str, Any]:
+    """Return the column values for a statistics row from a statistic.
+
+    All rows have the same keys so they can be inserted in a single batch.
+    """
+    return {
+        "metadata_id": metadata_id,
+        "created_ts": now_timestamp,
+        "start_ts": stats["start_ts"],
+        "mean": stats.get("mean"),
+        "mean_weight": stats.get("mean_weight"),
+        "min": stats.get("min"),
+        "max": stats.get("max"),
+        "last_reset_ts": stats.get("last_reset_ts"),
+        "state": stats.get("state"),
+        "sum": stats.get("sum"),
+    }
+
+
 @retryable_database_job("compile missing statistics")
 def compile_missing_statistics(instance: Recorder) -> bool:
     """Compile missing statistics."""
@@ -592,6 +757,7 @@ def compile_missing_statistics(instance: Recorder) -> bool:
                 periods_without_commit = 0
             start = end
 
+    get_statistics_during_period_cache(instance.hass).invalidate()
     return True
 
 
@@ -618,6 +784,14 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
             instance, session, start, fire_events
         )
 
+    cache = get_statistics_during_period_cache(instance.hass)
+    cache.invalidate(start=start, table=StatisticsShortTerm)
+    if start.minute == 55:
+        cache.invalidate(start=start.replace(minute=0), table=Statistics)
+    if modified_statistic_ids:
+        # The unit of the statistics may have changed
+        cache.invalidate(modified_statistic_ids)
+
     if modified_statistic_ids:
         # In the rare case that we have modified statistic_ids, we reload the modified
         # statistics meta data into the cache in a fresh session to ensure that the
@@ -680,21 +854,23 @@ def _compile_statistics(
         platform_stats.extend(compiled.platform_stats)
         current_metadata.update(compiled.current_metadata)
 
-    new_short_term_stats: list[StatisticsBase] = []
-    updated_metadata_ids: set[int] = set()
+    new_short_term_rows: list[dict[str, Any]] = []
     now_timestamp = time_time()
-    # Insert collected statistics in the database
     for stats in platform_stats:
         modified_statistic_id, metadata_id = statistics_meta_manager.update_or_add(
             session, stats["meta"], current_metadata
         )
         if modified_statistic_id is not None:
             modified_statistic_ids.add(modified_statistic_id)
-        updated_metadata_ids.add(metadata_id)
-        if new_stat := _insert_statistics(
-            session, StatisticsShortTerm, metadata_id, stats["stat"], now_timestamp
-        ):
-            new_short_term_stats.append(new_stat)
+        new_short_term_rows.append(
+            _statistics_row_from_stats(metadata_id, stats["stat"], now_timestamp)
+        )
+
+    # Insert collected statistics in the database with a single executemany
+    # before the hourly statistics are compiled from them
+    new_short_term_ids = _insert_statistics_rows(
+        instance, session, StatisticsShortTerm, new_short_term_rows
+    )
 
     if start.minute == 50:
         # Once every hour, update issues
@@ -718,21 +894,17 @@ def _compile_statistics(
         if start.minute == 55:
             instance.hass.bus.fire(EVENT_RECORDER_HOURLY_STATISTICS_GENERATED)
 
-    if updated_metadata_ids:
+    if new_short_term_rows:
         # These are always the newest statistics, so we can update
         # the run cache without having to check the start_ts.
-        session.flush()  # populate the ids of the new StatisticsShortTerm rows
         run_cache = get_short_term_statistics_run_cache(instance.hass)
-        # metadata_id is typed to allow None, but we know it's not None here
-        # so we can safely cast it to int.
         run_cache.set_latest_ids_for_metadata_ids(
-            cast(
-                dict[int, int],
-                {
-                    new_stat.metadata_id: new_stat.id
-                    for new_stat in new_short_term_stats
-                },
-            )
+            {
+                row["metadata_id"]: new_id
+                for row, new_id in zip(
+                    new_short_term_rows, new_short_term_ids, strict=True
+                )
+            }
         )
 
     return modified_statistic_ids
@@ -857,6 +1029,7 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+    get_statistics_during_period_cache(instance.hass).invalidate(statistic_ids)
 
 
 def update_statistics_metadata(
@@ -882,6 +1055,11 @@ def update_statistics_metadata(
             statistics_meta_manager.update_statistic_id(
                 session, DOMAIN, statistic_id, new_statistic_id
             )
+    get_statistics_during_period_cache(instance.hass).invalidate(
+        {statistic_id, new_statistic_id}
+        if isinstance(new_statistic_id, str)
+        else {statistic_id}
+    )
 
 
 async def async_list_statistic_ids(
@@ -906,7 +1084,7 @@ async def async_list_statistic_ids(
             result = _statistic_by_id_from_metadata(hass, metadata)
             return _flatten_list_statistic_ids_metadata_result(result)
 
-    return await instance.async_add_executor_job(
+    return await instance.async_add_read_executor_job(
         list_statistic_ids,
         hass,
         statistic_ids,
@@ -1852,6 +2030,44 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _align_with_period(
+    start_time: datetime,
+    end_time: datetime | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+) -> tuple[datetime, datetime | None]:
+    """Align start_time and end_time with the period."""
+    if period == "day":
+        start_time = dt_util.as_local(start_time).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        start_time = start_time.replace()
+        if end_time is not None:
+            end_local = dt_util.as_local(end_time)
+            end_time = end_local.replace(
+                hour=0, minute=0, second=0, microsecond=0
+            ) + timedelta(days=1)
+    elif period == "week":
+        start_local = dt_util.as_local(start_time)
+        start_time = start_local.replace(
+            hour=0, minute=0, second=0, microsecond=0
+        ) - timedelta(days=start_local.weekday())
+        if end_time is not None:
+            end_local = dt_util.as_local(end_time)
+            end_time = (
+                end_local.replace(hour=0, minute=0, second=0, microsecond=0)
+                - timedelta(days=end_local.weekday())
+                + timedelta(days=7)
+            )
+    elif period == "month":
+        start_time = dt_util.as_local(start_time).replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        if end_time is not None:
+            end_time = _find_month_end_time(dt_util.as_local(end_time))
+
+    return start_time, end_time
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1889,35 +2105,7 @@ def _statistics_during_period_with_session(
     if statistic_ids is not None:
         metadata_ids = _extract_metadata_and_discard_impossible_columns(metadata, types)
 
-    # Align start_time and end_time with the period
-    if period == "day":
-        start_time = dt_util.as_local(start_time).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        start_time = start_time.replace()
-        if end_time is not None:
-            end_local = dt_util.as_local(end_time)
-            end_time = end_local.replace(
-                hour=0, minute=0, second=0, microsecond=0
-            ) + timedelta(days=1)
-    elif period == "week":
-        start_local = dt_util.as_local(start_time)
-        start_time = start_local.replace(
-            hour=0, minute=0, second=0, microsecond=0
-        ) - timedelta(days=start_local.weekday())
-        if end_time is not None:
-            end_local = dt_util.as_local(end_time)
-            end_time = (
-                end_local.replace(hour=0, minute=0, second=0, microsecond=0)
-                - timedelta(days=end_local.weekday())
-                + timedelta(days=7)
-            )
-    elif period == "month":
-        start_time = dt_util.as_local(start_time).replace(
-            day=1, hour=0, minute=0, second=0, microsecond=0
-        )
-        if end_time is not None:
-            end_time = _find_month_end_time(dt_util.as_local(end_time))
+    start_time, end_time = _align_with_period(start_time, end_time, period)
 
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
@@ -1994,6 +2182,66 @@ def statistics_during_period(
         )
 
 
+def cached_statistics_during_period(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str] | None,
+    types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Return statistic data points during UTC period start_time - end_time.
+
+    Same as statistics_during_period, but the result is cached until the
+    statistics it was read from are changed. The cache is bypassed when
+    reading from a read replica, which may lag behind the invalidations.
+    """
+    if statistic_ids is None or get_instance(hass).read_engine is not None:
+        return statistics_during_period(
+            hass, start_time, end_time, statistic_ids, period, units, types
+        )
+
+    cache = get_statistics_during_period_cache(hass)
+    key = (
+        frozenset(statistic_ids),
+        period,
+        start_time.timestamp(),
+        end_time.timestamp() if end_time else None,
+        frozenset(units.items()) if units else None,
+        frozenset(types),
+        str(dt_util.get_default_time_zone()),
+        # The display unit depends on the unit of the state
+        frozenset(
+            (statistic_id, state.attributes.get(ATTR_UNIT_OF_MEASUREMENT))
+            for statistic_id in statistic_ids
+            if (state := hass.states.get(statistic_id))
+        ),
+    )
+    if (result := cache.get(key)) is None:
+        generation = cache.generation
+        result = statistics_during_period(
+            hass, start_time, end_time, statistic_ids, period, units, types
+        )
+        _, end_time = _align_with_period(start_time, end_time, period)
+        cache.set(
+            key,
+            generation,
+            _StatisticsDuringPeriodEntry(
+                statistic_ids=frozenset(statistic_ids),
+                table=Statistics if period != "5minute" else StatisticsShortTerm,
+                end_ts=end_time.timestamp() if end_time else None,
+                result=result,
+            ),
+        )
+
+    # The rows are modified by the callers
+    return {
+        statistic_id: [row.copy() for row in rows]
+        for statistic_id, rows in result.items()
+    }
+
+
 def _get_last_statistics_stmt(
     metadata_id: int,
     number_of_stats: int,
@@ -2608,6 +2856,14 @@ def get_short_term_statistics_run_cache(
     return ShortTermStatisticsRunCache()
 
 
+@singleton(DATA_STATISTICS_DURING_PERIOD_CACHE)
+def get_statistics_during_period_cache(
+    hass: HomeAssistant,
+) -> StatisticsDuringPeriodCache:
+    """Get the statistics_during_period cache."""
+    return StatisticsDuringPeriodCache()
+
+
 def cache_latest_short_term_statistic_id_for_metadata_id(
     run_cache: ShortTermStatisticsRunCache,
     session: Session,
@@ -2667,14 +2923,20 @@ def import_statistics(
 ) -> bool:
     """Process an import_statistics job."""
 
-    with session_scope(
-        session=instance.get_session(),
-        exception_filter=filter_unique_constraint_integrity_error(
-            instance, "statistic"
-        ),
-    ) as session:
-        return _import_statistics_with_session(
-            instance, session, metadata, statistics, table
+    try:
+        with session_scope(
+            session=instance.get_session(),
+            exception_filter=filter_unique_constraint_integrity_error(
+                instance, "statistic"
+            ),
+        ) as session:
+            return _import_statistics_with_session(
+                instance, session, metadata, statistics, table
+            )
+    finally:
+        # The imported metadata applies to the statistics of both tables
+        get_statistics_during_period_cache(instance.hass).invalidate(
+            {metadata["statistic_id"]}
         )
 
 
@@ -2717,6 +2979,9 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+    get_statistics_during_period_cache(instance.hass).invalidate(
+        {statistic_id}, start_time.replace(minute=0)
+    )
     return True
 
 
@@ -2784,6 +3049,7 @@ def change_statistics_unit(
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
         )
+    get_statistics_during_period_cache(instance.hass).invalidate({statistic_id})
 
 
 @callback
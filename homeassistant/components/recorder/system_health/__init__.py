@@ -11,6 +11,7 @@ from homeassistant.core import HomeAssistant, callback
 from .. import get_instance
 from ..const import SupportedDialect
 from ..core import Recorder
+from ..statistics import get_statistics_during_period_cache
 from ..util import session_scope
 from .mysql import db_size_bytes as mysql_db_size_bytes
 from .postgresql import db_size_bytes as postgresql_db_size_bytes
@@ -72,4 +73,9 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    statistics_cache = get_statistics_during_period_cache(hass)
+    cache_stats = {
+        "statistics_cache_hits": statistics_cache.hits,
+        "statistics_cache_misses": statistics_cache.misses,
+    }
+    return db_runs | db_stats | db_engine_info | cache_stats
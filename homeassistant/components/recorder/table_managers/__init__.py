@@ -74,3 +74,81 @@ class BaseLRUTableManager[_DataT](BaseTableManager[_DataT]):
         lru = self._id_map
         if new_size > lru.get_size():
             lru.set_size(new_size)
+
+
+class BaseSharedDataTableManager[_DataT](BaseLRUTableManager[_DataT]):
+    """Base class for table managers of data shared between rows.
+
+    Besides the id mapping, we keep track of the newest timestamp of
+    the committed rows which use each id. Ids used by rows newer than
+    the purge cutoff are still in use after the purge, which saves
+    checking them against the rows table.
+    """
+
+    def __init__(self, recorder: Recorder, lru_size: int) -> None:
+        """Initialize the shared data table manager."""
+        super().__init__(recorder, lru_size)
+        self._last_used: LRU[int, float] = LRU(lru_size)
+        self._pending_used: dict[str, float] = {}
+
+    def mark_used(self, shared_data: str, timestamp: float) -> None:
+        """Mark shared data as used by a row that will be committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        pending_used = self._pending_used
+        if timestamp > pending_used.get(shared_data, 0):
+            pending_used[shared_data] = timestamp
+
+    def _post_commit_used(self) -> None:
+        """Record the timestamps of the committed rows by id."""
+        id_map = self._id_map
+        last_used = self._last_used
+        for shared_data, timestamp in self._pending_used.items():
+            # The id may no longer be cached, in which case a purge
+            # falls back to checking the rows table
+            if (data_id := id_map.get(shared_data)) is not None and (
+                timestamp > last_used.get(data_id, 0)
+            ):
+                last_used[data_id] = timestamp
+        self._pending_used.clear()
+
+    def ids_used_since(self, data_ids: set[int], timestamp: float) -> set[int]:
+        """Return the ids which are used by a committed row since timestamp.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        last_used = self._last_used
+        return {
+            data_id
+            for data_id in data_ids
+            if (used := last_used.get(data_id)) is not None and used >= timestamp
+        }
+
+    def clear_used(self) -> None:
+        """Forget when the ids were last used.
+
+        Call when rows newer than the purge cutoff may have been deleted.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._last_used.clear()
+
+    def _evict_purged_used(self, data_ids: set[int]) -> None:
+        """Forget when the purged ids were last used."""
+        last_used = self._last_used
+        for data_id in data_ids.intersection(last_used.keys()):
+            del last_used[data_id]
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._last_used.clear()
+        self._pending_used.clear()
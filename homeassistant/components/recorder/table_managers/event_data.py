@@ -15,7 +15,7 @@ from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 from ..db_schema import EventData
 from ..queries import get_shared_event_datas
 from ..util import execute_stmt_lambda_element
-from . import BaseLRUTableManager
+from . import BaseSharedDataTableManager
 
 if TYPE_CHECKING:
     from ..core import Recorder
@@ -26,7 +26,7 @@ CACHE_SIZE = 2048
 _LOGGER = logging.getLogger(__name__)
 
 
-class EventDataManager(BaseLRUTableManager[EventData]):
+class EventDataManager(BaseSharedDataTableManager[EventData]):
     """Manage the EventData table."""
 
     def __init__(self, recorder: Recorder) -> None:
@@ -124,6 +124,7 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         for shared_data, db_event_data in self._pending.items():
             self._id_map[shared_data] = db_event_data.data_id
         self._pending.clear()
+        self._post_commit_used()
 
     def evict_purged(self, data_ids: set[int]) -> None:
         """Evict purged data_ids from the cache when they are no longer used.
@@ -138,3 +139,4 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         # Evict any purged data from the cache
         for purged_data_id in data_ids.intersection(event_data_ids_reversed):
             id_map.pop(event_data_ids_reversed[purged_data_id], None)
+        self._evict_purged_used(data_ids)
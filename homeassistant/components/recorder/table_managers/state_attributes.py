@@ -15,7 +15,7 @@ from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 from ..db_schema import StateAttributes
 from ..queries import get_shared_attributes
 from ..util import execute_stmt_lambda_element
-from . import BaseLRUTableManager
+from . import BaseSharedDataTableManager
 
 if TYPE_CHECKING:
     from ..core import Recorder
@@ -31,7 +31,7 @@ CACHE_SIZE = 2048
 _LOGGER = logging.getLogger(__name__)
 
 
-class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
+class StateAttributesManager(BaseSharedDataTableManager[StateAttributes]):
     """Manage the StateAttributes table."""
 
     def __init__(self, recorder: Recorder) -> None:
@@ -135,6 +135,7 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         for shared_attrs, db_state_attributes in self._pending.items():
             self._id_map[shared_attrs] = db_state_attributes.attributes_id
         self._pending.clear()
+        self._post_commit_used()
 
     def evict_purged(self, attributes_ids: set[int]) -> None:
         """Evict purged attributes_ids from the cache when they are no longer used.
@@ -152,3 +153,4 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
             state_attributes_ids_reversed
         ):
             id_map.pop(state_attributes_ids_reversed[purged_attributes_id], None)
+        self._evict_purged_used(attributes_ids)
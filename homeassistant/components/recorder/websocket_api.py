@@ -46,9 +46,9 @@ from .statistics import (
     async_change_statistics_unit,
     async_import_statistics,
     async_list_statistic_ids,
+    cached_statistics_during_period,
     list_statistic_ids,
     statistic_during_period,
-    statistics_during_period,
     update_statistics_issues,
     validate_statistics,
 )
@@ -148,7 +148,7 @@ async def ws_get_statistic_during_period(
     start_time, end_time = resolve_period(cast(StatisticPeriod, msg))
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_statistic_during_period,
             hass,
             msg["id"],
@@ -172,7 +172,7 @@ def _ws_get_statistics_during_period(
     types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> bytes:
     """Fetch statistics and convert them to json in the executor."""
-    result = statistics_during_period(
+    result = cached_statistics_during_period(
         hass,
         start_time,
         end_time,
@@ -216,7 +216,7 @@ async def ws_handle_get_statistics_during_period(
     if (types := msg.get("types")) is None:
         types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_statistics_during_period,
             hass,
             msg["id"],
@@ -271,7 +271,7 @@ async def ws_handle_list_statistic_ids(
 ) -> None:
     """Fetch a list of available statistic_id."""
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_list_statistic_ids,
             hass,
             msg["id"],
@@ -475,7 +475,7 @@ async def ws_adjust_sum_statistics(
         return
 
     instance = get_instance(hass)
-    metadatas = await instance.async_add_executor_job(
+    metadatas = await instance.async_add_read_executor_job(
         list_statistic_ids, hass, {msg["statistic_id"]}
     )
     if not metadatas:
@@ -28,12 +28,20 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, callback, split_entity_id
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.entity import entity_sources
@@ -94,6 +102,10 @@ WARN_UNSTABLE_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unstable_unit")
 WARN_STATISTICS_MEAN_CHANGED: HassKey[set[str]] = HassKey(
     f"{DOMAIN}_warn_statistics_mean_change"
 )
+# In memory sensor states for compiling statistics
+STATISTICS_STATES: HassKey[_StatisticsStates] = HassKey(
+    f"{DOMAIN}_statistics_states"
+)
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
 STATE_CLASS_REMOVED_ISSUE = "state_class_removed"
@@ -451,24 +463,142 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
-def compile_statistics(  # noqa: C901
+class _StatisticsStates:
+    """Keep the states of sensors with a state class for compiling statistics.
+
+    The states are collected from state changed events, so statistics for a
+    period can be compiled without reading back the states the recorder just
+    wrote. The history is only complete for periods starting after the states
+    were first collected, or after the previous period that was handed out.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the statistics states."""
+        self._hass = hass
+        self._states: dict[str, list[State]] = {}
+        self._complete_since = dt_util.utcnow()
+
+    @callback
+    def async_start(self) -> None:
+        """Start collecting states from the current states."""
+        for state in self._hass.states.async_all(DOMAIN):
+            if ATTR_STATE_CLASS in state.attributes:
+                self._states[state.entity_id] = [state]
+                # Earlier states are only in the database
+                self._complete_since = max(self._complete_since, state.last_updated)
+        self._hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=_async_sensor_event_filter,
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Add the new state of a sensor."""
+        entity_id = event.data["entity_id"]
+        new_state = event.data["new_state"]
+        if new_state is None or ATTR_STATE_CLASS not in new_state.attributes:
+            self._states.pop(entity_id, None)
+            return
+        if (states := self._states.get(entity_id)) is None:
+            self._states[entity_id] = [new_state]
+        else:
+            states.append(new_state)
+
+    @callback
+    def async_pop_period(
+        self, start: datetime.datetime, end: datetime.datetime
+    ) -> dict[str, list[State]] | None:
+        """Return the states of the period, like the recorder history does.
+
+        The states of each sensor are the last state before start, followed by
+        the states during the period. States before the period are discarded.
+        Returns None if the states of the period are not complete.
+        """
+        if start < self._complete_since:
+            return None
+        period_states: dict[str, list[State]] = {}
+        for entity_id, states in self._states.items():
+            start_state: State | None = None
+            end_state: State | None = None
+            during: list[State] = []
+            after: list[State] = []
+            for state in states:
+                last_updated = state.last_updated
+                if last_updated < start:
+                    if start_state is None or last_updated >= start_state.last_updated:
+                        start_state = state
+                elif last_updated < end:
+                    during.append(state)
+                else:
+                    after.append(state)
+                    continue
+                if end_state is None or last_updated >= end_state.last_updated:
+                    end_state = state
+            during.sort(key=lambda state: state.last_updated)
+            period_states[entity_id] = [start_state, *during] if start_state else during
+            # Keep the last state before end as the start state of the next period
+            self._states[entity_id] = [end_state, *after] if end_state else after
+        self._complete_since = end
+        return period_states
+
+
+@callback
+def _async_sensor_event_filter(event_data: EventStateChangedData) -> bool:
+    """Filter state changed events of sensors."""
+    return split_entity_id(event_data["entity_id"])[0] == DOMAIN
+
+
+@callback
+def _async_pop_period_states(
+    hass: HomeAssistant, start: datetime.datetime, end: datetime.datetime
+) -> dict[str, list[State]] | None:
+    """Return the in memory states of a period, or None if they are not complete."""
+    if (statistics_states := hass.data.get(STATISTICS_STATES)) is None:
+        statistics_states = hass.data[STATISTICS_STATES] = _StatisticsStates(hass)
+        statistics_states.async_start()
+        return None
+    return statistics_states.async_pop_period(start, end)
+
+
+def _get_period_history(
     hass: HomeAssistant,
     session: Session,
     start: datetime.datetime,
     end: datetime.datetime,
-) -> statistics.PlatformCompiledStatistics:
-    """Compile statistics for all entities during start-end."""
-    result: list[StatisticResult] = []
+    entities_full_history: list[str],
+    entities_significant_history: list[str],
+) -> dict[str, list[State]]:
+    """Get the history of the sensors between start and end.
 
-    sensor_states = _get_sensor_states(hass)
-    wanted_statistics = _wanted_statistics(sensor_states)
-    # Get history between start and end
-    entities_full_history = [
-        i.entity_id
-        for i in sensor_states
-        if "sum" in wanted_statistics[i.entity_id].types
-    ]
-    history_list: dict[str, list[State]] = {}
+    The in memory states are used when they are complete for the period,
+    otherwise, e.g. after a restart, the history is read from the database.
+    """
+    if (
+        period_states := run_callback_threadsafe(
+            hass.loop, _async_pop_period_states, hass, start, end
+        ).result()
+    ) is not None:
+        history_list = {
+            entity_id: states
+            for entity_id in entities_full_history
+            if (states := period_states.get(entity_id))
+        }
+        for entity_id in entities_significant_history:
+            if not (states := period_states.get(entity_id)):
+                continue
+            # Leave out attribute only changes, like the significant history does
+            history_list[entity_id] = [
+                states[0],
+                *(
+                    state
+                    for state in states[1:]
+                    if state.last_changed == state.last_updated
+                ),
+            ]
+        return history_list
+
+    history_list = {}
     if entities_full_history:
         history_list = history.get_full_significant_states_with_session(
             hass,
@@ -478,11 +608,6 @@ def compile_statistics(  # noqa: C901
             entity_ids=entities_full_history,
             significant_changes_only=False,
         )
-    entities_significant_history = [
-        i.entity_id
-        for i in sensor_states
-        if "sum" not in wanted_statistics[i.entity_id].types
-    ]
     if entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
             hass,
@@ -492,6 +617,39 @@ def compile_statistics(  # noqa: C901
             entity_ids=entities_significant_history,
         )
         history_list = {**history_list, **_history_list}
+    return history_list
+
+
+def compile_statistics(  # noqa: C901
+    hass: HomeAssistant,
+    session: Session,
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> statistics.PlatformCompiledStatistics:
+    """Compile statistics for all entities during start-end."""
+    result: list[StatisticResult] = []
+
+    sensor_states = _get_sensor_states(hass)
+    wanted_statistics = _wanted_statistics(sensor_states)
+    # Get history between start and end
+    entities_full_history = [
+        i.entity_id
+        for i in sensor_states
+        if "sum" in wanted_statistics[i.entity_id].types
+    ]
+    entities_significant_history = [
+        i.entity_id
+        for i in sensor_states
+        if "sum" not in wanted_statistics[i.entity_id].types
+    ]
+    history_list = _get_period_history(
+        hass,
+        session,
+        start,
+        end,
+        entities_full_history,
+        entities_significant_history,
+    )
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
@@ -0,0 +1,118 @@
+"""Export the state machine to local processes through files.
+
+A memory mapped ring receives every state change and a full snapshot of
+all states is written periodically. Local consumers can follow the ring
+from the head and seq stored in the snapshot without subscribing to
+Home Assistant and without any serialization work per consumer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from datetime import datetime
+import logging
+import os
+import time
+
+import voluptuous as vol
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, EVENT_STATE_CHANGED
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.file import WriteError, write_utf8_file
+
+from .const import (
+    CONF_RING_SIZE,
+    CONF_SNAPSHOT_INTERVAL,
+    DEFAULT_RING_SIZE,
+    DEFAULT_SNAPSHOT_INTERVAL,
+    DOMAIN,
+    MIN_RING_SIZE,
+    RING_FILE,
+    SNAPSHOT_FILE,
+)
+from .ring import StateChangeRing
+
+_LOGGER = logging.getLogger(__name__)
+
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Optional(CONF_RING_SIZE, default=DEFAULT_RING_SIZE): vol.All(
+                    vol.Coerce(int), vol.Range(min=MIN_RING_SIZE)
+                ),
+                vol.Optional(
+                    CONF_SNAPSHOT_INTERVAL, default=DEFAULT_SNAPSHOT_INTERVAL
+                ): cv.time_period,
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the state snapshot export."""
+    conf = config[DOMAIN]
+    directory = hass.config.path(DOMAIN)
+    ring = StateChangeRing(os.path.join(directory, RING_FILE), conf[CONF_RING_SIZE])
+    snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+
+    def _open() -> None:
+        os.makedirs(directory, exist_ok=True)
+        ring.open(time.time())
+
+    await hass.async_add_executor_job(_open)
+
+    @callback
+    def _async_state_changed(event: Event[EventStateChangedData]) -> None:
+        if (new_state := event.data["new_state"]) is None:
+            payload = b'{"' + event.data["entity_id"].encode() + b'":null}'
+        else:
+            payload = b"{" + new_state.as_compressed_state_json + b"}"
+        if not ring.append(payload):
+            _LOGGER.warning(
+                "State of %s is too large for the state change ring",
+                event.data["entity_id"],
+            )
+
+    def _write_snapshot(data: bytes) -> None:
+        # write_utf8_file already logs the error
+        with suppress(WriteError):
+            write_utf8_file(snapshot_path, data, mode="wb")
+
+    @callback
+    def _async_write_snapshot(_: datetime | None = None) -> asyncio.Future[None]:
+        states = b",".join(
+            state.as_compressed_state_json for state in hass.states.async_snapshot()
+        )
+        # The ring position is taken at the same time as the states
+        # so consumers know which changes are not in the snapshot yet.
+        header = json_bytes({"head": ring.head, "seq": ring.seq})[:-1]
+        return hass.async_add_executor_job(
+            _write_snapshot, header + b',"states":{' + states + b"}}"
+        )
+
+    cancel_state_changed = hass.bus.async_listen(
+        EVENT_STATE_CHANGED, _async_state_changed
+    )
+    _async_write_snapshot()
+    async_track_time_interval(
+        hass,
+        _async_write_snapshot,
+        conf[CONF_SNAPSHOT_INTERVAL],
+        cancel_on_shutdown=True,
+    )
+
+    async def _async_stop(event: Event) -> None:
+        cancel_state_changed()
+        await _async_write_snapshot()
+        await hass.async_add_executor_job(ring.close)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
+    return True
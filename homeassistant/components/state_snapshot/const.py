@@ -0,0 +1,15 @@
+"""Constants for the State Snapshot integration."""
+
+from datetime import timedelta
+
+DOMAIN = "state_snapshot"
+
+CONF_RING_SIZE = "ring_size"
+CONF_SNAPSHOT_INTERVAL = "snapshot_interval"
+
+DEFAULT_RING_SIZE = 4 * 1024 * 1024
+MIN_RING_SIZE = 64 * 1024
+DEFAULT_SNAPSHOT_INTERVAL = timedelta(seconds=60)
+
+RING_FILE = "state_changes.ring"
+SNAPSHOT_FILE = "snapshot.json"
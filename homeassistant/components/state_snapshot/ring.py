@@ -0,0 +1,127 @@
+"""Append only ring of state changes in a memory mapped file.
+
+The file starts with a header followed by the data area:
+
+    magic      8 bytes   b"HASRING1"
+    capacity   uint64    size of the data area in bytes
+    created    float64   timestamp the ring was created at
+    head       uint64    total number of bytes ever written to the data area
+    seq        uint64    sequence number of the last record
+
+All values are little endian. Each record in the data area is a uint32
+payload length, the uint64 sequence number of the record and the payload.
+The payload is a JSON object with the entity_id as key and the compressed
+state as value, or null when the entity was removed. A record never wraps;
+when it does not fit before the end of the data area a zero length marker
+is written and the record starts at the beginning of the data area.
+
+Readers keep their own cursor in the same units as head. A reader that
+falls more than capacity bytes behind head has been overrun and must load
+the snapshot again.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+
+MAGIC = b"HASRING1"
+HEADER = struct.Struct("<8sQdQQ")
+POSITION = struct.Struct("<QQ")
+POSITION_OFFSET = 24
+RECORD_HEADER = struct.Struct("<IQ")
+WRAP_MARKER = struct.Struct("<I")
+DATA_OFFSET = 64
+
+
+class RingOverrunError(Exception):
+    """Raised when a reader fell too far behind the writer."""
+
+
+class StateChangeRing:
+    """Write state changes to a memory mapped ring."""
+
+    def __init__(self, path: str, capacity: int) -> None:
+        """Initialize the ring."""
+        self.path = path
+        self.capacity = capacity
+        self.head = 0
+        self.seq = 0
+        self._mmap: mmap.mmap | None = None
+
+    def open(self, created: float) -> None:
+        """Create the file and map it into memory.
+
+        Must be called from an executor as it does blocking I/O.
+        """
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, DATA_OFFSET + self.capacity)
+            self._mmap = mmap.mmap(fd, DATA_OFFSET + self.capacity)
+        finally:
+            os.close(fd)
+        HEADER.pack_into(self._mmap, 0, MAGIC, self.capacity, created, 0, 0)
+
+    def close(self) -> None:
+        """Unmap the file."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def append(self, payload: bytes) -> bool:
+        """Append a record to the ring.
+
+        Returns False if the payload can never fit in the ring.
+        """
+        assert self._mmap is not None
+        capacity = self.capacity
+        record_size = RECORD_HEADER.size + len(payload)
+        if record_size > capacity:
+            return False
+        position = self.head % capacity
+        if position + record_size > capacity:
+            if capacity - position >= WRAP_MARKER.size:
+                WRAP_MARKER.pack_into(self._mmap, DATA_OFFSET + position, 0)
+            self.head += capacity - position
+            position = 0
+        self.seq += 1
+        start = DATA_OFFSET + position
+        RECORD_HEADER.pack_into(self._mmap, start, len(payload), self.seq)
+        start += RECORD_HEADER.size
+        self._mmap[start : start + len(payload)] = payload
+        self.head += record_size
+        # Publish the record only once it has been written
+        POSITION.pack_into(self._mmap, POSITION_OFFSET, self.head, self.seq)
+        return True
+
+
+def read_records(
+    buffer: bytes | mmap.mmap, cursor: int
+) -> tuple[list[tuple[int, bytes]], int]:
+    """Read the records written after cursor from a ring buffer.
+
+    Returns the records as (seq, payload) and the new cursor.
+    """
+    magic, capacity, _created, head, _seq = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a state change ring")
+    if head - cursor > capacity:
+        raise RingOverrunError
+    start_cursor = cursor
+    records: list[tuple[int, bytes]] = []
+    while cursor < head:
+        position = cursor % capacity
+        if capacity - position < RECORD_HEADER.size or not (
+            length := WRAP_MARKER.unpack_from(buffer, DATA_OFFSET + position)[0]
+        ):
+            cursor += capacity - position
+            continue
+        _length, seq = RECORD_HEADER.unpack_from(buffer, DATA_OFFSET + position)
+        start = DATA_OFFSET + position + RECORD_HEADER.size
+        records.append((seq, bytes(buffer[start : start + length])))
+        cursor += RECORD_HEADER.size + length
+    # The writer may have overwritten what was read in the meantime
+    if POSITION.unpack_from(buffer, POSITION_OFFSET)[0] - start_cursor > capacity:
+        raise RingOverrunError
+    return records, cursor
@@ -43,12 +43,14 @@ from .const import (
     ATTR_PREFER_TCP,
     ATTR_SETTINGS,
     ATTR_STREAMS,
+    ATTR_WORKER_PROCESS,
     CONF_EXTRA_PART_WAIT_TIME,
     CONF_LL_HLS,
     CONF_PART_DURATION,
     CONF_RTSP_TRANSPORT,
     CONF_SEGMENT_DURATION,
     CONF_USE_WALLCLOCK_AS_TIMESTAMPS,
+    CONF_WORKER_PROCESS,
     DOMAIN,
     FORMAT_CONTENT_TYPE,
     HLS_PROVIDER,
@@ -221,6 +223,7 @@ DOMAIN_SCHEMA = vol.Schema(
         vol.Optional(CONF_PART_DURATION, default=1): vol.All(
             cv.positive_float, vol.Range(min=0.2, max=1.5)
         ),
+        vol.Optional(CONF_WORKER_PROCESS, default=False): cv.boolean,
     }
 )
 
@@ -273,6 +276,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[DOMAIN][ATTR_ENDPOINTS] = {}
     hass.data[DOMAIN][ATTR_STREAMS] = []
     conf = DOMAIN_SCHEMA(config.get(DOMAIN, {}))
+    hass.data[DOMAIN][ATTR_WORKER_PROCESS] = conf[CONF_WORKER_PROCESS]
     if conf[CONF_LL_HLS]:
         assert isinstance(conf[CONF_SEGMENT_DURATION], float)
         assert isinstance(conf[CONF_PART_DURATION], float)
@@ -461,6 +465,13 @@ class Stream:
         # Keep import here so that we can import stream integration without installing reqs
         from .worker import StreamState, stream_worker  # noqa: PLC0415
 
+        if self.hass.data[DOMAIN][ATTR_WORKER_PROCESS]:
+            from .process import process_stream_worker  # noqa: PLC0415
+
+            worker = process_stream_worker
+        else:
+            worker = stream_worker
+
         stream_state = StreamState(self.hass, self.outputs, self._diagnostics)
         wait_timeout = 0
         while not self._thread_quit.wait(timeout=wait_timeout):
@@ -474,7 +485,7 @@ class Stream:
             )
             self._diagnostics.increment("start_worker")
             try:
-                stream_worker(
+                worker(
                     self.source,
                     self.pyav_options,
                     self._stream_settings,
@@ -608,7 +619,12 @@ class Stream:
 
     def get_diagnostics(self) -> dict[str, Any]:
         """Return diagnostics information for the stream."""
-        return self._diagnostics.as_dict()
+        diagnostics = self._diagnostics.as_dict()
+        if outputs := self.outputs():
+            diagnostics["segments_size"] = {
+                name: output.data_size for name, output in outputs.items()
+            }
+        return diagnostics
 
 
 def _should_retry() -> bool:
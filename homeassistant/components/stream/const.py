@@ -10,6 +10,7 @@ DOMAIN = "stream"
 ATTR_ENDPOINTS = "endpoints"
 ATTR_SETTINGS = "settings"
 ATTR_STREAMS = "streams"
+ATTR_WORKER_PROCESS = "worker_process"
 
 HLS_PROVIDER = "hls"
 RECORDER_PROVIDER = "recorder"
@@ -26,6 +27,7 @@ OUTPUT_IDLE_TIMEOUT = 300  # Idle timeout due to inactivity
 
 NUM_PLAYLIST_SEGMENTS = 3  # Number of segments to use in HLS playlist
 MAX_SEGMENTS = 5  # Max number of segments to keep around
+MAX_SEGMENTS_SIZE = 64 * 1024 * 1024  # Max bytes of segments to keep per output
 TARGET_SEGMENT_DURATION_NON_LL_HLS = 2.0  # Each segment is about this many seconds
 SEGMENT_DURATION_ADJUSTER = 0.1  # Used to avoid missing keyframe boundaries
 # Number of target durations to start before the end of the playlist.
@@ -44,10 +46,13 @@ SOURCE_TIMEOUT = 30  # Timeout for reading stream source
 
 STREAM_RESTART_INCREMENT = 10  # Increase wait_timeout by this amount each retry
 STREAM_RESTART_RESET_TIME = 300  # Reset wait_timeout after this many seconds
+# Size of the shared memory buffer for parts from a worker process
+PROCESS_PART_BUFFER_SIZE = 16 * 1024 * 1024
 
 CONF_LL_HLS = "ll_hls"
 CONF_PART_DURATION = "part_duration"
 CONF_SEGMENT_DURATION = "segment_duration"
+CONF_WORKER_PROCESS = "worker_process"
 
 ATTR_PREFER_TCP = "prefer_tcp"
 CONF_RTSP_TRANSPORT = "rtsp_transport"
@@ -27,7 +27,7 @@ from .const import (
 )
 
 if TYPE_CHECKING:
-    from av import Packet, VideoCodecContext
+    from av import Packet, VideoCodecContext, VideoFrame
 
     from homeassistant.components.camera import DynamicStreamSettings
 
@@ -77,8 +77,8 @@ class Part:
 
     duration: float
     has_keyframe: bool
-    # video data (moof+mdat)
-    data: bytes
+    # video data (moof+mdat), a view of the segment data once it is joined
+    data: bytes | memoryview
 
 
 @dataclass(slots=True)
@@ -102,6 +102,9 @@ class Segment:
     hls_num_parts_rendered: int = 0
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = False
+    _data_size: int = field(default=0, init=False, repr=False)
+    # Data of all parts, joined once the segment is complete
+    _data: bytes | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Run after init."""
@@ -121,7 +124,7 @@ class Segment:
     @property
     def data_size(self) -> int:
         """Return the size of all part data without init in bytes."""
-        return sum(len(part.data) for part in self.parts)
+        return self._data_size
 
     @callback
     def async_add_part(
@@ -134,13 +137,31 @@ class Segment:
         Duration is non zero only for the last part.
         """
         self.parts.append(part)
+        self._data_size += len(part.data)
         self.duration = duration
         for output in self._stream_outputs:
             output.part_put()
 
     def get_data(self) -> bytes:
-        """Return reconstructed data for all parts as bytes, without init."""
-        return b"".join([part.data for part in self.parts])
+        """Return reconstructed data for all parts as bytes, without init.
+
+        The data of a complete segment is joined only once and shared by all
+        viewers. The parts are replaced with views into the joined data so
+        the part data is not kept twice.
+        """
+        if self._data is not None:
+            return self._data
+        data = b"".join([part.data for part in self.parts])
+        if not self.complete:
+            return data
+        view = memoryview(data)
+        offset = 0
+        for part in self.parts:
+            size = len(part.data)
+            part.data = view[offset : offset + size]
+            offset += size
+        self._data = data
+        return data
 
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
         """Render the HLS playlist section for the Segment.
@@ -329,6 +350,11 @@ class StreamOutput:
         """Retrieve all segments."""
         return self._segments
 
+    @property
+    def data_size(self) -> int:
+        """Return the size of the data of all segments in bytes."""
+        return sum(segment.data_size for segment in self._segments)
+
     async def part_recv(self, timeout: float | None = None) -> bool:
         """Wait for an event signalling the latest part segment."""
         try:
@@ -423,10 +449,14 @@ class KeyFrameConverter:
         the worker thread sets a packet
         get_image is called from the main asyncio loop
         get_image schedules _generate_image in an executor thread
-        _generate_image will try to create an image from the packet
+        _generate_image will try to decode a frame from the packet
         _generate_image will clear the packet, so there will only be one attempt per packet
+        _generate_image will encode the last decoded frame at the requested size
     If successful, self._image will be updated and returned by get_image
     If unsuccessful, get_image will return the previous image
+
+    The encoded images are cached per size until the next keyframe is decoded, so
+    requests for several sizes of the same keyframe only decode it once.
     """
 
     def __init__(
@@ -447,6 +477,9 @@ class KeyFrameConverter:
         self._event: asyncio.Event = asyncio.Event()
         self._hass = hass
         self._image: bytes | None = None
+        self._frame: VideoFrame | None = None
+        # Images of the last decoded frame by width, height and orientation
+        self._images: dict[tuple[int | None, int | None, int], bytes] = {}
         self._turbojpeg = TurboJPEGSingleton.instance()
         self._lock = asyncio.Lock()
         self._codec_context: VideoCodecContext | None = None
@@ -486,15 +519,21 @@ class KeyFrameConverter:
         """Transform image to a given orientation."""
         return TRANSFORM_IMAGE_FUNCTION[orientation](image)
 
-    def _generate_image(self, width: int | None, height: int | None) -> None:
-        """Generate the keyframe image.
+    def _image_key(
+        self, width: int | None, height: int | None
+    ) -> tuple[int | None, int | None, int]:
+        """Return the key of the image cache for a requested size."""
+        if not (width and height):
+            width = height = None
+        return (width, height, self._dynamic_stream_settings.orientation)
 
-        This is run in an executor thread, but since it is called within an
-        the asyncio lock from the main thread, there will only be one entry
-        at a time per instance.
+    def _decode_frame(self) -> None:
+        """Decode the stashed keyframe packet.
+
+        The cached images are cleared when a new frame is decoded.
         """
 
-        if not (self._turbojpeg and self._packet and self._codec_context):
+        if not (self._packet and self._codec_context):
             return
         packet = self._packet
         self._packet = None
@@ -514,17 +553,35 @@ class KeyFrameConverter:
             _LOGGER.debug("Unable to decode keyframe")
             return
         if frames:
-            frame = frames[0]
+            self._frame = frames[0]
+            self._images.clear()
+
+    def _generate_image(self, width: int | None, height: int | None) -> None:
+        """Generate the keyframe image.
+
+        This is run in an executor thread, but since it is called within an
+        the asyncio lock from the main thread, there will only be one entry
+        at a time per instance.
+        """
+
+        if not self._turbojpeg:
+            return
+        self._decode_frame()
+        if (frame := self._frame) is None:
+            return
+        key = self._image_key(width, height)
+        if (image := self._images.get(key)) is None:
+            width, height, orientation = key
             if width and height:
-                if self._dynamic_stream_settings.orientation >= 5:
+                if orientation >= 5:
                     frame = frame.reformat(width=height, height=width)
                 else:
                     frame = frame.reformat(width=width, height=height)
             bgr_array = self.transform_image(
-                frame.to_ndarray(format="bgr24"),
-                self._dynamic_stream_settings.orientation,
+                frame.to_ndarray(format="bgr24"), orientation
             )
-            self._image = bytes(self._turbojpeg.encode(bgr_array))
+            image = self._images[key] = bytes(self._turbojpeg.encode(bgr_array))
+        self._image = image
 
     async def async_get_image(
         self,
@@ -539,5 +596,14 @@ class KeyFrameConverter:
             self._event.clear()
             await self._event.wait()
         async with self._lock:
-            await self._hass.async_add_executor_job(self._generate_image, width, height)
+            # Concurrent requests for the same keyframe and size are served from
+            # the cache once the first one has generated the image
+            if self._packet is None and (
+                image := self._images.get(self._image_key(width, height))
+            ):
+                self._image = image
+            else:
+                await self._hass.async_add_executor_job(
+                    self._generate_image, width, height
+                )
         return self._image
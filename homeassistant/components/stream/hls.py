@@ -15,6 +15,7 @@ from .const import (
     FORMAT_CONTENT_TYPE,
     HLS_PROVIDER,
     MAX_SEGMENTS,
+    MAX_SEGMENTS_SIZE,
     NUM_PLAYLIST_SEGMENTS,
 )
 from .core import (
@@ -89,6 +90,13 @@ class HlsStreamOutput(StreamOutput):
         their GOPs periodically so we need to account for this change.
         """
         super()._async_put(segment)
+        # Drop the oldest segments when they use too much memory, but always
+        # keep the segments of the playlist
+        while (
+            len(self._segments) > NUM_PLAYLIST_SEGMENTS + 1
+            and self.data_size > MAX_SEGMENTS_SIZE
+        ):
+            self._segments.popleft()
         self._target_duration = (
             max((s.duration for s in self._segments), default=segment.duration)
             or self.stream_settings.min_segment_duration
@@ -369,7 +377,7 @@ class HlsPartView(StreamView):
 
     async def handle(
         self, request: web.Request, stream: Stream, sequence: str, part_num: str
-    ) -> web.Response:
+    ) -> web.StreamResponse:
         """Handle part."""
         track: HlsStreamOutput = cast(
             HlsStreamOutput, stream.add_provider(HLS_PROVIDER)
@@ -394,12 +402,19 @@ class HlsPartView(StreamView):
             await track.part_recv(timeout=track.stream_settings.hls_part_timeout)
         if int(part_num) >= len(segment.parts):
             return web.HTTPRequestRangeNotSatisfiable()
-        return web.Response(
-            body=segment.parts[int(part_num)].data,
+        # The part data may be a view into the data of the segment, write it
+        # without making a copy
+        data = segment.parts[int(part_num)].data
+        response = web.StreamResponse(
             headers={
                 "Content-Type": "video/iso.segment",
             },
         )
+        response.content_length = len(data)
+        await response.prepare(request)
+        await response.write(data)
+        await response.write_eof()
+        return response
 
 
 class HlsSegmentView(StreamView):
@@ -0,0 +1,375 @@
+"""Run the stream worker in a child process.
+
+The demuxing and muxing done by the stream worker holds the GIL for most of its
+work, so with many streams it adds latency to the event loop. When enabled, the
+worker runs in a child process and the thread in the main process only turns
+the messages from the child into segments, parts and keyframe images.
+
+Part data is written to a shared memory ring buffer by the child. The parent
+copies the data out and acknowledges each part so the child can reuse the
+space. Parts that do not fit in the free space are sent through the pipe.
+
+Log records of the child are sent through a queue and handled by the loggers
+of the parent, so they end up in the Home Assistant log.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import asdict, fields
+import datetime
+from enum import StrEnum
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import multiprocessing
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.queues import Queue
+from multiprocessing.synchronize import Event as ProcessEvent
+from threading import Event
+from typing import Any, cast
+
+import av
+
+from .const import PROCESS_PART_BUFFER_SIZE, StreamClientError
+from .core import KeyFrameConverter, Part, Segment, StreamSettings
+from .diagnostics import Diagnostics
+from .exceptions import StreamEndedError, StreamWorkerError
+from .worker import StreamState, stream_worker
+
+_LOGGER = logging.getLogger(__name__)
+
+# Time to wait for a message from the child before checking for a quit request
+POLL_INTERVAL = 0.5
+# Time to wait for the child to exit after the stream has ended
+JOIN_TIMEOUT = 5
+
+
+class _Message(StrEnum):
+    """Kinds of messages sent by the child process."""
+
+    SEQUENCE = "sequence"
+    SEGMENT = "segment"
+    PART = "part"
+    SETTINGS = "settings"
+    DIAGNOSTICS_INCREMENT = "increment"
+    DIAGNOSTICS_VALUE = "value"
+    CODEC = "codec"
+    KEYFRAME = "keyframe"
+    ERROR = "error"
+    ENDED = "ended"
+
+
+class _PartBuffer:
+    """Ring buffer in shared memory for the part data written by the child."""
+
+    def __init__(self, shm: SharedMemory, conn: Connection) -> None:
+        """Initialize the part buffer."""
+        self._shm = shm
+        self._conn = conn
+        self._head = 0
+        # Offset and size of the parts which are not acknowledged yet
+        self._pending: deque[tuple[int, int]] = deque()
+
+    def _allocate(self, size: int) -> int | None:
+        """Return the offset to write a part to, or None if it does not fit."""
+        while self._conn.poll():
+            self._conn.recv()
+            self._pending.popleft()
+        capacity = self._shm.size
+        if not self._pending:
+            self._head = 0
+            return 0 if size <= capacity else None
+        tail = self._pending[0][0]
+        if self._head >= tail:
+            if self._head + size <= capacity:
+                return self._head
+            # Wrap around, without catching up with the tail
+            return 0 if size < tail else None
+        return self._head if self._head + size < tail else None
+
+    def write(self, data: bytes) -> tuple[int, int] | bytes:
+        """Write part data and return its location, or the data if it does not fit."""
+        if (offset := self._allocate(size := len(data))) is None:
+            return data
+        self._shm.buf[offset : offset + size] = data
+        self._pending.append((offset, size))
+        self._head = offset + size
+        return (offset, size)
+
+
+class _ChildDiagnostics(Diagnostics):
+    """Diagnostics which are sent to the parent process."""
+
+    def __init__(self, conn: Connection) -> None:
+        """Initialize the child diagnostics."""
+        super().__init__()
+        self._conn = conn
+
+    def increment(self, key: str) -> None:
+        """Increment a counter for the specified key/event."""
+        self._conn.send((_Message.DIAGNOSTICS_INCREMENT, key))
+
+    def set_value(self, key: str, value: Any) -> None:
+        """Update a key/value pair."""
+        self._conn.send((_Message.DIAGNOSTICS_VALUE, key, value))
+
+
+class _ChildStreamState(StreamState):
+    """Stream state which sends the segments and parts to the parent process."""
+
+    def __init__(
+        self,
+        conn: Connection,
+        part_buffer: _PartBuffer,
+        stream_settings: StreamSettings,
+    ) -> None:
+        """Initialize the child stream state."""
+        # There is no event loop or outputs in the child
+        super().__init__(
+            None,  # type: ignore[arg-type]
+            dict,
+            _ChildDiagnostics(conn),
+        )
+        self._conn = conn
+        self._part_buffer = part_buffer
+        self._stream_settings = stream_settings
+        self._sent_settings = asdict(stream_settings)
+
+    def next_sequence(self) -> int:
+        """Increment the sequence number."""
+        self._conn.send((_Message.SEQUENCE,))
+        return super().next_sequence()
+
+    def create_segment(self, init: bytes, start_time: datetime.datetime) -> Segment:
+        """Send a new segment to the parent process."""
+        # The worker may have changed the settings for the source
+        if (settings := asdict(self._stream_settings)) != self._sent_settings:
+            self._conn.send((_Message.SETTINGS, settings))
+            self._sent_settings = settings
+        self._conn.send((_Message.SEGMENT, init, start_time))
+        return Segment(
+            sequence=self.sequence,
+            stream_id=self.stream_id,
+            init=init,
+            _stream_outputs=(),
+            start_time=start_time,
+        )
+
+    def add_part(self, segment: Segment, part: Part, duration: float) -> None:
+        """Send a part of the latest segment to the parent process."""
+        self._conn.send(
+            (
+                _Message.PART,
+                self._part_buffer.write(cast(bytes, part.data)),
+                part.duration,
+                part.has_keyframe,
+                duration,
+            )
+        )
+
+
+class _ChildKeyFrameConverter:
+    """Send the keyframes to the KeyFrameConverter of the parent process."""
+
+    def __init__(self, conn: Connection) -> None:
+        """Initialize the child keyframe converter."""
+        self._conn = conn
+
+    def create_codec_context(self, codec_context: av.VideoCodecContext) -> None:
+        """Send the codec used for decoding the keyframes."""
+        self._conn.send(
+            (_Message.CODEC, codec_context.name, codec_context.extradata)
+        )
+
+    def stash_keyframe_packet(self, packet: av.Packet) -> None:
+        """Send the latest keyframe."""
+        self._conn.send(
+            (
+                _Message.KEYFRAME,
+                bytes(packet),
+                packet.pts,
+                packet.dts,
+                packet.time_base,
+            )
+        )
+
+
+class _ForwardLogHandler(logging.Handler):
+    """Handle the log records of the child with the loggers of the parent."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Handle a log record of the child process."""
+        logging.getLogger(record.name).handle(record)
+
+
+def _run_child(
+    conn: Connection,
+    shm_name: str,
+    source: str,
+    pyav_options: dict[str, str],
+    stream_settings: StreamSettings,
+    quit_event: ProcessEvent,
+    log_queue: Queue[logging.LogRecord],
+    log_level: int,
+) -> None:
+    """Run the stream worker in the child process."""
+    # Keep import here to avoid a circular import
+    from . import set_pyav_logging  # noqa: PLC0415
+
+    # The spawned child starts without any logging configuration
+    root_logger = logging.getLogger()
+    root_logger.handlers = [QueueHandler(log_queue)]
+    root_logger.setLevel(log_level)
+    set_pyav_logging(log_level <= logging.DEBUG)
+    # The parent owns the shared memory and unlinks it
+    shm = SharedMemory(name=shm_name, track=False)
+    try:
+        stream_worker(
+            source,
+            pyav_options,
+            stream_settings,
+            _ChildStreamState(conn, _PartBuffer(shm, conn), stream_settings),
+            cast(KeyFrameConverter, _ChildKeyFrameConverter(conn)),
+            cast(Event, quit_event),
+        )
+    except StreamEndedError as err:
+        conn.send((_Message.ENDED, str(err)))
+    except StreamWorkerError as err:
+        conn.send((_Message.ERROR, str(err), err.error_code))
+    finally:
+        shm.close()
+        conn.close()
+
+
+class _ParentHandler:
+    """Apply the messages from the child process to the stream."""
+
+    def __init__(
+        self,
+        conn: Connection,
+        shm: SharedMemory,
+        stream_settings: StreamSettings,
+        stream_state: StreamState,
+        keyframe_converter: KeyFrameConverter,
+    ) -> None:
+        """Initialize the parent handler."""
+        self._conn = conn
+        self._shm = shm
+        self._stream_settings = stream_settings
+        self._stream_state = stream_state
+        self._keyframe_converter = keyframe_converter
+        self._segment: Segment | None = None
+
+    def handle(self, msg: tuple[Any, ...]) -> None:
+        """Handle a message from the child process."""
+        match msg:
+            case (_Message.SEQUENCE,):
+                self._stream_state.next_sequence()
+            case (_Message.SEGMENT, init, start_time):
+                self._segment = self._stream_state.create_segment(init, start_time)
+            case (_Message.PART, location, part_duration, has_keyframe, duration):
+                if isinstance(location, tuple):
+                    offset, size = location
+                    data = bytes(self._shm.buf[offset : offset + size])
+                    # Let the child reuse the space
+                    self._conn.send(None)
+                else:
+                    data = location
+                assert self._segment
+                self._stream_state.add_part(
+                    self._segment, Part(part_duration, has_keyframe, data), duration
+                )
+            case (_Message.SETTINGS, settings):
+                for field in fields(StreamSettings):
+                    setattr(self._stream_settings, field.name, settings[field.name])
+            case (_Message.DIAGNOSTICS_INCREMENT, key):
+                self._stream_state.diagnostics.increment(key)
+            case (_Message.DIAGNOSTICS_VALUE, key, value):
+                self._stream_state.diagnostics.set_value(key, value)
+            case (_Message.CODEC, name, extradata):
+                codec_context = cast(
+                    "av.VideoCodecContext", av.CodecContext.create(name, "r")
+                )
+                codec_context.extradata = extradata
+                self._keyframe_converter.create_codec_context(codec_context)
+            case (_Message.KEYFRAME, data, pts, dts, time_base):
+                packet = av.Packet(data)
+                packet.pts = pts
+                packet.dts = dts
+                packet.time_base = time_base
+                packet.is_keyframe = True
+                self._keyframe_converter.stash_keyframe_packet(packet)
+            case (_Message.ENDED, message):
+                raise StreamEndedError(message)
+            case (_Message.ERROR, message, error_code):
+                raise StreamWorkerError(message, error_code=error_code)
+
+
+def process_stream_worker(
+    source: str,
+    pyav_options: dict[str, str],
+    stream_settings: StreamSettings,
+    stream_state: StreamState,
+    keyframe_converter: KeyFrameConverter,
+    quit_event: Event,
+) -> None:
+    """Handle consuming streams in a child process.
+
+    This is a drop in replacement for stream_worker and runs in the stream
+    worker thread.
+    """
+    context = multiprocessing.get_context("spawn")
+    parent_conn, child_conn = context.Pipe()
+    process_quit = context.Event()
+    log_queue: Queue[logging.LogRecord] = context.Queue()
+    log_listener = QueueListener(log_queue, _ForwardLogHandler())
+    shm = SharedMemory(create=True, size=PROCESS_PART_BUFFER_SIZE)
+    process = context.Process(
+        target=_run_child,
+        args=(
+            child_conn,
+            shm.name,
+            source,
+            pyav_options,
+            stream_settings,
+            process_quit,
+            log_queue,
+            _LOGGER.getEffectiveLevel(),
+        ),
+        name="stream_worker",
+        daemon=True,
+    )
+    handler = _ParentHandler(
+        parent_conn, shm, stream_settings, stream_state, keyframe_converter
+    )
+    log_listener.start()
+    try:
+        process.start()
+        child_conn.close()
+        while True:
+            if quit_event.is_set():
+                process_quit.set()
+            if not parent_conn.poll(POLL_INTERVAL):
+                continue
+            try:
+                msg = parent_conn.recv()
+            except EOFError:
+                if quit_event.is_set():
+                    return
+                raise StreamWorkerError(
+                    f"Stream worker process exited ({process.exitcode})",
+                    error_code=StreamClientError.Other,
+                ) from None
+            handler.handle(msg)
+    finally:
+        process_quit.set()
+        process.join(JOIN_TIMEOUT)
+        if process.is_alive():
+            process.kill()
+            process.join()
+        log_listener.stop()
+        log_queue.close()
+        parent_conn.close()
+        shm.close()
+        shm.unlink()
@@ -117,6 +117,22 @@ class StreamState:
         """Return diagnostics object."""
         return self._diagnostics
 
+    def create_segment(self, init: bytes, start_time: datetime.datetime) -> Segment:
+        """Create a segment and put it to the queue of each output."""
+        return Segment(
+            sequence=self.sequence,
+            stream_id=self.stream_id,
+            init=init,
+            # Fetch the latest StreamOutputs, which may have changed since the
+            # worker started.
+            _stream_outputs=self.outputs,
+            start_time=start_time,
+        )
+
+    def add_part(self, segment: Segment, part: Part, duration: float) -> None:
+        """Add a part to a segment from the event loop."""
+        self.hass.loop.call_soon_threadsafe(segment.async_add_part, part, duration)
+
 
 class StreamMuxer:
     """StreamMuxer re-packages video/audio packets for output."""
@@ -133,7 +149,6 @@ class StreamMuxer:
 
     def __init__(
         self,
-        hass: HomeAssistant,
         video_stream: av.VideoStream,
         audio_stream: av.audio.AudioStream | None,
         audio_bsf: str | None,
@@ -141,7 +156,6 @@ class StreamMuxer:
         stream_settings: StreamSettings,
     ) -> None:
         """Initialize StreamMuxer."""
-        self._hass = hass
         self._input_video_stream = video_stream
         self._input_audio_stream = audio_stream
         self._audio_bsf = audio_bsf
@@ -283,14 +297,8 @@ class StreamMuxer:
 
     def create_segment(self) -> None:
         """Create a segment when the moov is ready."""
-        self._segment = Segment(
-            sequence=self._stream_state.sequence,
-            stream_id=self._stream_state.stream_id,
-            init=read_init(self._memory_file),
-            # Fetch the latest StreamOutputs, which may have changed since the
-            # worker started.
-            _stream_outputs=self._stream_state.outputs,
-            start_time=self._start_time,
+        self._segment = self._stream_state.create_segment(
+            read_init(self._memory_file), self._start_time
         )
         self._memory_file_pos = self._memory_file.tell()
         self._memory_file.seek(0, SEEK_END)
@@ -356,8 +364,8 @@ class StreamMuxer:
             adjusted_dts = packet.dts
         assert self._segment
         self._memory_file.seek(self._memory_file_pos)
-        self._hass.loop.call_soon_threadsafe(
-            self._segment.async_add_part,
+        self._stream_state.add_part(
+            self._segment,
             Part(
                 duration=float(
                     (adjusted_dts - self._part_start_dts) * packet.time_base
@@ -640,7 +648,6 @@ def stream_worker(
         ) from ex
 
     muxer = StreamMuxer(
-        stream_state.hass,
         video_stream,
         audio_stream,
         audio_bsf,
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from functools import lru_cache, partial
 import json
 import logging
@@ -19,6 +19,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CompressedState,
     Context,
     Event,
     EventStateChangedData,
@@ -68,6 +69,7 @@ from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
 from .connection import ActiveConnection
+from .entity_subscriptions import async_get_entity_subscription_hub
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
@@ -332,11 +334,16 @@ def _async_get_allowed_states(
 
 
 @callback
-@decorators.websocket_command({vol.Required("type"): "get_states"})
+@decorators.websocket_command(
+    {vol.Required("type"): "get_states", vol.Optional("since"): int}
+)
 def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
+    if "since" in msg:
+        _send_handle_get_states_changes_response(hass, connection, msg)
+        return
     states = _async_get_allowed_states(hass, connection)
 
     try:
@@ -363,6 +370,42 @@ def handle_get_states(
     _send_handle_get_states_response(connection, msg["id"], serialized_states)
 
 
+def _send_handle_get_states_changes_response(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Send the states changed since a version.
+
+    All states are sent with reset set when the changes since the version
+    are no longer known.
+    """
+    version = hass.states.version
+    if (changes := hass.states.async_changes_since(msg["since"])) is None:
+        changed: Sequence[State] = _async_get_allowed_states(hass, connection)
+        removed: list[str] = []
+    else:
+        changed, removed = changes
+        user = connection.user
+        if not user.is_admin and not user.permissions.access_all_entities(POLICY_READ):
+            entity_perm = user.permissions.check_entity
+            changed = [
+                state for state in changed if entity_perm(state.entity_id, POLICY_READ)
+            ]
+            removed = [
+                entity_id
+                for entity_id in removed
+                if entity_perm(entity_id, POLICY_READ)
+            ]
+    connection.send_result(
+        msg["id"],
+        {
+            "version": version,
+            "reset": changes is None,
+            "changed": [json_fragment(state.as_dict_json) for state in changed],
+            "removed": removed,
+        },
+    )
+
+
 def _send_handle_get_states_response(
     connection: ActiveConnection, msg_id: int, serialized_states: list[bytes]
 ) -> None:
@@ -374,38 +417,12 @@ def _send_handle_get_states_response(
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
-
-
 @callback
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("intern_strings", default=False): bool,
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
@@ -416,25 +433,40 @@ def handle_subscribe_entities(
     entity_ids = set(msg.get("entity_ids", [])) or None
     _filter = convert_include_exclude_filter(msg)
     entity_filter = None if _filter.empty_filter else _filter.get_filter()
+    string_table = messages.StringTable() if msg["intern_strings"] else None
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            entity_filter,
-            connection.user,
-            message_id_as_bytes,
-        ),
+    connection.subscriptions[msg_id] = async_get_entity_subscription_hub(
+        hass
+    ).async_subscribe(
+        connection.send_message,
+        entity_ids,
+        entity_filter,
+        connection.user,
+        msg_id,
+        connection.coalesce_window,
+        string_table,
     )
     connection.send_result(msg_id)
 
+    if string_table is not None:
+        _send_handle_entities_init_interned_response(
+            connection,
+            msg_id,
+            [
+                state
+                for state in states
+                if (not entity_ids or state.entity_id in entity_ids)
+                and (not entity_filter or entity_filter(state.entity_id))
+            ],
+            string_table,
+        )
+        return
+
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
@@ -493,6 +525,33 @@ def _send_handle_entities_init_response(
     )
 
 
+def _send_handle_entities_init_interned_response(
+    connection: ActiveConnection,
+    msg_id: int,
+    states: list[State],
+    string_table: messages.StringTable,
+) -> None:
+    """Send handle entities init response with interned strings."""
+    compressed_states: dict[str, CompressedState] = {}
+    for state in states:
+        try:
+            # Skip the states that cannot be serialized
+            if state.as_compressed_state_json:
+                compressed_states[state.entity_id] = state.as_compressed_state
+        except (ValueError, TypeError):
+            connection.logger.error(
+                "Unable to serialize to JSON. Bad data found at %s",
+                format_unserializable_data(
+                    find_paths_unserializable_data(state, dump=JSON_DUMP)
+                ),
+            )
+    connection.send_message(
+        string_table.entities_event_message(
+            msg_id, {messages.ENTITY_EVENT_ADD: compressed_states}
+        )
+    )
+
+
 async def _async_get_all_descriptions_json(hass: HomeAssistant) -> bytes:
     """Return JSON of descriptions (i.e. user documentation) for all service calls."""
     descriptions = await async_get_all_descriptions(hass)
@@ -42,6 +42,7 @@ class ActiveConnection:
     __slots__ = (
         "binary_handlers",
         "can_coalesce",
+        "coalesce_window",
         "handlers",
         "hass",
         "last_id",
@@ -70,6 +71,8 @@ class ActiveConnection:
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        # Seconds to hold back messages after a write, 0 when disabled
+        self.coalesce_window: float = 0
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema | Literal[False]]] = (
             self.hass.data[const.DOMAIN]
@@ -85,6 +88,12 @@ class ActiveConnection:
         """Set supported features."""
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
+        window = features.get(const.FEATURE_COALESCE_WINDOW, 0)
+        self.coalesce_window = (
+            max(0, min(window, const.MAX_COALESCE_WINDOW)) / 1000
+            if self.can_coalesce
+            else 0
+        )
 
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
@@ -58,3 +58,11 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+# Clients that support coalesced messages can ask to hold back messages for
+# a window of up to MAX_COALESCE_WINDOW milliseconds after a write, state
+# changes of the same entity inside the window are merged.
+FEATURE_COALESCE_WINDOW = "coalesce_window"
+MAX_COALESCE_WINDOW: Final = 50
+# Messages are written without waiting for the end of the window once
+# this many bytes are pending.
+MAX_COALESCE_WINDOW_BYTES: Final = 65536
@@ -0,0 +1,326 @@
+"""Fan out state changes to the subscribe_entities subscriptions."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions import AbstractPermissions
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
+from homeassistant.util.hass_dict import HassKey
+
+from .messages import (
+    StringTable,
+    _partial_cached_state_diff_message,
+    _state_diff_event,
+    cached_state_diff_message,
+    event_message,
+    merged_state_diff_event,
+    message_to_json_bytes,
+)
+
+DATA_ENTITY_SUBSCRIPTION_HUB: HassKey[EntitySubscriptionHub] = HassKey(
+    "websocket_api_entity_subscription_hub"
+)
+
+
+class _UserEntityAccess:
+    """Entities a user is allowed to read.
+
+    The result of the permission check is kept per entity until the
+    permissions of the user or the entity and device registries change.
+    """
+
+    __slots__ = ("_allowed", "_permissions", "all_entities", "user", "users")
+
+    def __init__(self, user: User) -> None:
+        """Initialize the entity access."""
+        self.user = user
+        self.users = 0
+        self.all_entities = False
+        self._permissions: AbstractPermissions | None = None
+        self._allowed: dict[str, bool] = {}
+
+    @callback
+    def async_invalidate(self) -> None:
+        """Invalidate the entities the user is allowed to read."""
+        self._permissions = None
+
+    @callback
+    def async_check_entity(self, entity_id: str) -> bool:
+        """Return if the user is allowed to read the entity."""
+        user = self.user
+        # The permissions object of the user is replaced when its
+        # permissions change.
+        if (permissions := user.permissions) is not self._permissions:
+            self._permissions = permissions
+            self._allowed.clear()
+            self.all_entities = user.is_admin or permissions.access_all_entities(
+                POLICY_READ
+            )
+        if self.all_entities:
+            return True
+        if (allowed := self._allowed.get(entity_id)) is None:
+            allowed = self._allowed[entity_id] = permissions.check_entity(
+                entity_id, POLICY_READ
+            )
+        return allowed
+
+
+class _EntitySubscription:
+    """A subscribe_entities subscription of a connection."""
+
+    __slots__ = (
+        "access",
+        "coalesce_window",
+        "direct",
+        "entity_filter",
+        "entity_ids",
+        "flush_handle",
+        "last_sent",
+        "message_id",
+        "message_id_as_bytes",
+        "pending",
+        "replaced",
+        "send_message",
+        "string_table",
+    )
+
+    def __init__(
+        self,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        entity_ids: set[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+        access: _UserEntityAccess,
+        message_id: int,
+        coalesce_window: float,
+        string_table: StringTable | None,
+    ) -> None:
+        """Initialize the subscription."""
+        self.send_message = send_message
+        self.entity_ids = entity_ids
+        self.entity_filter = entity_filter
+        self.access = access
+        self.message_id = message_id
+        self.message_id_as_bytes = str(message_id).encode()
+        self.coalesce_window = coalesce_window
+        self.string_table = string_table
+        # Whether the shared serialized diff can be sent as is
+        self.direct = not coalesce_window and string_table is None
+        self.last_sent = 0.0
+        self.flush_handle: asyncio.TimerHandle | None = None
+        # Latest state change of each entity that is waiting for the
+        # coalesce window to pass
+        self.pending: dict[str, Event[EventStateChangedData]] = {}
+        # Entities in pending that changed more than once
+        self.replaced: set[str] = set()
+
+
+class EntitySubscriptionHub:
+    """Forward state changes to all subscribe_entities subscriptions.
+
+    A single state changed listener serializes the state diff once and
+    sends it to every subscription that matches the entity. Subscriptions
+    to specific entity ids are indexed by entity id so they are not
+    visited for other entities.
+
+    Subscriptions of connections with a coalesce window collect the state
+    changes that happen within the window after their last message and
+    send them as a single message. Subscriptions with a string table are
+    serialized on their own.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        self._all_entities: dict[_EntitySubscription, None] = {}
+        self._by_entity_id: dict[str, dict[_EntitySubscription, None]] = {}
+        self._access: dict[str, _UserEntityAccess] = {}
+        self._listeners: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_subscribe(
+        self,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        entity_ids: set[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+        user: User,
+        msg_id: int,
+        coalesce_window: float = 0,
+        string_table: StringTable | None = None,
+    ) -> CALLBACK_TYPE:
+        """Subscribe to state changes of entities the user is allowed to read."""
+        if (access := self._access.get(user.id)) is None or access.user is not user:
+            access = self._access[user.id] = _UserEntityAccess(user)
+        access.users += 1
+        subscription = _EntitySubscription(
+            send_message,
+            entity_ids,
+            entity_filter,
+            access,
+            msg_id,
+            coalesce_window,
+            string_table,
+        )
+        if entity_ids:
+            for entity_id in entity_ids:
+                self._by_entity_id.setdefault(entity_id, {})[subscription] = None
+        else:
+            self._all_entities[subscription] = None
+        if not self._listeners:
+            self._async_listen()
+        return lambda: self._async_unsubscribe(subscription)
+
+    @callback
+    def _async_unsubscribe(self, subscription: _EntitySubscription) -> None:
+        """Remove a subscription."""
+        if subscription.flush_handle is not None:
+            subscription.flush_handle.cancel()
+        if entity_ids := subscription.entity_ids:
+            by_entity_id = self._by_entity_id
+            for entity_id in entity_ids:
+                subscriptions = by_entity_id[entity_id]
+                del subscriptions[subscription]
+                if not subscriptions:
+                    del by_entity_id[entity_id]
+        else:
+            del self._all_entities[subscription]
+        access = subscription.access
+        access.users -= 1
+        if not access.users and self._access.get(access.user.id) is access:
+            del self._access[access.user.id]
+        if not self._all_entities and not self._by_entity_id:
+            for unsub in self._listeners:
+                unsub()
+            self._listeners.clear()
+
+    @callback
+    def _async_listen(self) -> None:
+        """Listen for state changes and changes that affect permissions."""
+        bus = self.hass.bus
+        self._listeners = [
+            bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed),
+            # Entity permissions can be granted by device or area
+            bus.async_listen(
+                EVENT_ENTITY_REGISTRY_UPDATED, self._async_invalidate_access
+            ),
+            bus.async_listen(
+                EVENT_DEVICE_REGISTRY_UPDATED, self._async_invalidate_access
+            ),
+        ]
+
+    @callback
+    def _async_invalidate_access(self, event: Event[Any]) -> None:
+        """Invalidate the entities the users are allowed to read."""
+        for access in self._access.values():
+            access.async_invalidate()
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Forward a state change to the matching subscriptions."""
+        entity_id = event.data["entity_id"]
+        subscriptions = self._by_entity_id.get(entity_id)
+        if not subscriptions and not self._all_entities:
+            return
+        # The diff is serialized once, only the id differs per subscription
+        message = _partial_cached_state_diff_message(event)[:-1]
+        # Iterate over a copy as sending can end a subscription
+        for subscription in (*(subscriptions or ()), *self._all_entities):
+            if (
+                not (entity_filter := subscription.entity_filter)
+                or entity_filter(entity_id)
+            ) and subscription.access.async_check_entity(entity_id):
+                if not subscription.direct:
+                    self._async_coalesce_or_intern(subscription, event)
+                    continue
+                subscription.send_message(
+                    b"".join(
+                        (message, b',"id":', subscription.message_id_as_bytes, b"}")
+                    )
+                )
+
+    @callback
+    def _async_coalesce_or_intern(
+        self, subscription: _EntitySubscription, event: Event[EventStateChangedData]
+    ) -> None:
+        """Send a state change to a subscription that is not sent the shared diff.
+
+        The state change is held back when the coalesce window has not passed.
+        """
+        if subscription.flush_handle is None:
+            now = self.hass.loop.time()
+            if now - subscription.last_sent >= subscription.coalesce_window:
+                # Nothing was sent recently, send right away
+                subscription.last_sent = now
+                if subscription.string_table is None:
+                    subscription.send_message(
+                        cached_state_diff_message(
+                            subscription.message_id_as_bytes, event
+                        )
+                    )
+                else:
+                    self._async_send_entities_event(
+                        subscription, _state_diff_event(event)
+                    )
+                return
+            subscription.flush_handle = self.hass.loop.call_at(
+                subscription.last_sent + subscription.coalesce_window,
+                self._async_flush,
+                subscription,
+            )
+        entity_id = event.data["entity_id"]
+        if entity_id in subscription.pending:
+            subscription.replaced.add(entity_id)
+        subscription.pending[entity_id] = event
+
+    @callback
+    def _async_flush(self, subscription: _EntitySubscription) -> None:
+        """Send the state changes held back for a subscription."""
+        subscription.flush_handle = None
+        subscription.last_sent = self.hass.loop.time()
+        self._async_send_entities_event(
+            subscription,
+            merged_state_diff_event(
+                subscription.pending.values(), subscription.replaced
+            ),
+        )
+        subscription.pending.clear()
+        subscription.replaced.clear()
+
+    @callback
+    def _async_send_entities_event(
+        self, subscription: _EntitySubscription, entities_event: dict[str, Any]
+    ) -> None:
+        """Serialize and send an entities event for a single subscription."""
+        if (string_table := subscription.string_table) is not None:
+            subscription.send_message(
+                string_table.entities_event_message(
+                    subscription.message_id, entities_event
+                )
+            )
+            return
+        subscription.send_message(
+            message_to_json_bytes(
+                event_message(subscription.message_id, entities_event)
+            )
+        )
+
+
+@callback
+def async_get_entity_subscription_hub(hass: HomeAssistant) -> EntitySubscriptionHub:
+    """Return the entity subscription hub."""
+    if (hub := hass.data.get(DATA_ENTITY_SUBSCRIPTION_HUB)) is None:
+        hub = hass.data[DATA_ENTITY_SUBSCRIPTION_HUB] = EntitySubscriptionHub(hass)
+    return hub
@@ -24,6 +24,7 @@ from homeassistant.util.json import json_loads
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
     DATA_CONNECTIONS,
+    MAX_COALESCE_WINDOW_BYTES,
     MAX_PENDING_MSG,
     PENDING_MSG_MAX_FORCE_READY,
     PENDING_MSG_PEAK,
@@ -45,6 +46,12 @@ if TYPE_CHECKING:
 _WS_LOGGER: Final = logging.getLogger(f"{__name__}.connection")
 
 
+def _set_result_unless_done(future: asyncio.Future[None]) -> None:
+    """Set result of future unless it is done."""
+    if not future.done():
+        future.set_result(None)
+
+
 class WebsocketAPIView(HomeAssistantView):
     """View to serve a websockets endpoint."""
 
@@ -72,6 +79,8 @@ class WebSocketHandler:
     __slots__ = (
         "_authenticated",
         "_closing",
+        "_coalesce_window_bytes",
+        "_coalesce_window_future",
         "_connection",
         "_debug",
         "_handle_task",
@@ -108,6 +117,8 @@ class WebSocketHandler:
         self._message_queue: deque[bytes] = deque()
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        self._coalesce_window_future: asyncio.Future[None] | None = None
+        self._coalesce_window_bytes: int = 0
         self._async_logging_changed()
 
     @callback
@@ -146,6 +157,8 @@ class WebSocketHandler:
         loop = self._loop
         debug = logger.debug
         can_coalesce = connection.can_coalesce
+        coalesce_window = connection.coalesce_window
+        last_write = 0.0
         ready_message_count = len(message_queue)
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
@@ -160,6 +173,17 @@ class WebSocketHandler:
                 if not can_coalesce:
                     # coalesce may be enabled later in the connection
                     can_coalesce = connection.can_coalesce
+                    coalesce_window = connection.coalesce_window
+
+                if coalesce_window:
+                    # Hold back messages until the window after the last
+                    # write has passed, an idle connection writes right away.
+                    if (delay := last_write + coalesce_window - loop.time()) > 0:
+                        await self._async_wait_coalesce_window(delay)
+                        if self._closing:
+                            return
+                    last_write = loop.time()
+                    ready_message_count = len(message_queue)
 
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
@@ -183,6 +207,22 @@ class WebSocketHandler:
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
 
+    async def _async_wait_coalesce_window(self, delay: float) -> None:
+        """Wait for the coalesce window to pass.
+
+        Returns early when MAX_COALESCE_WINDOW_BYTES are pending.
+        """
+        self._coalesce_window_bytes = sum(map(len, self._message_queue))
+        if self._coalesce_window_bytes >= MAX_COALESCE_WINDOW_BYTES:
+            return
+        future = self._coalesce_window_future = self._loop.create_future()
+        handle = self._loop.call_later(delay, _set_result_unless_done, future)
+        try:
+            await future
+        finally:
+            handle.cancel()
+            self._coalesce_window_future = None
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
@@ -211,6 +251,10 @@ class WebSocketHandler:
 
         message_queue = self._message_queue
         message_queue.append(message)
+        if (window_future := self._coalesce_window_future) is not None:
+            self._coalesce_window_bytes += len(message)
+            if self._coalesce_window_bytes >= MAX_COALESCE_WINDOW_BYTES:
+                _set_result_unless_done(window_future)
         if (queue_size_after_add := len(message_queue)) >= MAX_PENDING_MSG:
             self._logger.error(
                 (
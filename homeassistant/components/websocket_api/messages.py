@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Container, Iterable
 from functools import lru_cache
 import logging
 from typing import Any, Final
@@ -43,6 +44,7 @@ STATE_DIFF_REMOVALS = "-"
 ENTITY_EVENT_ADD = "a"
 ENTITY_EVENT_REMOVE = "r"
 ENTITY_EVENT_CHANGE = "c"
+ENTITY_EVENT_STRINGS = "s"
 
 BASE_ERROR_MESSAGE = {
     "type": const.TYPE_RESULT,
@@ -177,6 +179,58 @@ def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> b
     )
 
 
+def merged_state_diff_event(
+    events: Iterable[Event[EventStateChangedData]],
+    replaced: Container[str],
+) -> dict[str, Any]:
+    """Convert the state changes of several entities to one minimal event.
+
+    Entities in replaced changed more than once since their last message,
+    their latest compressed state is sent instead of a diff. States that
+    cannot be serialized are left out so the other changes are still sent.
+    """
+    added: dict[str, CompressedState] = {}
+    changed: dict[str, Any] = {}
+    removed: list[str] = []
+    for event in events:
+        entity_id = event.data["entity_id"]
+        if entity_id in replaced:
+            if (new_state := event.data["new_state"]) is None:
+                removed.append(entity_id)
+                continue
+            try:
+                # Skip the states that cannot be serialized
+                if new_state.as_compressed_state_json:
+                    added[entity_id] = new_state.as_compressed_state
+            except (ValueError, TypeError):
+                _LOGGER.error(
+                    "Unable to serialize to JSON. Bad data found at %s",
+                    format_unserializable_data(
+                        find_paths_unserializable_data(new_state, dump=JSON_DUMP)
+                    ),
+                )
+            continue
+        # The diff is serialized, and logged if it cannot be, for the
+        # subscriptions which are sent the shared diff
+        if _partial_cached_state_diff_message(event) is INVALID_JSON_PARTIAL_MESSAGE:
+            continue
+        for key, value in _state_diff_event(event).items():
+            if key == ENTITY_EVENT_REMOVE:
+                removed.extend(value)
+            elif key == ENTITY_EVENT_ADD:
+                added.update(value)
+            else:
+                changed.update(value)
+    merged: dict[str, Any] = {}
+    if added:
+        merged[ENTITY_EVENT_ADD] = added
+    if changed:
+        merged[ENTITY_EVENT_CHANGE] = changed
+    if removed:
+        merged[ENTITY_EVENT_REMOVE] = removed
+    return merged
+
+
 def _state_diff_event(
     event: Event[EventStateChangedData],
 ) -> dict[
@@ -238,6 +292,90 @@ def _state_diff_event(
     return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
 
 
+class StringTable:
+    """Replace entity ids and attribute keys with indexes into a string table.
+
+    Strings are added to the table the first time they are used and sent
+    in the "s" list of that event. The index of a string is its position
+    in all "s" lists received for the subscription so far.
+    """
+
+    __slots__ = ("_indexes", "_new")
+
+    def __init__(self) -> None:
+        """Initialize the string table."""
+        self._indexes: dict[str, int] = {}
+        self._new: list[str] = []
+
+    def _index(self, string: str) -> int:
+        """Return the index of a string and add it if it is new."""
+        if (index := self._indexes.get(string)) is None:
+            index = self._indexes[string] = len(self._indexes)
+            self._new.append(string)
+        return index
+
+    def _intern_state(self, state: dict[str, Any]) -> dict[str, Any]:
+        """Replace the attribute keys of a compressed state or diff."""
+        if not (attributes := state.get(COMPRESSED_STATE_ATTRIBUTES)):
+            return state
+        index = self._index
+        return {
+            **state,
+            COMPRESSED_STATE_ATTRIBUTES: {
+                index(key): value for key, value in attributes.items()
+            },
+        }
+
+    def intern_entities_event(self, event: dict[str, Any]) -> dict[str, Any]:
+        """Replace the strings of an entities event with their index."""
+        index = self._index
+        intern_state = self._intern_state
+        interned: dict[str, Any] = {}
+        if added := event.get(ENTITY_EVENT_ADD):
+            interned[ENTITY_EVENT_ADD] = {
+                index(entity_id): intern_state(state)
+                for entity_id, state in added.items()
+            }
+        if changed := event.get(ENTITY_EVENT_CHANGE):
+            interned_changed: dict[int, dict[str, Any]] = {}
+            for entity_id, diff in changed.items():
+                interned_diff = {
+                    STATE_DIFF_ADDITIONS: intern_state(diff[STATE_DIFF_ADDITIONS])
+                }
+                if removals := diff.get(STATE_DIFF_REMOVALS):
+                    interned_diff[STATE_DIFF_REMOVALS] = {
+                        COMPRESSED_STATE_ATTRIBUTES: [
+                            index(key) for key in removals[COMPRESSED_STATE_ATTRIBUTES]
+                        ]
+                    }
+                interned_changed[index(entity_id)] = interned_diff
+            interned[ENTITY_EVENT_CHANGE] = interned_changed
+        if removed := event.get(ENTITY_EVENT_REMOVE):
+            interned[ENTITY_EVENT_REMOVE] = [index(entity_id) for entity_id in removed]
+        if self._new:
+            interned[ENTITY_EVENT_STRINGS] = self._new
+            self._new = []
+        return interned
+
+    def entities_event_message(self, msg_id: int, event: dict[str, Any]) -> bytes:
+        """Serialize an entities event message with interned strings.
+
+        The strings added by the event are removed from the table again if
+        the message cannot be serialized, as the client is sent an error
+        instead and never learns them.
+        """
+        interned = self.intern_entities_event(event)
+        if (
+            message := _message_to_json_bytes_or_none(event_message(msg_id, interned))
+        ) is not None:
+            return message
+        for string in interned.get(ENTITY_EVENT_STRINGS, ()):
+            del self._indexes[string]
+        return json_bytes(
+            error_message(msg_id, const.ERR_UNKNOWN_ERROR, "Invalid JSON in response")
+        )
+
+
 def _message_to_json_bytes_or_none(message: dict[str, Any]) -> bytes | None:
     """Serialize a websocket message to json or return None."""
     try:
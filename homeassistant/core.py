@@ -131,6 +131,20 @@ DOMAIN = "homeassistant"
 # How long to wait to log tasks that are blocking
 BLOCK_LOG_TIMEOUT = 60
 
+# Number of threads importing integrations at the same time
+IMPORT_EXECUTOR_WORKERS = 4
+
+# Cached properties of a State that hold last_reported
+_STATE_LAST_REPORTED_CACHE_KEYS = (
+    "_as_dict",
+    "_as_read_only_dict",
+    "as_dict_json",
+    "json_fragment",
+)
+
+# Number of removed entities the state change log keeps track of
+MAX_STATE_CHANGE_LOG_REMOVED = 4096
+
 type ServiceResponse = JsonObjectType | None
 type EntityServiceResponse = dict[str, ServiceResponse]
 
@@ -448,7 +462,7 @@ class HomeAssistant:
         self._stop_future: concurrent.futures.Future[None] | None = None
         self._shutdown_jobs: list[HassJobWithArgs] = []
         self.import_executor = InterruptibleThreadPoolExecutor(
-            max_workers=1, thread_name_prefix="ImportExecutor"
+            max_workers=IMPORT_EXECUTOR_WORKERS, thread_name_prefix="ImportExecutor"
         )
         self.loop_thread_id = self.loop._thread_id  # type: ignore[attr-defined] # noqa: SLF001
 
@@ -2018,12 +2032,16 @@ class States(UserDict[str, State]):
 
     Maintains an additional index:
     - domain -> dict[str, State]
+
+    Immutable snapshots of the states of a domain are cached until a
+    state of that domain is added, replaced or removed.
     """
 
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
         self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
+        self._domain_snapshots: dict[str, tuple[State, ...]] = {}
 
     def values(self) -> ValuesView[State]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -2033,12 +2051,26 @@ class States(UserDict[str, State]):
         """Add an item."""
         self.data[key] = entry
         self._domain_index[entry.domain][entry.entity_id] = entry
+        if self._domain_snapshots:
+            self._domain_snapshots.pop(entry.domain, None)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         del self._domain_index[entry.domain][entry.entity_id]
         super().__delitem__(key)
+        if self._domain_snapshots:
+            self._domain_snapshots.pop(entry.domain, None)
+
+    def domain_snapshot(self, key: str) -> tuple[State, ...]:
+        """Get an immutable snapshot of all states for a domain."""
+        if (snapshot := self._domain_snapshots.get(key)) is not None:
+            return snapshot
+        # Avoid polluting _domain_index with non-existing domains
+        if key not in self._domain_index:
+            return ()
+        snapshot = self._domain_snapshots[key] = tuple(self._domain_index[key].values())
+        return snapshot
 
     def domain_entity_ids(self, key: str) -> KeysView[str] | tuple[()]:
         """Get all entity_ids for a domain."""
@@ -2058,7 +2090,16 @@ class States(UserDict[str, State]):
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_bus", "_loop", "_reservations", "_states", "_states_data")
+    __slots__ = (
+        "_bus",
+        "_change_log",
+        "_change_log_start",
+        "_loop",
+        "_reservations",
+        "_states",
+        "_states_data",
+        "version",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2069,6 +2110,14 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        # The version increases with every change of a state. It starts at the
+        # current time in microseconds so versions from before a restart are
+        # older than any version after it.
+        self.version = time.time_ns() // 1000
+        # The version of the last change of each entity, ordered by version.
+        # Changes up to _change_log_start are no longer in the log.
+        self._change_log: dict[str, int] = {}
+        self._change_log_start = self.version
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2139,6 +2188,31 @@ class StateMachine:
             states.extend(self._states.domain_states(domain))
         return states
 
+    @callback
+    def async_snapshot(
+        self, domain_filter: str | Iterable[str] | None = None
+    ) -> tuple[State, ...]:
+        """Return an immutable snapshot of all states matching the filter.
+
+        Snapshots of a domain are shared between callers and are only
+        rebuilt after a state of that domain has changed, which makes them
+        cheap for callers that repeatedly read a domain that rarely changes.
+        The snapshot of all states is not cached since any state write would
+        invalidate it.
+
+        This method must be run in the event loop.
+        """
+        if domain_filter is None:
+            return tuple(self._states.values())
+
+        if isinstance(domain_filter, str):
+            return self._states.domain_snapshot(domain_filter.lower())
+
+        states: list[State] = []
+        for domain in domain_filter:
+            states.extend(self._states.domain_snapshot(domain))
+        return tuple(states)
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
@@ -2181,6 +2255,12 @@ class StateMachine:
             return False
 
         old_state.expire()
+        self._async_log_change(entity_id)
+        change_log = self._change_log
+        if len(change_log) > len(self._states_data) + MAX_STATE_CHANGE_LOG_REMOVED:
+            # Drop the oldest change to keep the log bounded
+            oldest = next(iter(change_log))
+            self._change_log_start = change_log.pop(oldest)
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
@@ -2193,6 +2273,38 @@ class StateMachine:
         )
         return True
 
+    @callback
+    def _async_log_change(self, entity_id: str) -> None:
+        """Increase the version and log the change of an entity."""
+        self.version += 1
+        change_log = self._change_log
+        # Remove first so the entity moves to the end of the log
+        change_log.pop(entity_id, None)
+        change_log[entity_id] = self.version
+
+    @callback
+    def async_changes_since(self, version: int) -> tuple[list[State], list[str]] | None:
+        """Return the states changed and entity ids removed after a version.
+
+        Returns None if the changes are no longer known, callers should
+        fetch all states instead.
+
+        This method must be run in the event loop.
+        """
+        if version < self._change_log_start or version > self.version:
+            return None
+        changed: list[State] = []
+        removed: list[str] = []
+        states_data = self._states_data
+        for entity_id, changed_version in reversed(self._change_log.items()):
+            if changed_version <= version:
+                break
+            if (state := states_data.get(entity_id)) is None:
+                removed.append(entity_id)
+            else:
+                changed.append(state)
+        return changed, removed
+
     def set(
         self,
         entity_id: str,
@@ -2334,7 +2446,16 @@ class StateMachine:
             # mypy does not understand this is only possible if old_state is not None
             old_last_reported = old_state.last_reported  # type: ignore[union-attr]
             old_state.last_reported = now  # type: ignore[union-attr]
-            old_state._cache["last_reported_timestamp"] = timestamp  # type: ignore[union-attr] # noqa: SLF001
+            cache = old_state._cache  # type: ignore[union-attr] # noqa: SLF001
+            cache["last_reported_timestamp"] = timestamp
+            # The dict and JSON representations hold last_reported
+            for key in _STATE_LAST_REPORTED_CACHE_KEYS:
+                cache.pop(key, None)
+            # last_reported changed, so the state is logged as changed as well
+            self.version = version = self.version + 1
+            change_log = self._change_log
+            change_log.pop(entity_id, None)
+            change_log[entity_id] = version
             # Avoid creating an EventStateReportedData
             self._bus.async_fire_internal(  # type: ignore[misc]
                 EVENT_STATE_REPORTED,
@@ -2380,6 +2501,11 @@ class StateMachine:
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
+        # Inlined _async_log_change as this is the hot path
+        self.version = version = self.version + 1
+        change_log = self._change_log
+        change_log.pop(entity_id, None)
+        change_log[entity_id] = version
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
@@ -10,7 +10,7 @@ timer.
 
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import UserDict, defaultdict
 from collections.abc import Callable, Hashable, KeysView, Mapping
 from datetime import datetime, timedelta
 from enum import StrEnum
@@ -780,10 +780,119 @@ def _validate_item(
         )
 
 
+def _deleted_entry_from_storage(entity: dict[str, Any]) -> DeletedRegistryEntry:
+    """Create a deleted registry entry from its stored data."""
+    return DeletedRegistryEntry(
+        aliases=set(entity["aliases"]),
+        area_id=entity["area_id"],
+        categories=entity["categories"],
+        config_entry_id=entity["config_entry_id"],
+        config_subentry_id=entity["config_subentry_id"],
+        created_at=datetime.fromisoformat(entity["created_at"]),
+        device_class=entity["device_class"],
+        disabled_by=(
+            RegistryEntryDisabler(entity["disabled_by"])
+            if entity["disabled_by"]
+            else None
+        ),
+        entity_id=entity["entity_id"],
+        hidden_by=(
+            RegistryEntryHider(entity["hidden_by"]) if entity["hidden_by"] else None
+        ),
+        icon=entity["icon"],
+        id=entity["id"],
+        labels=set(entity["labels"]),
+        modified_at=datetime.fromisoformat(entity["modified_at"]),
+        name=entity["name"],
+        options=entity["options"],
+        orphaned_timestamp=entity["orphaned_timestamp"],
+        platform=entity["platform"],
+        unique_id=entity["unique_id"],
+    )
+
+
+class DeletedRegistryItems(UserDict[tuple[str, str, str], DeletedRegistryEntry]):
+    """Container for deleted entity registry items.
+
+    Maps (domain, platform, unique_id) -> entry.
+
+    Entries loaded from storage are kept as their stored data until they
+    are accessed, since most deleted entries are never looked at again.
+    The serialized entries are cached until the container is modified so
+    saving the registry does not serialize them again.
+    """
+
+    data: dict[tuple[str, str, str], DeletedRegistryEntry | dict[str, Any]]  # type: ignore[assignment]
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        self._generation = 0
+        self._storage_fragment: tuple[int, json_fragment] | None = None
+
+    def __getitem__(self, key: tuple[str, str, str]) -> DeletedRegistryEntry:
+        """Return an entry, creating it from its stored data if needed."""
+        entry = self.data[key]
+        if type(entry) is dict:
+            entry = self.data[key] = _deleted_entry_from_storage(entry)
+        return entry  # type: ignore[return-value]
+
+    def __setitem__(
+        self, key: tuple[str, str, str], entry: DeletedRegistryEntry
+    ) -> None:
+        """Add an entry."""
+        self.data[key] = entry
+        self._generation += 1
+
+    def __delitem__(self, key: tuple[str, str, str]) -> None:
+        """Remove an entry."""
+        del self.data[key]
+        self._generation += 1
+
+    def add_stored(self, key: tuple[str, str, str], entity: dict[str, Any]) -> None:
+        """Add an entry from its stored data without creating it."""
+        self.data[key] = entity
+        self._generation += 1
+
+    def field_values(self, name: str) -> list[tuple[tuple[str, str, str], Any]]:
+        """Return the value of a field of all entries.
+
+        Entries that are still kept as their stored data are read without
+        creating them, so callers can find the few entries they need to
+        change without creating all of them.
+        """
+        return [
+            (key, entry[name] if type(entry) is dict else getattr(entry, name))
+            for key, entry in self.data.items()
+        ]
+
+    @property
+    def as_storage_fragment(self) -> json_fragment:
+        """Return a json fragment of all entries for storage.
+
+        This is called from the executor when the registry is saved. The
+        fragment is only cached together with the generation it was created
+        from, so a change made in the meantime is never lost.
+        """
+        generation = self._generation
+        if (cached := self._storage_fragment) is not None and cached[0] == generation:
+            return cached[1]
+        fragment = json_fragment(
+            json_bytes(
+                [
+                    entry if type(entry) is dict else entry.as_storage_fragment  # type: ignore[union-attr]
+                    for entry in list(self.data.values())
+                ]
+            )
+        )
+        self._storage_fragment = (generation, fragment)
+        return fragment
+
+
 class EntityRegistry(BaseRegistry):
     """Class to hold a registry of entities."""
 
-    deleted_entities: dict[tuple[str, str, str], DeletedRegistryEntry]
+    deleted_entities: DeletedRegistryItems
     entities: EntityRegistryItems
     _entities_data: dict[str, RegistryEntry]
 
@@ -1418,7 +1527,7 @@ class EntityRegistry(BaseRegistry):
 
         data = await self._store.async_load()
         entities = EntityRegistryItems()
-        deleted_entities: dict[tuple[str, str, str], DeletedRegistryEntry] = {}
+        deleted_entities = DeletedRegistryItems()
 
         if data is not None:
             for entity in data["entities"]:
@@ -1502,35 +1611,7 @@ class EntityRegistry(BaseRegistry):
                     entity["platform"],
                     entity["unique_id"],
                 )
-                deleted_entities[key] = DeletedRegistryEntry(
-                    aliases=set(entity["aliases"]),
-                    area_id=entity["area_id"],
-                    categories=entity["categories"],
-                    config_entry_id=entity["config_entry_id"],
-                    config_subentry_id=entity["config_subentry_id"],
-                    created_at=datetime.fromisoformat(entity["created_at"]),
-                    device_class=entity["device_class"],
-                    disabled_by=(
-                        RegistryEntryDisabler(entity["disabled_by"])
-                        if entity["disabled_by"]
-                        else None
-                    ),
-                    entity_id=entity["entity_id"],
-                    hidden_by=(
-                        RegistryEntryHider(entity["hidden_by"])
-                        if entity["hidden_by"]
-                        else None
-                    ),
-                    icon=entity["icon"],
-                    id=entity["id"],
-                    labels=set(entity["labels"]),
-                    modified_at=datetime.fromisoformat(entity["modified_at"]),
-                    name=entity["name"],
-                    options=entity["options"],
-                    orphaned_timestamp=entity["orphaned_timestamp"],
-                    platform=entity["platform"],
-                    unique_id=entity["unique_id"],
-                )
+                deleted_entities.add_stored(key, entity)
 
         self.deleted_entities = deleted_entities
         self.entities = entities
@@ -1541,9 +1622,7 @@ class EntityRegistry(BaseRegistry):
         """Return data of entity registry to store in a file."""
         return {
             "entities": [entry.as_storage_fragment for entry in self.entities.values()],
-            "deleted_entities": [
-                entry.as_storage_fragment for entry in self.deleted_entities.values()
-            ],
+            "deleted_entities": self.deleted_entities.as_storage_fragment,
         }
 
     @callback
@@ -1556,10 +1635,13 @@ class EntityRegistry(BaseRegistry):
                 categories = entry.categories.copy()
                 del categories[scope]
                 self.async_update_entity(entity_id, categories=categories)
-        for key, deleted_entity in list(self.deleted_entities.items()):
+        for key, deleted_categories in self.deleted_entities.field_values(
+            "categories"
+        ):
             if (
-                existing_category_id := deleted_entity.categories.get(scope)
+                existing_category_id := deleted_categories.get(scope)
             ) and category_id == existing_category_id:
+                deleted_entity = self.deleted_entities[key]
                 categories = deleted_entity.categories.copy()
                 del categories[scope]
                 self.deleted_entities[key] = attr.evolve(
@@ -1572,9 +1654,10 @@ class EntityRegistry(BaseRegistry):
         """Clear label from registry entries."""
         for entry in self.entities.get_entries_for_label(label_id):
             self.async_update_entity(entry.entity_id, labels=entry.labels - {label_id})
-        for key, deleted_entity in list(self.deleted_entities.items()):
-            if label_id not in deleted_entity.labels:
+        for key, deleted_labels in self.deleted_entities.field_values("labels"):
+            if label_id not in deleted_labels:
                 continue
+            deleted_entity = self.deleted_entities[key]
             self.deleted_entities[key] = attr.evolve(
                 deleted_entity, labels=deleted_entity.labels - {label_id}
             )
@@ -1589,10 +1672,13 @@ class EntityRegistry(BaseRegistry):
             for entry in self.entities.get_entries_for_config_entry_id(config_entry_id)
         ]:
             self.async_remove(entity_id)
-        for key, deleted_entity in list(self.deleted_entities.items()):
-            if config_entry_id != deleted_entity.config_entry_id:
+        for key, deleted_config_entry_id in self.deleted_entities.field_values(
+            "config_entry_id"
+        ):
+            if config_entry_id != deleted_config_entry_id:
                 continue
             # Add a time stamp when the deleted entity became orphaned
+            deleted_entity = self.deleted_entities[key]
             self.deleted_entities[key] = attr.evolve(
                 deleted_entity, orphaned_timestamp=now_time, config_entry_id=None
             )
@@ -1610,10 +1696,13 @@ class EntityRegistry(BaseRegistry):
             if entry.config_subentry_id == config_subentry_id
         ]:
             self.async_remove(entity_id)
-        for key, deleted_entity in list(self.deleted_entities.items()):
-            if config_subentry_id != deleted_entity.config_subentry_id:
+        for key, deleted_config_subentry_id in self.deleted_entities.field_values(
+            "config_subentry_id"
+        ):
+            if config_subentry_id != deleted_config_subentry_id:
                 continue
             # Add a time stamp when the deleted entity became orphaned
+            deleted_entity = self.deleted_entities[key]
             self.deleted_entities[key] = attr.evolve(
                 deleted_entity,
                 orphaned_timestamp=now_time,
@@ -1630,12 +1719,14 @@ class EntityRegistry(BaseRegistry):
         growing without bound.
         """
         now_time = time.time()
-        for key, deleted_entity in list(self.deleted_entities.items()):
-            if (orphaned_timestamp := deleted_entity.orphaned_timestamp) is None:
+        for key, orphaned_timestamp in self.deleted_entities.field_values(
+            "orphaned_timestamp"
+        ):
+            if orphaned_timestamp is None:
                 continue
 
             if orphaned_timestamp + ORPHANED_ENTITY_KEEP_SECONDS < now_time:
-                self.deleted_entities.pop(key)
+                del self.deleted_entities[key]
                 self.async_schedule_save()
 
     @callback
@@ -1643,10 +1734,12 @@ class EntityRegistry(BaseRegistry):
         """Clear area id from registry entries."""
         for entry in self.entities.get_entries_for_area_id(area_id):
             self.async_update_entity(entry.entity_id, area_id=None)
-        for key, deleted_entity in list(self.deleted_entities.items()):
-            if deleted_entity.area_id != area_id:
+        for key, deleted_area_id in self.deleted_entities.field_values("area_id"):
+            if deleted_area_id != area_id:
                 continue
-            self.deleted_entities[key] = attr.evolve(deleted_entity, area_id=None)
+            self.deleted_entities[key] = attr.evolve(
+                self.deleted_entities[key], area_id=None
+            )
             self.async_schedule_save()
 
 
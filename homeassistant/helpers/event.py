@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
+from collections.abc import Callable, Collection, Coroutine, Iterable, Mapping, Sequence
 import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -80,6 +80,8 @@ _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
 
+_SENTINEL = object()
+
 _LOGGER = logging.getLogger(__name__)
 
 # Used to spread async_track_utc_time_change listeners and DataUpdateCoordinator
@@ -1974,16 +1976,50 @@ def _event_triggers_rerender(
 ) -> bool:
     """Determine if a template should be re-rendered from an event."""
     entity_id = event.data["entity_id"]
+    new_state = event.data["new_state"]
+    old_state = event.data["old_state"]
 
     if info.filter(entity_id):
-        return True
+        if (
+            new_state is None
+            or old_state is None
+            or entity_id not in info.entity_fields
+        ):
+            return True
+        return _state_fields_changed(
+            old_state,
+            new_state,
+            info.entity_fields[entity_id],
+            info.entity_attributes[entity_id],
+        )
 
-    if event.data["new_state"] is not None and event.data["old_state"] is not None:
+    if new_state is not None and old_state is not None:
         return False
 
     return bool(info.filter_lifecycle(entity_id))
 
 
+@callback
+def _state_fields_changed(
+    old_state: State,
+    new_state: State,
+    fields: Collection[str],
+    attributes: Collection[str],
+) -> bool:
+    """Determine if any of the fields or attributes read by a template changed."""
+    if "state" in fields and old_state.state != new_state.state:
+        return True
+    if "last_changed" in fields and old_state.last_changed != new_state.last_changed:
+        return True
+    old_attributes = old_state.attributes
+    new_attributes = new_state.attributes
+    return any(
+        old_attributes.get(attribute, _SENTINEL)
+        != new_attributes.get(attribute, _SENTINEL)
+        for attribute in attributes
+    )
+
+
 @callback
 def _rate_limit_for_event(
     event: Event[EventStateChangedData],
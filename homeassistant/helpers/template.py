@@ -5,6 +5,7 @@ from __future__ import annotations
 from ast import literal_eval
 import asyncio
 import base64
+import collections
 import collections.abc
 from collections.abc import Callable, Generator, Iterable, MutableSequence
 from contextlib import AbstractContextManager
@@ -15,6 +16,7 @@ from functools import cache, lru_cache, partial, wraps
 import hashlib
 import json
 import logging
+import marshal
 import math
 from operator import contains
 import pathlib
@@ -23,6 +25,8 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+import threading
+from time import perf_counter
 from types import CodeType, TracebackType
 from typing import (
     TYPE_CHECKING,
@@ -59,6 +63,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__ as HA_VERSION,
 )
 from homeassistant.core import (
     Context,
@@ -95,6 +100,7 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .storage import Store
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -115,6 +121,12 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_COMPILE_CACHE: HassKey[TemplateCompileCache] = HassKey("template.compile_cache")
+
+COMPILE_CACHE_STORAGE_KEY = "core.template_compile_cache"
+COMPILE_CACHE_STORAGE_VERSION = 1
+COMPILE_CACHE_SIZE = 4096
+COMPILE_CACHE_SAVE_DELAY = 60
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -136,6 +148,9 @@ _COLLECTABLE_STATE_ATTRIBUTES = {
     "object_id",
     "name",
 }
+# State fields that are tracked individually so that a template is
+# only re-rendered when one of the fields it read changes.
+_FIELD_STATE_ATTRIBUTES = {"state", "last_changed"}
 
 ALL_STATES_RATE_LIMIT = 60  # seconds
 DOMAIN_STATES_RATE_LIMIT = 1  # seconds
@@ -391,6 +406,8 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "entity_attributes",
+        "entity_fields",
         "exception",
         "filter",
         "filter_lifecycle",
@@ -414,6 +431,10 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # Entities where only specific fields or attributes were read,
+        # entities in this mapping are merged into entities once frozen.
+        self.entity_fields: dict[str, collections.abc.Set[str]] = {}
+        self.entity_attributes: dict[str, collections.abc.Set[str]] = {}
         self.rate_limit: float | None = None
         self.has_time = False
 
@@ -426,6 +447,8 @@ class RenderInfo:
             f" domains={self.domains}"
             f" domains_lifecycle={self.domains_lifecycle}"
             f" entities={self.entities}"
+            f" entity_fields={self.entity_fields}"
+            f" entity_attributes={self.entity_attributes}"
             f" rate_limit={self.rate_limit}"
             f" has_time={self.has_time}"
             f" exception={self.exception}"
@@ -468,9 +491,31 @@ class RenderInfo:
         self.all_states = False
 
     def _freeze_sets(self) -> None:
-        self.entities = frozenset(self.entities)
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
+        if not self.entity_fields and not self.entity_attributes:
+            self.entities = frozenset(self.entities)
+            return
+        entity_fields = self.entity_fields
+        entity_attributes = self.entity_attributes
+        partial = (entity_fields.keys() | entity_attributes.keys()) - self.entities
+        self.entities = frozenset(self.entities | partial)
+        if self.all_states:
+            partial = set()
+        elif self.domains:
+            partial = {
+                entity_id
+                for entity_id in partial
+                if split_entity_id(entity_id)[0] not in self.domains
+            }
+        self.entity_fields = {
+            entity_id: frozenset(entity_fields.get(entity_id, ()))
+            for entity_id in partial
+        }
+        self.entity_attributes = {
+            entity_id: frozenset(entity_attributes.get(entity_id, ()))
+            for entity_id in partial
+        }
 
     def _freeze(self) -> None:
         self._freeze_sets()
@@ -512,6 +557,7 @@ class Template:
         "_hash_cache",
         "_limited",
         "_log_fn",
+        "_render_time",
         "_renders",
         "_strict",
         "hass",
@@ -548,6 +594,7 @@ class Template:
         self._log_fn: Callable[[int, str], None] | None = None
         self._hash_cache: int = hash(self.template)
         self._renders: int = 0
+        self._render_time: float = 0.0
 
     @property
     def _env(self) -> TemplateEnvironment:
@@ -637,10 +684,15 @@ class Template:
         if variables is not None:
             kwargs.update(variables)
 
+        # Keep track of the time spent rendering so templates
+        # that are expensive to re-render can be found
+        start = perf_counter()
         try:
             render_result = _render_with_context(self.template, compiled, **kwargs)
         except Exception as err:
             raise TemplateError(err) from err
+        finally:
+            self._render_time += perf_counter() - start
 
         if len(render_result) > MAX_TEMPLATE_OUTPUT:
             raise TemplateError(
@@ -699,12 +751,19 @@ class Template:
 
         def _render_template() -> None:
             assert self.hass is not None, "hass variable not set on template"
+            # Only the render itself is timed, not starting the thread
+            # or waiting for it
+            start = perf_counter()
             try:
                 _render_with_context(self.template, compiled, **kwargs)
             except TimeoutError:
+                # Renders stopped at the timeout are not timed
                 pass
             except Exception:  # noqa: BLE001
                 self._exc_info = sys.exc_info()
+                self._render_time += perf_counter() - start
+            else:
+                self._render_time += perf_counter() - start
             finally:
                 self.hass.loop.call_soon_threadsafe(finish_event.set)
 
@@ -734,7 +793,6 @@ class Template:
         """Render the template and collect an entity filter."""
         if self.hass and self.hass.config.debug:
             self.hass.verify_event_loop_thread("async_render_to_info")
-        self._renders += 1
 
         render_info = RenderInfo(self)
 
@@ -749,6 +807,8 @@ class Template:
             )
 
         if self.is_static:
+            # Non static templates are counted by async_render
+            self._renders += 1
             render_info._result = self.template.strip()  # noqa: SLF001
             render_info._freeze_static()  # noqa: SLF001
             return render_info
@@ -810,6 +870,7 @@ class Template:
         except JSON_DECODE_EXCEPTIONS:
             pass
 
+        start = perf_counter()
         try:
             render_result = _render_with_context(
                 self.template, compiled, **variables
@@ -823,6 +884,8 @@ class Template:
                     self.template,
                 )
             return value if error_value is _SENTINEL else error_value
+        finally:
+            self._render_time += perf_counter() - start
 
         if not parse_result or (self.hass and self.hass.config.legacy_templates):
             return render_result
@@ -1053,10 +1116,26 @@ class TemplateStateBase(State):
         if self._collect and (render_info := _render_info.get()):
             render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
 
+    def _collect_field(self, field: str) -> None:
+        """Collect a read of a single field of the state."""
+        if self._collect and (render_info := _render_info.get()):
+            fields = render_info.entity_fields.setdefault(self._entity_id, set())
+            fields.add(field)  # type: ignore[attr-defined]
+
+    def _get_attribute(self, name: str, default: Any = None) -> Any:
+        """Return a single attribute and only collect that attribute."""
+        if self._collect and (render_info := _render_info.get()):
+            names = render_info.entity_attributes.setdefault(self._entity_id, set())
+            names.add(name)  # type: ignore[attr-defined]
+        return self._state.attributes.get(name, default)
+
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item: str) -> Any:
         """Return a property as an attribute for jinja."""
+        if item in _FIELD_STATE_ATTRIBUTES:
+            self._collect_field(item)
+            return getattr(self._state, item)
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
             # _collect_state inlined here for performance
             if self._collect and (render_info := _render_info.get()):
@@ -1079,7 +1158,7 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_field("state")
         return self._state.state
 
     @property
@@ -1091,7 +1170,7 @@ class TemplateStateBase(State):
     @property
     def last_changed(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_changed."""
-        self._collect_state()
+        self._collect_field("last_changed")
         return self._state.last_changed
 
     @property
@@ -1222,7 +1301,7 @@ def _state_generator(
     if domain is None:
         container = states._states.values()  # noqa: SLF001
     else:
-        container = states.async_all(domain)
+        container = states.async_snapshot(domain)
     for state in container:
         yield _template_state_no_collect(hass, state)
 
@@ -1922,7 +2001,7 @@ def is_state(hass: HomeAssistant, entity_id: str, state: str | list[str]) -> boo
 def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) -> bool:
     """Test if a state's attribute is a specific value."""
     if (state_obj := _get_state(hass, entity_id)) is not None:
-        attr = state_obj.attributes.get(name, _SENTINEL)
+        attr = state_obj._get_attribute(name, _SENTINEL)  # noqa: SLF001
         if attr is _SENTINEL:
             return False
         return bool(attr == value)
@@ -1932,7 +2011,7 @@ def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) ->
 def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
     if (state_obj := _get_state(hass, entity_id)) is not None:
-        return state_obj.attributes.get(name)
+        return state_obj._get_attribute(name)  # noqa: SLF001
     return None
 
 
@@ -3037,6 +3116,117 @@ def _load_custom_templates(hass: HomeAssistant) -> dict[str, str]:
     return result
 
 
+async def async_load_compile_cache(hass: HomeAssistant) -> None:
+    """Load the compiled template code persisted by a previous run."""
+    compile_cache = TemplateCompileCache(hass)
+    await compile_cache.async_load()
+    hass.data[_COMPILE_CACHE] = compile_cache
+
+
+class TemplateCompileCache:
+    """A LRU cache of compiled template code that is persisted in storage.
+
+    The code is only valid for the Home Assistant, Jinja and Python
+    versions it was compiled with, the cache is discarded if any changes.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass, COMPILE_CACHE_STORAGE_VERSION, COMPILE_CACHE_STORAGE_KEY
+        )
+        self._version = (
+            f"{HA_VERSION}-{jinja2.__version__}-{sys.implementation.cache_tag}"
+        )
+        # Maps a hash of the source to the digest and base64 of the
+        # marshalled code, oldest first
+        self._entries: collections.OrderedDict[str, tuple[str, str]] = (
+            collections.OrderedDict()
+        )
+        # Templates can be compiled from other threads
+        self._lock = threading.Lock()
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """Load the cache from storage."""
+        if not (data := await self._store.async_load()):
+            return
+        if data.get("version") != self._version:
+            _LOGGER.debug("Discarding compiled templates of %s", data.get("version"))
+            return
+        with self._lock:
+            try:
+                self._entries.update(
+                    (key, (digest, encoded))
+                    for key, digest, encoded in data["templates"]
+                )
+            except (KeyError, TypeError, ValueError):
+                _LOGGER.warning("Discarding corrupt compiled template cache")
+                self._entries.clear()
+
+    def get(self, kind: str, source: str) -> CodeType | None:
+        """Return the cached code for a template source."""
+        key = self._key(kind, source)
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                return None
+            self._entries.move_to_end(key)
+        digest, encoded = entry
+        code: CodeType | None = None
+        try:
+            marshalled = base64.b64decode(encoded)
+        except (TypeError, ValueError):
+            pass
+        else:
+            # marshal is not safe against erroneous data, only code that
+            # is unchanged since it was marshalled is loaded
+            if hashlib.sha256(marshalled).hexdigest() == digest:
+                code = marshal.loads(marshalled)
+        if code is None:
+            _LOGGER.debug("Discarding corrupt compiled template: %s", source)
+            with self._lock:
+                self._entries.pop(key, None)
+            return None
+        return code
+
+    def put(self, kind: str, source: str, code: CodeType) -> None:
+        """Add the compiled code of a template source to the cache."""
+        key = self._key(kind, source)
+        marshalled = marshal.dumps(code)
+        entry = (
+            hashlib.sha256(marshalled).hexdigest(),
+            base64.b64encode(marshalled).decode(),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            while len(self._entries) > COMPILE_CACHE_SIZE:
+                self._entries.popitem(last=False)
+            if self._save_pending:
+                return
+            self._save_pending = True
+        self._hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @staticmethod
+    def _key(kind: str, source: str) -> str:
+        return hashlib.sha256(f"{kind}\0{source}".encode()).hexdigest()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        with self._lock:
+            self._save_pending = False
+        self._store.async_delay_save(self._data_to_save, COMPILE_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        with self._lock:
+            templates = [
+                [key, digest, encoded]
+                for key, (digest, encoded) in self._entries.items()
+            ]
+        return {"version": self._version, "templates": templates}
+
+
 @singleton(_HASS_LOADER)
 def _get_hass_loader(hass: HomeAssistant) -> HassLoader:
     return HassLoader({})
@@ -3083,6 +3273,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        self._compile_cache_kind = (
+            "limited" if limited else "strict" if strict else "default"
+        )
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3498,7 +3691,15 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (
+            self.hass is None
+            or not isinstance(source, str)
+            or (compile_cache := self.hass.data.get(_COMPILE_CACHE)) is None
+        ):
+            compiled = super().compile(source)
+        elif (compiled := compile_cache.get(self._compile_cache_kind, source)) is None:
+            compiled = super().compile(source)
+            compile_cache.put(self._compile_cache_kind, source, compiled)
         self.template_cache[source] = compiled
         return compiled
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import itertools
 import logging
+from time import perf_counter
 from typing import Any
 
 import jinja2
@@ -128,6 +129,7 @@ class ValueTemplate(Template):
 
         compiled = self._compiled or self._ensure_compiled()
 
+        start = perf_counter()
         try:
             render_result = _render_with_context(
                 self.template, compiled, **variables
@@ -137,6 +139,8 @@ class ValueTemplate(Template):
             logger = logging.getLogger(f"{__package__}.{entity_id.split('.')[0]}")
             logger.debug(message)
             return error_value
+        finally:
+            self._render_time += perf_counter() - start
 
         return render_result
 
@@ -7,6 +7,7 @@ documentation as possible to keep it understandable.
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import Callable, Iterable
 from contextlib import suppress
 from dataclasses import dataclass
@@ -134,6 +135,7 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_IMPORT_TIMINGS: HassKey[dict[str, float]] = HassKey("import_timings")
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -272,6 +274,7 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_IMPORT_TIMINGS] = {}
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -769,6 +772,7 @@ class Integration:
         self._component_future: asyncio.Future[ComponentProtocol] | None = None
         self._import_futures: dict[str, asyncio.Future[ModuleType]] = {}
         self._cache = hass.data[DATA_COMPONENTS]
+        self._import_timings = hass.data[DATA_IMPORT_TIMINGS]
         self._missing_platforms_cache = hass.data[DATA_MISSING_PLATFORMS]
         self._top_level_files = top_level_files or set()
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
@@ -1048,10 +1052,11 @@ class Integration:
         """Return the component."""
         cache = self._cache
         domain = self.domain
+        pkg_path = self.pkg_path
+        if not_imported := pkg_path not in sys.modules:
+            start = time.perf_counter()
         try:
-            cache[domain] = cast(
-                ComponentProtocol, importlib.import_module(self.pkg_path)
-            )
+            cache[domain] = cast(ComponentProtocol, importlib.import_module(pkg_path))
         except ImportError:
             raise
         except RuntimeError as err:
@@ -1063,6 +1068,9 @@ class Integration:
             )
             raise ImportError(f"Exception importing {self.pkg_path}") from err
 
+        if not_imported:
+            self._import_timings[pkg_path] = time.perf_counter() - start
+
         if preload_platforms:
             for platform_name in self.platforms_exists(self._platforms_to_preload):
                 with suppress(ImportError):
@@ -1246,6 +1254,9 @@ class Integration:
         """
         full_name = f"{self.domain}.{platform_name}"
         cache = self.hass.data[DATA_COMPONENTS]
+        module_name = f"{self.pkg_path}.{platform_name}"
+        if not_imported := module_name not in sys.modules:
+            start = time.perf_counter()
         try:
             cache[full_name] = self._import_platform(platform_name)
         except ModuleNotFoundError:
@@ -1271,6 +1282,9 @@ class Integration:
                 f"Exception importing {self.pkg_path}.{platform_name}"
             ) from err
 
+        if not_imported:
+            self._import_timings[module_name] = time.perf_counter() - start
+
         return cast(ModuleType, cache[full_name])
 
     def _import_platform(self, platform_name: str) -> ModuleType:
@@ -1420,6 +1434,80 @@ async def async_get_integrations(
     return results
 
 
+async def async_preload_components(
+    integrations: Iterable[Integration], max_jobs: int
+) -> None:
+    """Import the components of integrations ahead of setting them up.
+
+    A component is only scheduled once the components of its dependencies
+    and after dependencies are imported, so the import executor workers
+    import independent integrations instead of waiting on each other's
+    module locks. At most max_jobs components are imported at the same
+    time. Import errors are left for setup to report.
+    """
+    by_domain = {
+        integration.domain: integration
+        for integration in integrations
+        if integration.import_executor
+    }
+    # The dependencies of each component that are not imported yet
+    waiting_on = {
+        domain: {
+            dep
+            for dep in (*integration.dependencies, *integration.after_dependencies)
+            if dep in by_domain and dep != domain
+        }
+        for domain, integration in by_domain.items()
+    }
+    dependents: dict[str, list[str]] = {}
+    for domain, deps in waiting_on.items():
+        for dep in deps:
+            dependents.setdefault(dep, []).append(domain)
+    ready = deque(domain for domain, deps in waiting_on.items() if not deps)
+    running: set[asyncio.Task[str]] = set()
+
+    async def _async_preload(integration: Integration) -> str:
+        with suppress(ImportError):
+            await integration.async_get_component()
+        return integration.domain
+
+    while waiting_on or running:
+        if not ready and not running:
+            # Only components with circular after dependencies are left
+            ready.extend(waiting_on)
+        while ready and len(running) < max_jobs:
+            if (domain := ready.popleft()) not in waiting_on:
+                # Already scheduled as part of a circular dependency
+                continue
+            del waiting_on[domain]
+            running.add(
+                create_eager_task(
+                    _async_preload(by_domain[domain]),
+                    name=f"preload component {domain}",
+                )
+            )
+        if not running:
+            continue
+        done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            domain = task.result()
+            for dependent in dependents.pop(domain, ()):
+                if (deps := waiting_on.get(dependent)) is not None:
+                    deps.discard(domain)
+                    if not deps:
+                        ready.append(dependent)
+
+
+@callback
+def async_get_import_timings(hass: HomeAssistant) -> dict[str, float]:
+    """Return the time spent importing component and platform modules.
+
+    The time of a module includes the modules it imported that
+    were not imported yet.
+    """
+    return hass.data[DATA_IMPORT_TIMINGS]
+
+
 class _ResolveDependenciesCacheProtocol(Protocol):
     def get(self, itg: Integration) -> set[str] | Exception | None: ...
 
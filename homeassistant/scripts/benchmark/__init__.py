@@ -6,11 +6,14 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
 import logging
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 
 from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.auth.permissions import PolicyPermissions
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
@@ -308,3 +311,300 @@ async def json_serialize_states(hass: core.HomeAssistant) -> float:
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def compile_hourly_statistics(hass: core.HomeAssistant) -> float:
+    """Compile hourly statistics for 10k sensors from 5-minute statistics."""
+    from sqlalchemy import create_engine, insert  # noqa: PLC0415
+    from sqlalchemy.orm import Session  # noqa: PLC0415
+
+    from homeassistant.components.recorder import statistics  # noqa: PLC0415
+    from homeassistant.components.recorder.db_schema import (  # noqa: PLC0415
+        Base,
+        StatisticsMeta,
+        StatisticsShortTerm,
+    )
+
+    sensors = 10**4
+    start = statistics.get_start_time().replace(minute=0)
+    start_ts = start.timestamp()
+
+    def _compile() -> float:
+        # An in-memory SQLite database is only visible to the thread
+        # that created it, so everything runs in the same executor job.
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.execute(
+                insert(StatisticsMeta),
+                [
+                    {
+                        "id": idx + 1,
+                        "statistic_id": f"sensor.benchmark_{idx}",
+                        "source": "recorder",
+                        "has_sum": idx % 2 == 1,
+                        "mean_type": 1 if idx % 2 == 0 else 0,
+                    }
+                    for idx in range(sensors)
+                ],
+            )
+            session.execute(
+                insert(StatisticsShortTerm),
+                [
+                    {
+                        "metadata_id": idx + 1,
+                        "start_ts": start_ts + period * 300,
+                        "mean": float(period),
+                        "mean_weight": 1.0,
+                        "min": float(period),
+                        "max": float(period),
+                        "state": float(period),
+                        "sum": float(period),
+                    }
+                    for idx in range(sensors)
+                    for period in range(12)
+                ],
+            )
+            session.commit()
+
+            begin = timer()
+            statistics._compile_hourly_statistics(  # noqa: SLF001
+                session, start + timedelta(minutes=55)
+            )
+            session.commit()
+            runtime = timer() - begin
+        engine.dispose()
+        return runtime
+
+    return await hass.async_add_executor_job(_compile)
+
+
+@benchmark
+async def template_compile_cache(hass: core.HomeAssistant) -> float:
+    """Compile 4k templates with compiled code persisted by a previous run."""
+    from homeassistant.helpers import template  # noqa: PLC0415
+
+    sources = [
+        f"{{% if is_state('sensor.benchmark_{idx}', 'on') %}}"
+        f"{{{{ states('sensor.benchmark_{idx}') | float(0) * {idx} | round(2) }}}}"
+        f"{{% else %}}{{{{ state_attr('sensor.benchmark_{idx}', 'unit') }}}}"
+        "{% endif %}"
+        for idx in range(4000)
+    ]
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        await template.async_load_compile_cache(hass)
+        env = template.TemplateEnvironment(hass)
+        for source in sources:
+            env.compile(source)
+        await hass.async_block_till_done()
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+        # Simulate a restart by loading the cache from disk
+        # with an environment that has nothing compiled yet.
+        await template.async_load_compile_cache(hass)
+        env = template.TemplateEnvironment(hass)
+        start = timer()
+        for source in sources:
+            env.compile(source)
+        return timer() - start
+
+
+@benchmark
+async def mqtt_wildcard_dispatch(hass: core.HomeAssistant) -> float:
+    """Dispatch 10k MQTT messages with 10k wildcard subscriptions."""
+    from paho.mqtt.client import MQTTMessage  # noqa: PLC0415
+
+    from homeassistant.components.mqtt.client import MQTT  # noqa: PLC0415
+    from homeassistant.components.mqtt.models import MqttData  # noqa: PLC0415
+
+    count = 0
+    devices = 10**4
+
+    @core.callback
+    def listener(msg):
+        """Handle message."""
+        nonlocal count
+        count += 1
+
+    client = MQTT(hass, None, {})  # type: ignore[arg-type]
+    client._mqtt_data = MqttData(client, [])  # noqa: SLF001
+    for idx in range(devices):
+        client.async_subscribe(f"zigbee2mqtt/device_{idx}/+", listener, 0)
+    messages = []
+    for idx in range(devices):
+        msg = MQTTMessage(topic=f"zigbee2mqtt/device_{idx}/state".encode())
+        msg.payload = b"ON"
+        messages.append(msg)
+
+    start = timer()
+    for msg in messages:
+        client._async_mqtt_on_message(None, None, msg)  # noqa: SLF001
+    runtime = timer() - start
+
+    assert count == devices
+    client.cleanup()
+    return runtime
+
+
+@benchmark
+async def websocket_subscribe_entities_fanout(hass: core.HomeAssistant) -> float:
+    """Return the mean event to socket latency of 100 subscribe_entities clients."""
+    from homeassistant.auth.models import RefreshToken, User  # noqa: PLC0415
+    from homeassistant.components import websocket_api  # noqa: PLC0415
+    from homeassistant.components.websocket_api import commands  # noqa: PLC0415
+
+    websocket_api.async_register_command(hass, commands.handle_subscribe_entities)
+    entity_ids = [
+        f"{domain}.benchmark_{idx}"
+        for domain in ("light", "sensor")
+        for idx in range(500)
+    ]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "0")
+
+    last_sent = 0.0
+    sent = 0
+
+    def send_message(message):
+        """Record when a message was sent."""
+        nonlocal last_sent, sent
+        last_sent = timer()
+        sent += 1
+
+    logger = logging.getLogger(__name__)
+    for idx in range(100):
+        user = User(name=f"User {idx}", perm_lookup=None, is_owner=idx < 40)  # type: ignore[arg-type]
+        msg: dict = {"id": 1, "type": "subscribe_entities"}
+        if 40 <= idx < 80:
+            user.permissions = PolicyPermissions(  # type: ignore[misc]
+                {"entities": {"domains": {"light": True}}}, None
+            )
+        elif idx >= 80:
+            user.permissions = PolicyPermissions(  # type: ignore[misc]
+                {"entities": {"all": True}}, None
+            )
+            msg["entity_ids"] = entity_ids[idx::50]
+        connection = websocket_api.ActiveConnection(
+            logger,  # type: ignore[arg-type]
+            hass,
+            send_message,
+            user,
+            RefreshToken(user, None, timedelta(minutes=30)),
+        )
+        connection.async_handle(msg)
+
+    events = 10**4
+    total = 0.0
+    sent = 0
+    for idx in range(events):
+        start = timer()
+        hass.states.async_set(entity_ids[idx % len(entity_ids)], str(idx + 1))
+        total += last_sent - start
+
+    # 40 owners, 40 users allowed to read lights and 20 users subscribed
+    # to 19 entities each
+    assert sent == events * 60 + 3800
+    return total / events
+
+
+def _websocket_state_changed_events(hass: core.HomeAssistant) -> list[core.Event]:
+    """Return 10k state changed events of 1k sensors."""
+    events: list[core.Event] = []
+
+    @core.callback
+    def listener(event: core.Event) -> None:
+        """Capture the event."""
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    for idx in range(10**4):
+        hass.states.async_set(
+            f"sensor.living_room_multisensor_{idx % 1000}_temperature",
+            str(idx),
+            {
+                "state_class": "measurement",
+                "unit_of_measurement": "°C",
+                "device_class": "temperature",
+                "friendly_name": f"Living room multisensor {idx % 1000} temperature",
+                "last_reset_reason": f"reading {idx % 7}",
+            },
+        )
+    return events
+
+
+@benchmark
+async def websocket_state_diff_json(hass: core.HomeAssistant) -> float:
+    """Serialize 10k subscribe_entities state diffs as JSON."""
+    from homeassistant.components.websocket_api import messages  # noqa: PLC0415
+
+    events = _websocket_state_changed_events(hass)
+    start = timer()
+    size = sum(len(messages.cached_state_diff_message(b"1", event)) for event in events)
+    runtime = timer() - start
+    print(f"Serialized {len(events)} state diffs to {size} bytes")
+    return runtime
+
+
+@benchmark
+async def websocket_state_diff_interned(hass: core.HomeAssistant) -> float:
+    """Serialize 10k subscribe_entities state diffs with interned strings."""
+    from homeassistant.components.websocket_api import messages  # noqa: PLC0415
+
+    events = _websocket_state_changed_events(hass)
+    string_table = messages.StringTable()
+    start = timer()
+    size = sum(
+        len(
+            messages.message_to_json_bytes(
+                messages.event_message(
+                    1,
+                    string_table.intern_entities_event(
+                        messages._state_diff_event(event)  # noqa: SLF001
+                    ),
+                )
+            )
+        )
+        for event in events
+    )
+    runtime = timer() - start
+    print(f"Serialized {len(events)} state diffs to {size} bytes")
+    return runtime
+
+
+async def _quiet_domain_reads_under_writes(
+    hass: core.HomeAssistant, read: Callable[[], object]
+) -> float:
+    """Read a quiet domain while a busy domain is written to."""
+    for idx in range(50):
+        hass.states.async_set(f"light.benchmark_{idx}", "on")
+    sensors = [f"sensor.benchmark_{idx}" for idx in range(1000)]
+    for entity_id in sensors:
+        hass.states.async_set(entity_id, "0")
+
+    start = timer()
+    for value in range(10**4):
+        # Ten sensor updates for every read of the lights
+        for entity_id in sensors[value % 100 :: 100]:
+            hass.states.async_set(entity_id, str(value))
+        read()
+    return timer() - start
+
+
+@benchmark
+async def state_domain_snapshot(hass: core.HomeAssistant) -> float:
+    """Read a quiet domain snapshot 10k times while sensors are updated."""
+    return await _quiet_domain_reads_under_writes(
+        hass, lambda: hass.states.async_snapshot("light")
+    )
+
+
+@benchmark
+async def state_domain_async_all(hass: core.HomeAssistant) -> float:
+    """Read a quiet domain with async_all 10k times while sensors are updated."""
+    return await _quiet_domain_reads_under_writes(
+        hass, lambda: hass.states.async_all("light")
+    )
@@ -109,6 +109,7 @@ NO_IOT_CLASS = [
     "schedule",
     "script",
     "search",
+    "state_snapshot",
     "system_health",
     "system_log",
     "tag",
@@ -2272,6 +2272,7 @@ NO_QUALITY_SCALE = [
     "schedule",
     "script",
     "search",
+    "state_snapshot",
     "system_health",
     "system_log",
     "tag",
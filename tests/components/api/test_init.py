@@ -1,6 +1,7 @@
 """The tests for the Home Assistant API component."""
 
 import asyncio
+from datetime import timedelta
 from http import HTTPStatus
 import json
 from typing import Any
@@ -8,6 +9,7 @@ from unittest.mock import patch
 
 from aiohttp import ServerDisconnectedError, web
 from aiohttp.test_utils import TestClient
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 import voluptuous as vol
 
@@ -710,6 +712,94 @@ async def test_states(
     assert json[1]["entity_id"] == "test.entity2"
 
 
+async def test_states_etag_and_changes_since(
+    hass: HomeAssistant,
+    mock_api_client: TestClient,
+    hass_admin_user: MockUser,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test conditional requests and changes since a version."""
+    hass.states.async_set("test.entity", "hello")
+    hass.states.async_set("test.removed", "hello")
+    resp = await mock_api_client.get(const.URL_API_STATES)
+    assert resp.status == HTTPStatus.OK
+    etag = resp.headers["ETag"]
+    assert etag == f'"{hass.states.version}-admin"'
+    version = hass.states.version
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, params={"since": str(version)}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["ETag"] == etag
+    assert await resp.json() == {
+        "version": version,
+        "reset": False,
+        "changed": [],
+        "removed": [],
+    }
+
+    # Reported states change last_reported
+    last_reported = hass.states.get("test.entity").last_reported
+    freezer.tick(1)
+    hass.states.async_set("test.entity", "hello")
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, params={"since": str(version)}
+    )
+    json = await resp.json()
+    assert resp.headers["ETag"] != etag
+    assert [state["entity_id"] for state in json["changed"]] == ["test.entity"]
+    assert json["changed"][0]["last_reported"] == (
+        (last_reported + timedelta(seconds=1)).isoformat()
+    )
+    etag = resp.headers["ETag"]
+    version = hass.states.version
+
+    hass.states.async_set("test.entity", "world")
+    hass.states.async_set("test.new", "hello")
+    hass.states.async_remove("test.removed")
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["ETag"] != etag
+
+    resp = await mock_api_client.get(
+        const.URL_API_STATES, params={"since": str(version)}
+    )
+    json = await resp.json()
+    assert json["version"] == hass.states.version
+    assert json["reset"] is False
+    assert [state["entity_id"] for state in json["changed"]] == [
+        "test.new",
+        "test.entity",
+    ]
+    assert json["changed"][1]["state"] == "world"
+    assert json["removed"] == ["test.removed"]
+
+    # Versions that are not known return all states
+    resp = await mock_api_client.get(const.URL_API_STATES, params={"since": "1"})
+    json = await resp.json()
+    assert json["reset"] is True
+    assert len(json["changed"]) == 2
+    assert json["removed"] == []
+
+    resp = await mock_api_client.get(const.URL_API_STATES, params={"since": "invalid"})
+    assert resp.status == HTTPStatus.BAD_REQUEST
+
+    # Users that can not read all entities get their own ETag
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"test.entity": True}}})
+    resp = await mock_api_client.get(const.URL_API_STATES)
+    assert resp.headers["ETag"] == f'"{hass.states.version}-{hass_admin_user.id}-"'
+    assert [state["entity_id"] for state in await resp.json()] == ["test.entity"]
+
+
 async def test_states_view_filters(
     hass: HomeAssistant,
     hass_read_only_user: MockUser,
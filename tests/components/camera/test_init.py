@@ -3,6 +3,7 @@
 from collections.abc import Callable
 from http import HTTPStatus
 import io
+import logging
 from types import ModuleType
 from unittest.mock import ANY, AsyncMock, Mock, PropertyMock, mock_open, patch
 
@@ -692,6 +693,48 @@ async def test_camera_proxy_stream(hass_client: ClientSessionGenerator) -> None:
             assert response.status == HTTPStatus.BAD_GATEWAY
 
 
+@pytest.mark.usefixtures("mock_camera")
+async def test_camera_proxy_still_stream_shared(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test viewers of a still stream share the fetched images."""
+    client = await hass_client()
+    url = "/api/camera_proxy_stream/camera.demo_camera?interval=10"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"image",
+    ) as mock_image:
+        async with client.get(url) as response:
+            assert response.status == HTTPStatus.OK
+            assert b"image" in await response.content.readany()
+            async with client.get(url) as response2:
+                assert response2.status == HTTPStatus.OK
+                assert b"image" in await response2.content.readany()
+
+        assert mock_image.call_count == 1
+
+
+async def test_still_stream_fetch_error(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an error fetching an image is passed to the still stream viewers."""
+    error = HomeAssistantError("Camera is offline")
+    mock_camera = Mock(
+        hass=hass,
+        entity_id="camera.demo_camera",
+        async_camera_image=AsyncMock(side_effect=error),
+    )
+    caplog.set_level(logging.DEBUG)
+    still_stream = camera._SharedStillStream(mock_camera, 10)
+    queue = still_stream._async_subscribe()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert queue.get_nowait() is error
+    assert "Camera is offline" in caplog.text
+    assert "Traceback" not in caplog.text
+
+
 @pytest.mark.usefixtures("mock_camera")
 async def test_state_streaming(hass: HomeAssistant) -> None:
     """Camera state."""
@@ -543,6 +543,77 @@ async def test_history_stream_historical_only(
     }
 
 
+async def test_history_stream_historical_only_sent_in_chunks(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream sends a long historical period in chunks."""
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+
+    start_time = dt_util.utcnow() - timedelta(days=3)
+    first_time = start_time + timedelta(hours=1)
+    second_time = start_time + timedelta(days=2, hours=1)
+    with freeze_time(first_time):
+        hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+        await async_recorder_block_till_done(hass)
+    with freeze_time(second_time):
+        hass.states.async_set("sensor.one", "off", attributes={"any": "attr"})
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one"],
+            "start_time": start_time.isoformat(),
+            "end_time": end_time.isoformat(),
+            "include_start_time_state": False,
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["type"] == "result"
+
+    # The first day holds the first state
+    response = await client.receive_json()
+    assert response == {
+        "event": {
+            "end_time": pytest.approx(first_time.timestamp()),
+            "start_time": pytest.approx(start_time.timestamp()),
+            "states": {
+                "sensor.one": [{"lu": pytest.approx(first_time.timestamp()), "s": "on"}]
+            },
+        },
+        "id": 1,
+        "type": "event",
+    }
+
+    # The second day is empty and is not sent, the third day
+    # holds the second state
+    response = await client.receive_json()
+    assert response == {
+        "event": {
+            "end_time": pytest.approx(second_time.timestamp()),
+            "start_time": pytest.approx((start_time + timedelta(days=2)).timestamp()),
+            "states": {
+                "sensor.one": [
+                    {"lu": pytest.approx(second_time.timestamp()), "s": "off"}
+                ]
+            },
+        },
+        "id": 1,
+        "type": "event",
+    }
+
+
 async def test_history_stream_significant_domain_historical_only(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -14,16 +14,27 @@ import pytest
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt.client import RECONNECT_INTERVAL_SECONDS
-from homeassistant.components.mqtt.const import SUPPORTED_COMPONENTS
+from homeassistant.components.mqtt.const import (
+    CONF_COALESCE_STATE_WRITES,
+    SUPPORTED_COMPONENTS,
+)
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
 from homeassistant.const import (
     CONF_PROTOCOL,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     UnitOfTemperature,
 )
-from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    CoreState,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.dt import utcnow
 
@@ -2271,3 +2282,131 @@ async def test_loop_write_failure(
     await hass.async_block_till_done()
 
     assert "Error returned from MQTT server: The connection was lost." in caplog.text
+
+
+@pytest.mark.parametrize(
+    "hass_config",
+    [
+        {
+            mqtt.DOMAIN: {
+                "sensor": {"name": "test", "state_topic": "test-topic/sensor"},
+                "event": {
+                    "name": "test",
+                    "state_topic": "test-topic/event",
+                    "event_types": ["press"],
+                },
+            }
+        }
+    ],
+)
+@pytest.mark.parametrize(
+    ("mqtt_config_entry_options", "sensor_writes", "coalesced"),
+    [
+        ({CONF_COALESCE_STATE_WRITES: True}, 1, 2),
+        (None, 3, 0),
+    ],
+)
+async def test_coalesce_state_writes(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    sensor_writes: int,
+    coalesced: int,
+) -> None:
+    """Test state writes are coalesced for messages read in one pass."""
+    await mqtt_mock_entry()
+    state_changes: list[Event[EventStateChangedData]] = []
+
+    @callback
+    def _state_changed(event: Event[EventStateChangedData]) -> None:
+        state_changes.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _state_changed)
+
+    def _loop_read(max_packets: int) -> int:
+        for value in ("1", "2", "3"):
+            async_fire_mqtt_message(hass, "test-topic/sensor", value)
+            async_fire_mqtt_message(
+                hass,
+                "test-topic/event",
+                f'{{"event_type":"press","count":{value}}}',
+            )
+        return paho_mqtt.MQTT_ERR_SUCCESS
+
+    mqtt_data = hass.data["mqtt"]
+    mqtt_data.client._async_reader_callback(Mock(loop_read=_loop_read))
+    await hass.async_block_till_done()
+
+    sensor_states = [
+        event.data["new_state"].state
+        for event in state_changes
+        if event.data["entity_id"] == "sensor.test"
+    ]
+    assert len(sensor_states) == sensor_writes
+    assert sensor_states[-1] == "3"
+    # Events are never coalesced
+    assert (
+        len(
+            [
+                event
+                for event in state_changes
+                if event.data["entity_id"] == "event.test"
+            ]
+        )
+        == 3
+    )
+    assert mqtt_data.state_write_requests.coalesced == coalesced
+
+
+@pytest.mark.parametrize(
+    "hass_config",
+    [
+        {
+            mqtt.DOMAIN: {
+                "binary_sensor": {"name": "test", "state_topic": "test-topic/binary"},
+                "sensor": {
+                    "name": "test",
+                    "state_topic": "test-topic/sensor",
+                    "force_update": True,
+                },
+            }
+        }
+    ],
+)
+@pytest.mark.parametrize(
+    "mqtt_config_entry_options", [{CONF_COALESCE_STATE_WRITES: True}]
+)
+async def test_coalesce_state_writes_opt_in(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+) -> None:
+    """Test only platforms that opt in have their state writes coalesced."""
+    await mqtt_mock_entry()
+    state_changes: list[Event[EventStateChangedData]] = []
+
+    @callback
+    def _state_changed(event: Event[EventStateChangedData]) -> None:
+        state_changes.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _state_changed)
+
+    def _loop_read(max_packets: int) -> int:
+        for value in ("ON", "OFF"):
+            async_fire_mqtt_message(hass, "test-topic/binary", value)
+            async_fire_mqtt_message(hass, "test-topic/sensor", value)
+        return paho_mqtt.MQTT_ERR_SUCCESS
+
+    mqtt_data = hass.data["mqtt"]
+    mqtt_data.client._async_reader_callback(Mock(loop_read=_loop_read))
+    await hass.async_block_till_done()
+
+    def _states(entity_id: str) -> list[str]:
+        return [
+            event.data["new_state"].state
+            for event in state_changes
+            if event.data["entity_id"] == entity_id
+        ]
+
+    assert _states("binary_sensor.test") == ["on", "off"]
+    # Sensors with force update are not coalesced
+    assert _states("sensor.test") == ["ON", "OFF"]
+    assert mqtt_data.state_write_requests.coalesced == 0
@@ -38,6 +38,7 @@ async def test_entry_diagnostics(
 
     await get_diagnostics_for_config_entry(hass, hass_client, config_entry)
     assert await get_diagnostics_for_config_entry(hass, hass_client, config_entry) == {
+        "coalesced_state_writes": 0,
         "connected": True,
         "devices": [],
         "mqtt_config": {"data": default_entry_data, "options": default_entry_options},
@@ -123,6 +124,7 @@ async def test_entry_diagnostics(
     }
 
     assert await get_diagnostics_for_config_entry(hass, hass_client, config_entry) == {
+        "coalesced_state_writes": 0,
         "connected": True,
         "devices": [expected_device],
         "mqtt_config": {"data": default_entry_data, "options": default_entry_options},
@@ -259,6 +261,7 @@ async def test_redact_diagnostics(
 
     await get_diagnostics_for_config_entry(hass, hass_client, config_entry)
     assert await get_diagnostics_for_config_entry(hass, hass_client, config_entry) == {
+        "coalesced_state_writes": 0,
         "connected": True,
         "devices": [expected_device],
         "mqtt_config": expected_config,
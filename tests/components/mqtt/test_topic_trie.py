@@ -0,0 +1,68 @@
+"""Test the MQTT topic trie."""
+
+import pytest
+
+from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+
+@pytest.mark.parametrize(
+    ("topic_filter", "topic", "matches"),
+    [
+        ("a/b/c", "a/b/c", True),
+        ("a/b/c", "a/b", False),
+        ("a/+/c", "a/b/c", True),
+        ("a/+/c", "a/b/d", False),
+        ("a/+", "a/b/c", False),
+        ("a/#", "a/b/c", True),
+        ("a/#", "a", True),
+        ("a/#", "b/c", False),
+        ("+/+", "a/b", True),
+        ("+/+", "/b", True),
+        ("+", "a/b", False),
+        ("#", "a/b/c", True),
+        ("#", "$SYS/broker", False),
+        ("+/broker", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker", True),
+        ("$SYS/+", "$SYS/broker", True),
+        ("a//c", "a//c", True),
+        ("a/+/c", "a//c", True),
+    ],
+)
+def test_topic_trie_matches(topic_filter: str, topic: str, matches: bool) -> None:
+    """Test matching topics against topic filters."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add(topic_filter, "item")
+    assert trie.matches(topic) == (["item"] if matches else [])
+
+
+def test_topic_trie_order_and_remove() -> None:
+    """Test items are returned in the order they were added and can be removed."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add("home/#", "first")
+    trie.add("home/+/temperature", "second")
+    trie.add("#", "third")
+    trie.add("home/#", "fourth")
+
+    assert trie.matches("home/kitchen/temperature") == [
+        "first",
+        "second",
+        "third",
+        "fourth",
+    ]
+    assert trie.has_topic_filter("home/#")
+    assert not trie.has_topic_filter("home/+")
+
+    trie.remove("home/#", "first")
+    assert trie.has_topic_filter("home/#")
+    trie.remove("home/#", "fourth")
+    assert not trie.has_topic_filter("home/#")
+    assert trie.matches("home/kitchen/temperature") == ["second", "third"]
+
+    trie.remove("home/+/temperature", "second")
+    trie.remove("#", "third")
+    assert trie.matches("home/kitchen/temperature") == []
+    # Empty nodes are pruned
+    assert not trie._root.children
+
+    with pytest.raises(KeyError):
+        trie.remove("home/#", "first")
@@ -20,6 +20,8 @@ from homeassistant.components.profiler import (
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_CURRENT_TASKS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_IMPORT_TIMES,
+    SERVICE_LOG_TEMPLATE_RENDER_STATS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LRU_STATS,
     SERVICE_MEMORY,
@@ -34,6 +36,7 @@ from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.template import Template
 from homeassistant.util import dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -314,6 +317,96 @@ async def test_lru_stats(hass: HomeAssistant, caplog: pytest.LogCaptureFixture)
     assert "sqlalchemy_test" in caplog.text
 
 
+async def test_log_import_times(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test logging import times."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_LOG_IMPORT_TIMES)
+
+    with patch(
+        "homeassistant.components.profiler.async_get_import_timings",
+        return_value={
+            "homeassistant.components.slow": 2.0,
+            "homeassistant.components.fast": 0.5,
+        },
+    ):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_LOG_IMPORT_TIMES, {"max_modules": 1}, blocking=True
+        )
+
+    assert "Module homeassistant.components.slow imported in 2.000000s" in caplog.text
+    assert "homeassistant.components.fast" not in caplog.text
+    assert "Imported 2 integration modules in 2.500000s" in caplog.text
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_log_template_render_stats(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test logging template render stats."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_LOG_TEMPLATE_RENDER_STATS)
+
+    expensive = [Template("{{ states | count }}", hass) for _ in range(2)]
+    cheap = Template("{{ 1 + 1 }}", hass)
+    never_rendered = Template("{{ 2 + 2 }}", hass)
+    for template in expensive:
+        template.async_render_to_info()
+    cheap.async_render_to_info()
+    expensive[0]._render_time = 2.0
+    expensive[1]._render_time = 1.0
+    cheap._render_time = 0.5
+
+    with patch(
+        "objgraph.by_type",
+        return_value=[*expensive, cheap, never_rendered, object()],
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_LOG_TEMPLATE_RENDER_STATS,
+            {"max_templates": 1},
+            blocking=True,
+        )
+
+    assert (
+        "Template rendered 2 times by 2 instances in 3.000000s "
+        "(1.500000s per render): {{ states | count }}"
+    ) in caplog.text
+    assert "1 + 1" not in caplog.text
+    assert "2 + 2" not in caplog.text
+    caplog.clear()
+
+    with patch(
+        "objgraph.by_type",
+        return_value=[*expensive, cheap, never_rendered],
+    ):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_LOG_TEMPLATE_RENDER_STATS, blocking=True
+        )
+
+    assert "{{ states | count }}" in caplog.text
+    assert "{{ 1 + 1 }}" in caplog.text
+    assert "2 + 2" not in caplog.text
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
 async def test_log_object_sources(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
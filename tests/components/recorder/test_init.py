@@ -36,6 +36,7 @@ from homeassistant.components.recorder import (
 from homeassistant.components.recorder.const import (
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
+    DB_READ_WORKER_PREFIX,
     KEEPALIVE_TIME,
     SupportedDialect,
 )
@@ -233,6 +234,22 @@ async def test_shutdown_closes_connections(
         assert instance.get_session()
 
 
+async def test_read_executor_job(hass: HomeAssistant, setup_recorder: None) -> None:
+    """Test read only jobs run on the read workers."""
+    instance = recorder.get_instance(hass)
+    await instance.async_db_ready
+
+    def _read_states() -> tuple[str, int]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return threading.current_thread().name, session.query(States).count()
+
+    thread_name, count = await instance.async_add_read_executor_job(_read_states)
+    assert thread_name.startswith(DB_READ_WORKER_PREFIX)
+    assert count == 0
+    # Without a read replica the read workers use the database
+    assert instance.read_engine is None
+
+
 async def test_state_gets_saved_when_set_before_start_event(
     hass: HomeAssistant, async_setup_recorder_instance: RecorderInstanceGenerator
 ) -> None:
@@ -396,19 +413,16 @@ async def test_saving_state_with_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    def _throw_if_state_pending(*args, **kwargs):
+        if get_instance(hass)._pending_states:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with (
         patch("time.sleep"),
         patch.object(
             get_instance(hass).event_session,
             "flush",
-            side_effect=_throw_if_state_in_session,
+            side_effect=_throw_if_state_pending,
         ),
     ):
         hass.states.async_set(entity_id, "fail", attributes)
@@ -439,19 +453,16 @@ async def test_saving_state_with_sqlalchemy_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    def _throw_if_state_pending(*args, **kwargs):
+        if get_instance(hass)._pending_states:
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
 
     with (
         patch("time.sleep"),
         patch.object(
             get_instance(hass).event_session,
             "flush",
-            side_effect=_throw_if_state_in_session,
+            side_effect=_throw_if_state_pending,
         ),
     ):
         hass.states.async_set(entity_id, "fail", attributes)
@@ -1475,6 +1486,56 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+async def test_saving_states_in_batches(
+    hass: HomeAssistant, async_setup_recorder_instance: RecorderInstanceGenerator
+) -> None:
+    """Test states are inserted in batches that keep the old state links."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 30}
+    )
+    hass.states.async_set("test.one", "s0", {})
+    await async_wait_recording_done(hass)
+
+    with patch.object(
+        instance, "_insert_states", wraps=instance._insert_states
+    ) as insert_states:
+        for idx in range(1, 4):
+            for entity_id in ("test.one", "test.two", "test.three"):
+                hass.states.async_set(entity_id, f"s{idx}", {"idx": idx})
+        await hass.async_block_till_done()
+        await async_recorder_block_till_done(hass)
+        await async_wait_recording_done(hass)
+
+    assert [len(call.args[1]) for call in insert_states.call_args_list] == [3, 3, 3]
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.attributes_id,
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 10
+        states_by_entity_state = {
+            (state.entity_id, state.state): state for state in states
+        }
+        assert all(state.attributes_id is not None for state in states)
+        for entity_id in ("test.one", "test.two", "test.three"):
+            for idx in range(2, 4):
+                assert (
+                    states_by_entity_state[(entity_id, f"s{idx}")].old_state_id
+                    == states_by_entity_state[(entity_id, f"s{idx - 1}")].state_id
+                )
+        assert (
+            states_by_entity_state[("test.one", "s1")].old_state_id
+            == states_by_entity_state[("test.one", "s0")].state_id
+        )
+        assert states_by_entity_state[("test.two", "s1")].old_state_id is None
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -1,9 +1,10 @@
 """Test data purging."""
 
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from datetime import datetime, timedelta
 import json
 import sqlite3
+from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
@@ -15,6 +16,7 @@ from voluptuous.error import MultipleInvalid
 from homeassistant.components.recorder import DOMAIN, Recorder
 from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.components.recorder.db_schema import (
+    EventData,
     Events,
     EventTypes,
     RecorderRuns,
@@ -25,7 +27,11 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import (
+    _purge_event_ids,
+    _purge_state_ids,
+    purge_old_data,
+)
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -359,6 +365,113 @@ async def test_purge_old_events(hass: HomeAssistant, recorder_mock: Recorder) ->
         assert events.count() == 2
 
 
+async def test_purge_old_states_skips_attributes_used_since_cutoff(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test attributes used by recent states are not checked against the states."""
+    utcnow = dt_util.utcnow()
+    eleven_days_ago = utcnow - timedelta(days=11)
+    attributes = {"test_attr": 5}
+
+    with freeze_time() as freezer:
+        for timestamp, state in ((eleven_days_ago, "purgeme"), (utcnow, "keepme")):
+            freezer.move_to(timestamp)
+            hass.states.async_set("test.recorder", state, attributes)
+            await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 2
+        assert session.query(StateAttributes).count() == 1
+
+    purge_before = utcnow - timedelta(days=4)
+    with patch(
+        "homeassistant.components.recorder.purge._select_unused_attributes_ids",
+        return_value=set(),
+    ) as select_unused_attributes_ids:
+        finished = purge_old_data(recorder_mock, purge_before, repack=False)
+    assert finished
+    assert select_unused_attributes_ids.call_args[0][2] == set()
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 1
+        assert session.query(StateAttributes).count() == 1
+
+    # Attributes used before the cutoff are checked against the states
+    finished = purge_old_data(recorder_mock, utcnow + timedelta(days=1), repack=False)
+    assert finished
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StateAttributes).count() == 0
+
+
+async def test_purge_failing_after_first_batch_leaves_no_unused_shared_rows(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test a purge failing after a committed batch leaves no unused shared rows."""
+    eleven_days_ago = dt_util.utcnow() - timedelta(days=11)
+    await async_wait_recording_done(hass)
+
+    with freeze_time() as freezer:
+        freezer.move_to(eleven_days_ago)
+        for idx in range(4):
+            hass.states.async_set("test.recorder", str(idx), {"idx": idx})
+            hass.bus.async_fire("EVENT_TEST_PURGE", {"idx": idx})
+
+    await async_wait_recording_done(hass)
+
+    def _fail_after_first_batch(purge_ids: Callable[..., None]) -> Callable[..., None]:
+        calls = 0
+
+        def _purge_ids(*args: Any) -> None:
+            nonlocal calls
+            calls += 1
+            if calls > 1:
+                raise OperationalError("statement", {}, [])
+            purge_ids(*args)
+
+        return _purge_ids
+
+    def _assert_no_unused_shared_rows() -> None:
+        with session_scope(hass=hass) as session:
+            used_attributes_ids = {
+                state.attributes_id for state in session.query(States)
+            }
+            used_data_ids = {event.data_id for event in session.query(Events)}
+            assert {
+                attributes.attributes_id
+                for attributes in session.query(StateAttributes)
+            } <= used_attributes_ids
+            assert {data.data_id for data in session.query(EventData)} <= used_data_ids
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 2),
+        patch.object(recorder_mock.database_engine, "max_bind_vars", 2),
+    ):
+        with patch(
+            "homeassistant.components.recorder.purge._purge_state_ids",
+            side_effect=_fail_after_first_batch(_purge_state_ids),
+        ):
+            purge_old_data(recorder_mock, purge_before, repack=False)
+
+        with session_scope(hass=hass) as session:
+            assert session.query(States).count() == 2
+            assert session.query(StateAttributes).count() == 2
+        _assert_no_unused_shared_rows()
+
+        with patch(
+            "homeassistant.components.recorder.purge._purge_event_ids",
+            side_effect=_fail_after_first_batch(_purge_event_ids),
+        ):
+            purge_old_data(recorder_mock, purge_before, repack=False)
+
+        with session_scope(hass=hass) as session:
+            assert session.query(States).count() == 0
+            assert session.query(StateAttributes).count() == 0
+            assert session.query(EventData).count() == 2
+        _assert_no_unused_shared_rows()
+
+
 async def test_purge_old_recorder_runs(
     hass: HomeAssistant, recorder_mock: Recorder
 ) -> None:
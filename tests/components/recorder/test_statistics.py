@@ -1,20 +1,26 @@
 """The tests for sensor recorder platform."""
 
 from collections.abc import Generator
-from datetime import timedelta
+from datetime import datetime, timedelta
+import math
 import re
 from typing import Any
 from unittest.mock import ANY, Mock, patch
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.orm.session import Session
 import voluptuous as vol
 
 from homeassistant import exceptions
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    Statistics,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
+    StatisticData,
     StatisticMeanType,
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -29,12 +35,14 @@ from homeassistant.components.recorder.statistics import (
     async_add_external_statistics,
     async_import_statistics,
     async_list_statistic_ids,
+    cached_statistics_during_period,
     get_last_short_term_statistics,
     get_last_statistics,
     get_latest_short_term_statistics_with_session,
     get_metadata,
     get_metadata_with_session,
     get_short_term_statistics_run_cache,
+    get_statistics_during_period_cache,
     list_statistic_ids,
     validate_statistics,
 )
@@ -838,6 +846,93 @@ async def test_statistics_duplicated(
         caplog.clear()
 
 
+async def test_cached_statistics_during_period(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test statistics_during_period results are cached until they change."""
+    zero = dt_util.utcnow()
+    period1 = zero.replace(minute=0, second=0, microsecond=0) - timedelta(hours=2)
+    period2 = period1 + timedelta(hours=1)
+    metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        metadata,
+        (
+            {"start": period1, "state": 0, "sum": 2},
+            {"start": period2, "state": 1, "sum": 3},
+        ),
+    )
+    await async_wait_recording_done(hass)
+
+    def _get_sums(end_time: datetime | None) -> list[float | None]:
+        stats = cached_statistics_during_period(
+            hass,
+            period1,
+            end_time,
+            {"test:total_energy_import"},
+            "hour",
+            None,
+            {"sum"},
+        )
+        sums = [row["sum"] for row in stats["test:total_energy_import"]]
+        # The callers may modify the returned rows
+        stats["test:total_energy_import"][0]["sum"] = None
+        return sums
+
+    cache = get_statistics_during_period_cache(hass)
+    assert await recorder_mock.async_add_executor_job(_get_sums, None) == [2, 3]
+    assert await recorder_mock.async_add_executor_job(_get_sums, None) == [2, 3]
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert await recorder_mock.async_add_executor_job(_get_sums, period2) == [2]
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # Results for periods ending before the adjusted statistics are kept
+    recorder_mock.async_adjust_statistics("test:total_energy_import", period2, 1, "kWh")
+    await async_wait_recording_done(hass)
+    assert await recorder_mock.async_add_executor_job(_get_sums, period2) == [2]
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert await recorder_mock.async_add_executor_job(_get_sums, None) == [2, 4]
+    assert (cache.hits, cache.misses) == (2, 3)
+
+    # Results read from a read replica are not cached
+    with patch.object(recorder_mock, "read_engine", Mock()):
+        assert await recorder_mock.async_add_executor_job(_get_sums, None) == [2, 4]
+        assert await recorder_mock.async_add_executor_job(_get_sums, period2) == [2]
+    assert (cache.hits, cache.misses) == (2, 3)
+
+    def _get_short_term() -> dict[str, Any]:
+        return cached_statistics_during_period(
+            hass,
+            period1,
+            None,
+            {"test:total_energy_import"},
+            "5minute",
+            None,
+            {"sum"},
+        )
+
+    assert await recorder_mock.async_add_executor_job(_get_short_term) == {}
+    assert await recorder_mock.async_add_executor_job(_get_short_term) == {}
+    assert (cache.hits, cache.misses) == (3, 4)
+
+    # Imported metadata applies to the 5-minute statistics as well
+    async_add_external_statistics(
+        hass,
+        {**metadata, "unit_of_measurement": "MWh"},
+        ({"start": period2, "state": 1, "sum": 3},),
+    )
+    await async_wait_recording_done(hass)
+    assert await recorder_mock.async_add_executor_job(_get_short_term) == {}
+    assert (cache.hits, cache.misses) == (3, 5)
+
+
 @pytest.mark.parametrize("last_reset_str", ["2022-01-01T00:00:00+02:00", None])
 @pytest.mark.parametrize(
     ("source", "statistic_id", "import_fn"),
@@ -3338,6 +3433,128 @@ async def test_recorder_platform_with_statistics(
     recorder_platform.validate_statistics.assert_called_once_with(hass)
 
 
+async def test_compile_statistics_rows(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test compiled statistics are inserted with the values of the platforms."""
+    stats_by_minute: dict[int, list[StatisticData]] = {}
+
+    def _mock_compile_statistics(
+        hass: HomeAssistant, session: Session, start: datetime, end: datetime
+    ) -> PlatformCompiledStatistics:
+        power, direction = (10.0, 340.0) if start.minute == 50 else (20.0, 350.0)
+        stats_by_minute[start.minute] = [
+            {
+                "start": start,
+                "last_reset": start - timedelta(days=1),
+                "mean": power,
+                "min": power - 1,
+                "max": power + 1,
+                "state": power,
+                "sum": power * 2,
+            },
+            {"start": start, "mean": direction, "mean_weight": 1.0},
+        ]
+        return PlatformCompiledStatistics(
+            [
+                {
+                    "meta": {
+                        "mean_type": StatisticMeanType.ARITHMETIC,
+                        "has_sum": True,
+                        "name": None,
+                        "source": "recorder",
+                        "statistic_id": "sensor.power",
+                        "unit_of_measurement": "W",
+                    },
+                    "stat": stats_by_minute[start.minute][0],
+                },
+                {
+                    "meta": {
+                        "mean_type": StatisticMeanType.CIRCULAR,
+                        "has_sum": False,
+                        "name": None,
+                        "source": "recorder",
+                        "statistic_id": "sensor.wind_direction",
+                        "unit_of_measurement": "°",
+                    },
+                    "stat": stats_by_minute[start.minute][1],
+                },
+            ],
+            {},
+        )
+
+    await _setup_mock_domain(
+        hass, Mock(compile_statistics=Mock(wraps=_mock_compile_statistics))
+    )
+    await async_recorder_block_till_done(hass)
+
+    # Compile the last two 5-minute periods of an hour to also compile the hour
+    hour = get_start_time(dt_util.utcnow()).replace(minute=0) + timedelta(hours=1)
+    do_adhoc_statistics(hass, start=hour + timedelta(minutes=50))
+    do_adhoc_statistics(hass, start=hour + timedelta(minutes=55))
+    await async_wait_recording_done(hass)
+
+    metadata = get_metadata(hass)
+    power_id = metadata["sensor.power"][0]
+    direction_id = metadata["sensor.wind_direction"][0]
+    columns = (
+        "metadata_id",
+        "start_ts",
+        "mean",
+        "mean_weight",
+        "min",
+        "max",
+        "last_reset_ts",
+        "state",
+        "sum",
+    )
+    with session_scope(hass=hass, read_only=True) as session:
+        rows = session.query(StatisticsShortTerm).order_by(StatisticsShortTerm.id).all()
+        # The rows are the same as the ones created from the statistics
+        assert len(rows) == 4
+        for row, (metadata_id, stat) in zip(
+            rows,
+            (
+                (metadata_id, stat)
+                for minute in (50, 55)
+                for metadata_id, stat in zip(
+                    (power_id, direction_id), stats_by_minute[minute], strict=True
+                )
+            ),
+            strict=True,
+        ):
+            expected = StatisticsShortTerm.from_stats(
+                metadata_id, stat, row.created_ts
+            )
+            for column in columns:
+                assert getattr(row, column) == getattr(expected, column)
+        # The run cache holds the ids of the newest rows
+        assert get_short_term_statistics_run_cache(hass).get_latest_ids(
+            {power_id, direction_id}
+        ) == {power_id: rows[2].id, direction_id: rows[3].id}
+
+        hourly = {
+            row.metadata_id: row
+            for row in session.query(Statistics).filter(
+                Statistics.start_ts == hour.timestamp()
+            )
+        }
+        assert hourly[power_id].mean == pytest.approx(15.0)
+        assert hourly[power_id].min == pytest.approx(9.0)
+        assert hourly[power_id].max == pytest.approx(21.0)
+        assert hourly[power_id].state == pytest.approx(20.0)
+        assert hourly[power_id].sum == pytest.approx(40.0)
+        assert hourly[power_id].last_reset_ts == (
+            (hour + timedelta(minutes=55) - timedelta(days=1)).timestamp()
+        )
+        # The circular mean is normalized to [0, 360)
+        assert hourly[direction_id].mean == pytest.approx(345.0)
+        assert hourly[direction_id].mean_weight == pytest.approx(
+            2 * math.cos(math.radians(5))
+        )
+
+
 async def test_recorder_platform_without_statistics(
     hass: HomeAssistant,
     setup_recorder: None,
@@ -328,6 +328,66 @@ async def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+async def test_compile_hourly_statistics_from_memory(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test compiling statistics from the states collected in memory."""
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    # The first run starts collecting states and reads the history
+    do_adhoc_statistics(hass, start=zero - timedelta(minutes=5))
+    await async_wait_recording_done(hass)
+
+    start = zero + timedelta(minutes=10)
+    attributes = {
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "unit_of_measurement": "°C",
+    }
+    with freeze_time(start) as freezer:
+        await async_record_states(hass, freezer, start, "sensor.test1", attributes)
+    await async_wait_recording_done(hass)
+
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_history:
+        do_adhoc_statistics(hass, start=start)
+        await async_wait_recording_done(hass)
+    get_history.assert_not_called()
+
+    stats = statistics_during_period(hass, start, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": process_timestamp(start).timestamp(),
+                "end": process_timestamp(start + timedelta(minutes=5)).timestamp(),
+                "mean": pytest.approx(13.050847),
+                "min": pytest.approx(-10.0),
+                "max": pytest.approx(30.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ]
+    }
+
+    # Periods before the collected states are compiled from the history
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_history:
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+    get_history.assert_called_once()
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
 async def test_compile_hourly_statistics_angle(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
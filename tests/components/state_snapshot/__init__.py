@@ -0,0 +1 @@
+"""Tests for the State Snapshot integration."""
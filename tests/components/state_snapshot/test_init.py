@@ -0,0 +1,104 @@
+"""Tests for the State Snapshot integration."""
+
+from datetime import timedelta
+import json
+from pathlib import Path
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.components.state_snapshot.const import (
+    DOMAIN,
+    RING_FILE,
+    SNAPSHOT_FILE,
+)
+from homeassistant.components.state_snapshot.ring import (
+    RingOverrunError,
+    StateChangeRing,
+    read_records,
+)
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from tests.common import async_fire_time_changed
+
+
+@pytest.fixture
+def config_dir(hass: HomeAssistant, tmp_path: Path) -> Path:
+    """Use a temporary config directory."""
+    hass.config.config_dir = str(tmp_path)
+    return tmp_path
+
+
+async def test_export(
+    hass: HomeAssistant, config_dir: Path, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test state changes and snapshots are exported."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    assert await async_setup_component(
+        hass, DOMAIN, {DOMAIN: {"snapshot_interval": 30}}
+    )
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    snapshot = json.loads((config_dir / DOMAIN / SNAPSHOT_FILE).read_bytes())
+    assert snapshot["head"] == 0
+    assert snapshot["seq"] == 0
+    assert snapshot["states"]["light.kitchen"]["s"] == "on"
+    assert snapshot["states"]["light.kitchen"]["a"] == {"brightness": 100}
+
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("sensor.power", "5", {"unit_of_measurement": "W"})
+    hass.states.async_remove("light.kitchen")
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    ring = (config_dir / DOMAIN / RING_FILE).read_bytes()
+    records, cursor = read_records(ring, snapshot["head"])
+    assert [seq for seq, _ in records] == [1, 2, 3]
+    changes = [json.loads(payload) for _, payload in records]
+    assert changes[0]["light.kitchen"]["s"] == "off"
+    assert changes[1]["sensor.power"]["a"] == {"unit_of_measurement": "W"}
+    assert changes[2] == {"light.kitchen": None}
+    assert read_records(ring, cursor) == ([], cursor)
+
+    freezer.tick(timedelta(seconds=30))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    snapshot = json.loads((config_dir / DOMAIN / SNAPSHOT_FILE).read_bytes())
+    assert snapshot["head"] == cursor
+    assert snapshot["seq"] == 3
+    assert list(snapshot["states"]) == ["sensor.power"]
+
+    hass.states.async_set("sensor.power", "6", {"unit_of_measurement": "W"})
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    snapshot = json.loads((config_dir / DOMAIN / SNAPSHOT_FILE).read_bytes())
+    assert snapshot["seq"] == 4
+    assert snapshot["states"]["sensor.power"]["s"] == "6"
+
+
+def test_ring_wraps(tmp_path: Path) -> None:
+    """Test the ring wraps around and detects overrun readers."""
+    ring = StateChangeRing(str(tmp_path / RING_FILE), 100)
+    ring.open(0.0)
+    payloads = [b'{"sensor.a":"%d"}' % idx for idx in range(10)]
+    cursor = 0
+    for payload in payloads[:3]:
+        assert ring.append(payload)
+    records, cursor = read_records(Path(ring.path).read_bytes(), cursor)
+    assert records == [(1, payloads[0]), (2, payloads[1]), (3, payloads[2])]
+
+    for payload in payloads[3:5]:
+        assert ring.append(payload)
+    records, cursor = read_records(Path(ring.path).read_bytes(), cursor)
+    assert records == [(4, payloads[3]), (5, payloads[4])]
+
+    for payload in payloads[5:]:
+        assert ring.append(payload)
+    with pytest.raises(RingOverrunError):
+        read_records(Path(ring.path).read_bytes(), cursor)
+
+    assert not ring.append(b"x" * 100)
+    ring.close()
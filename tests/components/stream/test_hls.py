@@ -445,6 +445,50 @@ async def test_hls_max_segments(
     await stream.stop()
 
 
+async def test_hls_max_segments_size(
+    hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
+) -> None:
+    """Test the oldest segments are dropped when the segments use too much memory."""
+    stream = create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+
+    hls_client = await hls_stream(stream)
+
+    with patch(
+        "homeassistant.components.stream.hls.MAX_SEGMENTS_SIZE",
+        2 * len(FAKE_PAYLOAD),
+    ):
+        for sequence in range(MAX_SEGMENTS):
+            segment = Segment(sequence=sequence, init=INIT_BYTES)
+            hls.put(segment)
+            await hass.async_block_till_done()
+            segment.async_add_part(
+                Part(duration=SEGMENT_DURATION, has_keyframe=True, data=FAKE_PAYLOAD),
+                SEGMENT_DURATION,
+            )
+
+    # The segments of the playlist are kept even when over the limit
+    assert hls.sequences == list(
+        range(MAX_SEGMENTS - NUM_PLAYLIST_SEGMENTS - 1, MAX_SEGMENTS)
+    )
+    assert hls.data_size == (NUM_PLAYLIST_SEGMENTS + 1) * len(FAKE_PAYLOAD)
+    assert stream.get_diagnostics()["segments_size"] == {HLS_PROVIDER: hls.data_size}
+
+    # The part data is shared with the data of the segment once it is requested
+    segment = hls.last_segment
+    segment_response = await hls_client.get(f"/segment/{segment.sequence}.m4s")
+    assert segment_response.status == HTTPStatus.OK
+    assert await segment_response.read() == FAKE_PAYLOAD
+    assert segment.parts[0].data.obj is segment.get_data()
+    part_response = await hls_client.get(f"/segment/{segment.sequence}.0.m4s")
+    assert part_response.status == HTTPStatus.OK
+    assert await part_response.read() == FAKE_PAYLOAD
+
+    stream_worker_sync.resume()
+    await stream.stop()
+
+
 async def test_hls_playlist_view_discontinuity(
     hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
 ) -> None:
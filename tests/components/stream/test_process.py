@@ -0,0 +1,128 @@
+"""Test the stream worker process backend."""
+
+from collections.abc import Generator
+import datetime
+from io import BytesIO
+import logging
+from multiprocessing import Pipe
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from homeassistant.components.stream.const import (
+    SEGMENT_DURATION_ADJUSTER,
+    TARGET_SEGMENT_DURATION_NON_LL_HLS,
+)
+from homeassistant.components.stream.core import Segment, StreamSettings
+from homeassistant.components.stream.diagnostics import Diagnostics
+from homeassistant.components.stream.exceptions import StreamEndedError
+from homeassistant.components.stream.process import _PartBuffer, process_stream_worker
+from homeassistant.components.stream.worker import StreamState
+from homeassistant.core import HomeAssistant
+
+BUFFER_SIZE = 10
+
+
+@pytest.fixture
+def shm() -> Generator[SharedMemory]:
+    """Create a small shared memory buffer."""
+    shm = SharedMemory(create=True, size=BUFFER_SIZE)
+    yield shm
+    shm.close()
+    shm.unlink()
+
+
+@pytest.fixture
+def pipe() -> Generator[tuple[Connection, Connection]]:
+    """Create a pipe between the parent and the child."""
+    parent_conn, child_conn = Pipe()
+    yield parent_conn, child_conn
+    parent_conn.close()
+    child_conn.close()
+
+
+def test_part_buffer(shm: SharedMemory, pipe: tuple[Connection, Connection]) -> None:
+    """Test parts are written to the ring buffer while there is space."""
+    parent_conn, child_conn = pipe
+    part_buffer = _PartBuffer(shm, child_conn)
+
+    assert part_buffer.write(b"aaaa") == (0, 4)
+    assert part_buffer.write(b"bbbb") == (4, 4)
+    assert bytes(shm.buf[0:8]) == b"aaaabbbb"
+
+    # Parts which do not fit in the free space are returned
+    assert part_buffer.write(b"cccc") == b"cccc"
+
+    # Wrap around once the first part is acknowledged
+    parent_conn.send(None)
+    assert part_buffer.write(b"ccc") == (0, 3)
+    assert bytes(shm.buf[0:3]) == b"ccc"
+    # The head may not catch up with the tail
+    assert part_buffer.write(b"d") == b"d"
+
+    # Start at the beginning once all parts are acknowledged
+    parent_conn.send(None)
+    parent_conn.send(None)
+    assert part_buffer.write(b"e" * BUFFER_SIZE) == (0, BUFFER_SIZE)
+    assert part_buffer.write(b"f") == b"f"
+
+
+async def test_process_stream_worker(
+    hass: HomeAssistant,
+    h264_video: BytesIO,
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the stream worker process sends the stream to the parent."""
+    source = tmp_path / "test.mp4"
+    source.write_bytes(h264_video.getvalue())
+    stream_settings = StreamSettings(
+        ll_hls=False,
+        min_segment_duration=TARGET_SEGMENT_DURATION_NON_LL_HLS
+        - SEGMENT_DURATION_ADJUSTER,
+        part_target_duration=TARGET_SEGMENT_DURATION_NON_LL_HLS,
+        hls_advance_part_limit=3,
+        hls_part_timeout=TARGET_SEGMENT_DURATION_NON_LL_HLS,
+    )
+    segments: list[Segment] = []
+
+    class _RecordingStreamState(StreamState):
+        def create_segment(self, init: bytes, start_time: datetime.datetime) -> Segment:
+            segment = super().create_segment(init, start_time)
+            segments.append(segment)
+            return segment
+
+    diagnostics = Diagnostics()
+    stream_state = _RecordingStreamState(hass, dict, diagnostics)
+    keyframe_converter = Mock()
+
+    with pytest.raises(StreamEndedError):
+        await hass.async_add_executor_job(
+            process_stream_worker,
+            str(source),
+            {},
+            stream_settings,
+            stream_state,
+            keyframe_converter,
+            threading.Event(),
+        )
+    await hass.async_block_till_done()
+
+    assert segments
+    assert all(segment.init for segment in segments)
+    assert all(segment.parts for segment in segments)
+    assert segments[0].complete
+    assert keyframe_converter.create_codec_context.called
+    assert keyframe_converter.stash_keyframe_packet.called
+    assert diagnostics.as_dict()["video_codec"] == "h264"
+    # Log records of the child are handled in the parent
+    assert any(
+        record.processName == "stream_worker"
+        and record.levelno == logging.WARNING
+        and record.getMessage() == "Audio stream not found"
+        for record in caplog.records
+    )
@@ -29,6 +29,7 @@ import pytest
 from homeassistant.components.stream import KeyFrameConverter, Stream, create_stream
 from homeassistant.components.stream.const import (
     ATTR_SETTINGS,
+    ATTR_WORKER_PROCESS,
     CONF_LL_HLS,
     CONF_PART_DURATION,
     CONF_SEGMENT_DURATION,
@@ -96,7 +97,8 @@ def mock_stream_settings(hass: HomeAssistant) -> None:
             part_target_duration=TARGET_SEGMENT_DURATION_NON_LL_HLS,
             hls_advance_part_limit=3,
             hls_part_timeout=TARGET_SEGMENT_DURATION_NON_LL_HLS,
-        )
+        ),
+        ATTR_WORKER_PROCESS: False,
     }
 
 
@@ -1038,6 +1040,18 @@ async def test_get_image(hass: HomeAssistant, h264_video, filename) -> None:
 
     assert await stream.async_get_image() == EMPTY_8_6_JPEG
 
+    # Images of the same keyframe are only encoded once per size
+    encode = stream._keyframe_converter._turbojpeg.encode
+    encode.reset_mock()
+    images = await asyncio.gather(
+        *(stream.async_get_image(width=4, height=3) for _ in range(3)),
+        stream.async_get_image(),
+    )
+    assert images == [EMPTY_8_6_JPEG] * 4
+    assert encode.call_count == 1
+    assert await stream.async_get_image(width=4, height=3) == EMPTY_8_6_JPEG
+    assert encode.call_count == 1
+
     await stream.stop()
 
 
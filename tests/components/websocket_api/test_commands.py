@@ -10,6 +10,7 @@ import pytest
 import voluptuous as vol
 
 from homeassistant import loader
+from homeassistant.auth.permissions import PermissionLookup
 from homeassistant.components.device_automation import toggle_entity
 from homeassistant.components.websocket_api import const
 from homeassistant.components.websocket_api.auth import (
@@ -17,12 +18,16 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
-from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
+from homeassistant.components.websocket_api.const import (
+    FEATURE_COALESCE_MESSAGES,
+    FEATURE_COALESCE_WINDOW,
+    URL,
+)
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.loader import async_get_integration
@@ -663,6 +668,44 @@ async def test_get_states(
     assert msg["result"] == states
 
 
+async def test_get_states_since(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test get_states command with the changes since a version."""
+    hass.states.async_set("greeting.hello", "world")
+    hass.states.async_set("greeting.bye", "universe")
+    version = hass.states.version
+    hass.states.async_set("greeting.hello", "home")
+    hass.states.async_set("greeting.hidden", "home")
+    hass.states.async_remove("greeting.bye")
+
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy(
+        {"entities": {"entity_ids": {"greeting.hello": True, "greeting.bye": True}}}
+    )
+    await websocket_client.send_json_auto_id({"type": "get_states", "since": version})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {
+        "version": hass.states.version,
+        "reset": False,
+        "changed": [hass.states.get("greeting.hello").as_dict()],
+        "removed": ["greeting.bye"],
+    }
+
+    await websocket_client.send_json_auto_id({"type": "get_states", "since": 0})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {
+        "version": hass.states.version,
+        "reset": True,
+        "changed": [hass.states.get("greeting.hello").as_dict()],
+        "removed": [],
+    }
+
+
 async def test_get_services(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -1276,6 +1319,141 @@ async def test_subscribe_unsubscribe_entities_with_filter(
     }
 
 
+async def test_subscribe_entities_intern_strings(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test subscribe entities with interned strings."""
+    hass.states.async_set("light.kitchen", "off", {"color": "red"})
+    hass.states.async_set("switch.not_included", "off", {"color": "red"})
+    await websocket_client.send_json_auto_id(
+        {
+            "type": "subscribe_entities",
+            "intern_strings": True,
+            "include": {"domains": ["light"]},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    subscription = msg["id"]
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == subscription
+    assert msg["event"] == {
+        "a": {"0": {"a": {"1": "red"}, "c": ANY, "lc": ANY, "s": "off"}},
+        "s": ["light.kitchen", "color"],
+    }
+
+    hass.states.async_set("switch.not_included", "on")
+    hass.states.async_set("light.kitchen", "on", {"color": "blue", "mode": "hs"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == subscription
+    assert msg["event"] == {
+        "c": {
+            "0": {
+                "+": {
+                    "a": {"1": "blue", "2": "hs"},
+                    "c": ANY,
+                    "lc": ANY,
+                    "s": "on",
+                }
+            }
+        },
+        "s": ["mode"],
+    }
+
+    hass.states.async_set("light.living_room", "on")
+    hass.states.async_remove("light.kitchen")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "a": {"3": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+        "s": ["light.living_room"],
+    }
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": [0]}
+
+
+async def test_subscribe_entities_shared_listener(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test subscriptions share a listener and follow permission changes."""
+    listeners_before = hass.bus.async_listeners()
+    config_entry = MockConfigEntry(domain="test")
+    config_entry.add_to_hass(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id, identifiers={("test", "kitchen")}
+    )
+    entity_registry.async_get_or_create(
+        "light", "test", "kitchen", suggested_object_id="kitchen"
+    )
+    hass_admin_user.groups = []
+    hass_admin_user.perm_lookup = PermissionLookup(entity_registry, device_registry)
+    hass_admin_user.mock_policy({"entities": {"device_ids": {device.id: True}}})
+
+    await websocket_client.send_json_auto_id({"type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    all_subscription = msg["id"]
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"a": {}}
+
+    await websocket_client.send_json_auto_id(
+        {"type": "subscribe_entities", "entity_ids": ["light.kitchen"]}
+    )
+    msg = await websocket_client.receive_json()
+    entity_subscription = msg["id"]
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"a": {}}
+
+    listeners = hass.bus.async_listeners()
+    assert (
+        listeners[EVENT_STATE_CHANGED]
+        == listeners_before.get(EVENT_STATE_CHANGED, 0) + 1
+    )
+
+    # Not allowed until the entity is added to the device
+    hass.states.async_set("light.kitchen", "on")
+    entity_registry.async_update_entity("light.kitchen", device_id=device.id)
+    await hass.async_block_till_done()
+    hass.states.async_set("light.kitchen", "off")
+    received = set()
+    for _ in range(2):
+        msg = await websocket_client.receive_json()
+        assert msg["type"] == "event"
+        assert msg["event"] == {
+            "c": {"light.kitchen": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}
+        }
+        received.add(msg["id"])
+    assert received == {all_subscription, entity_subscription}
+
+    # Revoking the permissions stops the state changes
+    hass_admin_user.mock_policy({"entities": {}})
+    hass.states.async_set("light.kitchen", "on")
+    hass_admin_user.mock_policy({"entities": {"all": True}})
+    hass.states.async_set("light.other", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == all_subscription
+    assert msg["event"] == {
+        "a": {"light.other": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}}
+    }
+
+    for subscription in (all_subscription, entity_subscription):
+        await websocket_client.send_json_auto_id(
+            {"type": "unsubscribe_events", "subscription": subscription}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+    assert hass.bus.async_listeners().get(
+        EVENT_STATE_CHANGED, 0
+    ) == listeners_before.get(EVENT_STATE_CHANGED, 0)
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -2649,6 +2827,56 @@ async def test_message_coalescing(
     await hass.async_block_till_done()
 
 
+async def test_message_coalescing_window(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test state changes inside the coalesce window are merged."""
+    await websocket_client.send_json_auto_id(
+        {
+            "type": "supported_features",
+            "features": {FEATURE_COALESCE_MESSAGES: 1, FEATURE_COALESCE_WINDOW: 50},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    await websocket_client.send_json_auto_id({"type": "subscribe_entities"})
+    subscription = msg["id"] + 1
+    events: list[dict[str, Any]] = []
+
+    async def _receive_events(count: int) -> None:
+        while len(events) < count:
+            msgs = json_loads(await websocket_client.receive_str())
+            for msg in msgs if isinstance(msgs, list) else [msgs]:
+                assert msg["id"] == subscription
+                if msg["type"] == "event":
+                    events.append(msg["event"])
+
+    await _receive_events(1)
+    assert events.pop() == {"a": {}}
+
+    # The first change after a quiet period is sent right away
+    hass.states.async_set("light.kitchen", "on", {"color": "red"})
+    hass.states.async_set("light.kitchen", "on", {"color": "yellow"})
+    hass.states.async_set("light.kitchen", "off", {"color": "blue"})
+    hass.states.async_set("light.door", "on")
+    hass.states.async_set("light.window", "on")
+    hass.states.async_remove("light.window")
+    await _receive_events(2)
+    assert events[0] == {
+        "a": {"light.kitchen": {"a": {"color": "red"}, "c": ANY, "lc": ANY, "s": "on"}}
+    }
+    assert events[1] == {
+        "a": {
+            "light.kitchen": {"a": {"color": "blue"}, "c": ANY, "lc": ANY, "s": "off"},
+            "light.door": {"a": {}, "c": ANY, "lc": ANY, "s": "on"},
+        },
+        "r": ["light.window"],
+    }
+
+
 async def test_message_coalescing_not_supported_by_websocket_client(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
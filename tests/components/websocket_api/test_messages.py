@@ -3,9 +3,11 @@
 import pytest
 
 from homeassistant.components.websocket_api.messages import (
+    StringTable,
     _partial_cached_event_message as lru_event_cache,
     _state_diff_event,
     cached_event_message,
+    merged_state_diff_event,
     message_to_json_bytes,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -281,6 +283,144 @@ async def test_state_diff_event(hass: HomeAssistant) -> None:
     }
 
 
+async def test_merged_state_diff_event(hass: HomeAssistant) -> None:
+    """Test merging state changes of several entities into one message."""
+    state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.states.async_set("light.window", "on")
+    hass.states.async_set("light.door", "on")
+    hass.states.async_set("light.door", "off")
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_remove("light.kitchen")
+    await hass.async_block_till_done()
+
+    window_added, door_changed, kitchen_removed = (
+        state_change_events[0],
+        state_change_events[2],
+        state_change_events[5],
+    )
+    door_state: State = door_changed.data["new_state"]
+    assert merged_state_diff_event(
+        [window_added, door_changed, kitchen_removed], {"light.kitchen"}
+    ) == {
+        "a": {"light.window": window_added.data["new_state"].as_compressed_state},
+        "c": {
+            "light.door": {
+                "+": {
+                    "c": door_state.context.id,
+                    "lc": door_state.last_changed_timestamp,
+                    "s": "off",
+                }
+            }
+        },
+        "r": ["light.kitchen"],
+    }
+
+    assert merged_state_diff_event([door_changed], {"light.door"}) == {
+        "a": {"light.door": door_state.as_compressed_state}
+    }
+
+
+async def test_merged_state_diff_event_unserializable(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test states that cannot be serialized are left out of a merged event."""
+    state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.states.async_set("light.window", "on", {"bad": _Unserializeable()})
+    hass.states.async_set("light.door", "on")
+    hass.states.async_set("light.door", "off", {"bad": _Unserializeable()})
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.kitchen", "off", {"bad": _Unserializeable()})
+    hass.states.async_set("light.hall", "on")
+    await hass.async_block_till_done()
+
+    window_added, door_changed, kitchen_replaced, hall_added = (
+        state_change_events[0],
+        state_change_events[2],
+        state_change_events[4],
+        state_change_events[5],
+    )
+    assert merged_state_diff_event(
+        [window_added, door_changed, kitchen_replaced, hall_added], {"light.kitchen"}
+    ) == {"a": {"light.hall": hall_added.data["new_state"].as_compressed_state}}
+    assert "Unable to serialize to JSON" in caplog.text
+
+
+async def test_string_table(hass: HomeAssistant) -> None:
+    """Test interning entity ids and attribute keys."""
+    state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.states.async_set("sensor.outside", "10", {"unit": "°C", "friendly": "Out"})
+    hass.states.async_set("sensor.outside", "11", {"unit": "°C"})
+    hass.states.async_set("sensor.inside", "20", {"unit": "°C"})
+    hass.states.async_remove("sensor.outside")
+    await hass.async_block_till_done()
+    added, changed, other_added, removed = (
+        _state_diff_event(event) for event in state_change_events
+    )
+
+    string_table = StringTable()
+    assert string_table.intern_entities_event(added) == {
+        "a": {
+            0: {
+                **added["a"]["sensor.outside"],
+                "a": {1: "°C", 2: "Out"},
+            }
+        },
+        "s": ["sensor.outside", "unit", "friendly"],
+    }
+    # Known strings are not sent again
+    assert string_table.intern_entities_event(changed) == {
+        "c": {
+            0: {
+                "+": {**changed["c"]["sensor.outside"]["+"]},
+                "-": {"a": [2]},
+            }
+        },
+    }
+    assert string_table.intern_entities_event(other_added) == {
+        "a": {3: {**other_added["a"]["sensor.inside"], "a": {1: "°C"}}},
+        "s": ["sensor.inside"],
+    }
+    assert string_table.intern_entities_event(removed) == {"r": [0]}
+
+
+async def test_string_table_unserializable_event(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test strings of an event that cannot be serialized are not kept."""
+    string_table = StringTable()
+    assert string_table.entities_event_message(
+        1, {"a": {"sensor.outside": {"s": "10", "a": {"unit": "C"}}}}
+    ) == (
+        b'{"id":1,"type":"event","event":{"a":{"0":{"s":"10","a":{"1":"C"}}},'
+        b'"s":["sensor.outside","unit"]}}'
+    )
+
+    assert string_table.entities_event_message(
+        1,
+        {
+            "a": {
+                "sensor.inside": {
+                    "s": "20",
+                    "a": {"unit": "C", "bad": _Unserializeable()},
+                }
+            }
+        },
+    ) == (
+        b'{"id":1,"type":"result","success":false,"error":'
+        b'{"code":"unknown_error","message":"Invalid JSON in response"}}'
+    )
+    assert "Unable to serialize to JSON" in caplog.text
+
+    # The strings of the failed event are sent again with the same indexes
+    assert string_table.intern_entities_event(
+        {"a": {"sensor.inside": {"s": "20", "a": {"unit": "C", "bad": None}}}}
+    ) == {
+        "a": {2: {"s": "20", "a": {1: "C", 3: None}}},
+        "s": ["sensor.inside", "bad"],
+    }
+
+
 async def test_message_to_json_bytes(caplog: pytest.LogCaptureFixture) -> None:
     """Test we can serialize websocket messages."""
 
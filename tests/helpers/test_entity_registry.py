@@ -670,6 +670,136 @@ async def test_load_bad_data(
     )
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_loading_deleted_entities_lazily(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test deleted entities are only created when accessed."""
+    deleted_entities = [
+        {
+            "aliases": [],
+            "area_id": None,
+            "categories": {},
+            "config_entry_id": None,
+            "config_subentry_id": None,
+            "created_at": "2024-02-14T12:00:00.900075+00:00",
+            "device_class": None,
+            "disabled_by": None,
+            "entity_id": f"light.deleted_{unique_id}",
+            "hidden_by": None,
+            "icon": None,
+            "id": f"0000{unique_id}",
+            "labels": [],
+            "modified_at": "2024-02-14T12:00:00.900075+00:00",
+            "name": None,
+            "options": {},
+            "orphaned_timestamp": None,
+            "platform": "hue",
+            "unique_id": unique_id,
+        }
+        for unique_id in ("1", "2")
+    ]
+    hass_storage[er.STORAGE_KEY] = {
+        "version": er.STORAGE_VERSION_MAJOR,
+        "minor_version": er.STORAGE_VERSION_MINOR,
+        "data": {"entities": [], "deleted_entities": deleted_entities},
+    }
+
+    await er.async_load(hass)
+    registry = er.async_get(hass)
+
+    assert all(type(entry) is dict for entry in registry.deleted_entities.data.values())
+    fragment = registry.deleted_entities.as_storage_fragment
+    assert registry.deleted_entities.as_storage_fragment is fragment
+
+    deleted_entry = registry.deleted_entities[("light", "hue", "1")]
+    assert isinstance(deleted_entry, er.DeletedRegistryEntry)
+    assert deleted_entry.entity_id == "light.deleted_1"
+    assert deleted_entry.created_at == datetime.fromisoformat(
+        "2024-02-14T12:00:00.900075+00:00"
+    )
+    assert type(registry.deleted_entities.data[("light", "hue", "2")]) is dict
+    assert registry.deleted_entities.as_storage_fragment is fragment
+
+    # Registering the entity again restores it from the deleted entity
+    entry = registry.async_get_or_create("light", "hue", "2")
+    assert entry.entity_id == "light.deleted_2"
+    assert entry.id == "00002"
+    assert list(registry.deleted_entities) == [("light", "hue", "1")]
+    assert registry.deleted_entities.as_storage_fragment is not fragment
+
+    registry.async_schedule_save()
+    await flush_store(registry._store)
+
+    data = hass_storage[er.STORAGE_KEY]["data"]
+    assert [entity["entity_id"] for entity in data["entities"]] == ["light.deleted_2"]
+    assert data["deleted_entities"] == [deleted_entities[0]]
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_clearing_deleted_entities_lazily(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test clearing references only creates the deleted entities it changes."""
+    deleted_entities = [
+        {
+            "aliases": [],
+            "area_id": None,
+            "categories": {},
+            "config_entry_id": config_entry_id,
+            "config_subentry_id": None,
+            "created_at": "2024-02-14T12:00:00.900075+00:00",
+            "device_class": None,
+            "disabled_by": None,
+            "entity_id": f"light.deleted_{unique_id}",
+            "hidden_by": None,
+            "icon": None,
+            "id": f"0000{unique_id}",
+            "labels": ["label"],
+            "modified_at": "2024-02-14T12:00:00.900075+00:00",
+            "name": None,
+            "options": {},
+            "orphaned_timestamp": orphaned_timestamp,
+            "platform": "hue",
+            "unique_id": unique_id,
+        }
+        for unique_id, config_entry_id, orphaned_timestamp in (
+            ("1", "mock-id", None),
+            ("2", None, None),
+            ("3", None, 0),
+        )
+    ]
+    hass_storage[er.STORAGE_KEY] = {
+        "version": er.STORAGE_VERSION_MAJOR,
+        "minor_version": er.STORAGE_VERSION_MINOR,
+        "data": {"entities": [], "deleted_entities": deleted_entities},
+    }
+
+    await er.async_load(hass)
+    registry = er.async_get(hass)
+    data = registry.deleted_entities.data
+
+    registry.async_clear_area_id("kitchen")
+    registry.async_clear_label_id("other_label")
+    registry.async_clear_category_id("automation", "category")
+    assert all(type(entry) is dict for entry in data.values())
+
+    # The expired orphaned entity is purged without creating it
+    registry.async_purge_expired_orphaned_entities()
+    assert list(data) == [("light", "hue", "1"), ("light", "hue", "2")]
+    assert all(type(entry) is dict for entry in data.values())
+
+    registry.async_clear_config_entry("mock-id")
+    deleted_entry = data[("light", "hue", "1")]
+    assert isinstance(deleted_entry, er.DeletedRegistryEntry)
+    assert deleted_entry.config_entry_id is None
+    assert deleted_entry.orphaned_timestamp is not None
+    assert type(data[("light", "hue", "2")]) is dict
+
+    registry.async_clear_label_id("label")
+    assert registry.deleted_entities[("light", "hue", "2")].labels == set()
+
+
 def test_async_get_entity_id(entity_registry: er.EntityRegistry) -> None:
     """Test that entity_id is returned."""
     entry = entity_registry.async_get_or_create("light", "hue", "1234")
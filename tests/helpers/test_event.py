@@ -1144,6 +1144,77 @@ async def test_track_template_result_none(hass: HomeAssistant) -> None:
     assert wildercard_runs == [(None, 5), (5, 10)]
 
 
+async def test_track_template_result_only_rerenders_for_fields_read(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates are only re-rendered when a field they read changes."""
+    hass.states.async_set("sensor.test", "on", {"volume": 1, "title": "a"})
+    template_state = Template("{{ states('sensor.test') }}", hass)
+    template_attr = Template("{{ state_attr('sensor.test', 'volume') }}", hass)
+    template_attributes = Template("{{ states.sensor.test.attributes.title }}", hass)
+
+    runs = []
+
+    @ha.callback
+    def run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.extend(update.result for update in updates)
+
+    async_track_template_result(
+        hass,
+        [
+            TrackTemplate(template_state, None),
+            TrackTemplate(template_attr, None),
+            TrackTemplate(template_attributes, None),
+        ],
+        run_callback,
+    )
+    await hass.async_block_till_done()
+    renders = (
+        template_state._renders,
+        template_attr._renders,
+        template_attributes._renders,
+    )
+    assert renders == (1, 1, 1)
+
+    hass.states.async_set("sensor.test", "on", {"volume": 1, "title": "b"})
+    await hass.async_block_till_done()
+    assert runs == ["b"]
+    renders = (
+        template_state._renders,
+        template_attr._renders,
+        template_attributes._renders,
+    )
+    assert renders == (1, 1, 2)
+
+    hass.states.async_set("sensor.test", "on", {"volume": 2, "title": "b"})
+    await hass.async_block_till_done()
+    assert runs == ["b", 2]
+    renders = (
+        template_state._renders,
+        template_attr._renders,
+        template_attributes._renders,
+    )
+    assert renders == (1, 2, 3)
+
+    hass.states.async_set("sensor.test", "off", {"volume": 2, "title": "b"})
+    await hass.async_block_till_done()
+    assert runs == ["b", 2, "off"]
+    renders = (
+        template_state._renders,
+        template_attr._renders,
+        template_attributes._renders,
+    )
+    assert renders == (2, 2, 4)
+
+    hass.states.async_remove("sensor.test")
+    await hass.async_block_till_done()
+    assert runs[3:5] == ["unknown", None]
+    assert isinstance(runs[5], TemplateError)
+
+
 async def test_track_template_result_super_template(hass: HomeAssistant) -> None:
     """Test tracking template with super template listening to same entity."""
     specific_runs = []
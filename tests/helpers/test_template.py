@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
 from collections.abc import Iterable
 from datetime import datetime, timedelta
 import json
@@ -13,6 +15,8 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
+import jinja2
 import orjson
 import pytest
 from pytest_unordered import unordered
@@ -1898,6 +1902,17 @@ def test_render_with_possible_json_value_with_valid_json(hass: HomeAssistant) ->
     assert tpl.async_render_with_possible_json_value('{"hello": "world"}') == "world"
 
 
+def test_render_with_possible_json_value_render_time(hass: HomeAssistant) -> None:
+    """Test rendering with possible JSON value tracks the render time."""
+    tpl = template.Template("{{ value_json.hello }}", hass)
+    with patch(
+        "homeassistant.helpers.template.perf_counter", side_effect=[1.0, 1.5]
+    ):
+        tpl.async_render_with_possible_json_value('{"hello": "world"}')
+    assert tpl._renders == 1
+    assert tpl._render_time == 0.5
+
+
 def test_render_with_possible_json_value_with_invalid_json(hass: HomeAssistant) -> None:
     """Render with possible JSON value with invalid JSON."""
     tpl = template.Template("{{ value_json }}", hass)
@@ -2108,6 +2123,37 @@ def test_is_state_attr(hass: HomeAssistant) -> None:
     assert tpl.async_render() == "no"
 
 
+async def test_render_info_collects_fields_read(hass: HomeAssistant) -> None:
+    """Test render info collects which fields and attributes were read."""
+    hass.states.async_set("sensor.one", "on", {"volume": 1})
+    hass.states.async_set("sensor.two", "off", {"volume": 2})
+    hass.states.async_set("light.one", "on")
+
+    info = render_to_info(
+        hass,
+        "{{ states('sensor.one') }} {{ state_attr('sensor.one', 'volume') }}"
+        " {{ states.sensor.two.last_changed }} {{ states.sensor.two.attributes }}",
+    )
+    assert info.entities == {"sensor.one", "sensor.two"}
+    assert info.entity_fields == {"sensor.one": {"state"}}
+    assert info.entity_attributes == {"sensor.one": {"volume"}}
+
+    info = render_to_info(
+        hass,
+        "{{ states('sensor.one') }} {{ states.light | list | count }}"
+        " {{ states.light.one.last_changed }}",
+    )
+    assert info.entities == {"sensor.one", "light.one"}
+    assert info.entity_fields == {"sensor.one": {"state"}}
+    assert info.entity_attributes == {"sensor.one": set()}
+
+    info = render_to_info(
+        hass, "{{ states('sensor.one') }} {{ states | list | count }}"
+    )
+    assert info.entities == {"sensor.one"}
+    assert info.entity_fields == {}
+
+
 def test_state_attr(hass: HomeAssistant) -> None:
     """Test state_attr method."""
     hass.states.async_set(
@@ -5338,6 +5384,104 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_compile_cache(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test compiled templates are persisted and reused."""
+    template_string = "{{ states('sensor.cached') }} cached"
+    await template.async_load_compile_cache(hass)
+    tpl = template.Template(template_string, hass)
+    assert tpl.async_render() == "unknown cached"
+    await hass.async_block_till_done()
+
+    freezer.tick(template.COMPILE_CACHE_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    data = hass_storage[template.COMPILE_CACHE_STORAGE_KEY]["data"]
+    assert len(data["templates"]) == 1
+
+    # Simulate a restart, the code should not be compiled again
+    del tpl
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_compile_cache(hass)
+    with patch.object(jinja2.Environment, "compile") as mock_compile:
+        tpl = template.Template(template_string, hass)
+        assert tpl.async_render() == "unknown cached"
+    assert not mock_compile.called
+
+
+async def test_compile_cache_corrupt(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test corrupt or outdated compiled templates are ignored."""
+    compile_cache = template.TemplateCompileCache(hass)
+    hass_storage[template.COMPILE_CACHE_STORAGE_KEY] = {
+        "version": template.COMPILE_CACHE_STORAGE_VERSION,
+        "key": template.COMPILE_CACHE_STORAGE_KEY,
+        "data": {
+            "version": compile_cache._version,
+            "templates": [
+                [compile_cache._key("default", "{{ 1 + 1 }}"), "digest", "corrupt"]
+            ],
+        },
+    }
+    await template.async_load_compile_cache(hass)
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+
+    hass.data.pop(template._ENVIRONMENT)
+    hass_storage[template.COMPILE_CACHE_STORAGE_KEY]["data"]["version"] = "old"
+    await template.async_load_compile_cache(hass)
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+
+    hass_storage[template.COMPILE_CACHE_STORAGE_KEY]["data"] = {"templates": 1}
+    await template.async_load_compile_cache(hass)
+    hass_storage[template.COMPILE_CACHE_STORAGE_KEY]["data"]["version"] = (
+        compile_cache._version
+    )
+    await template.async_load_compile_cache(hass)
+
+
+async def test_compile_cache_digest_mismatch(hass: HomeAssistant) -> None:
+    """Test compiled templates that changed since they were stored are not loaded."""
+    compile_cache = template.TemplateCompileCache(hass)
+    source = "{{ 1 + 1 }}"
+    compile_cache.put("default", source, compile("1 + 1", "<template>", "eval"))
+    key = compile_cache._key("default", source)
+    digest, encoded = compile_cache._entries[key]
+    # Flip a bit of the marshalled code
+    marshalled = bytearray(base64.b64decode(encoded))
+    marshalled[-2] ^= 1
+    compile_cache._entries[key] = (digest, base64.b64encode(marshalled).decode())
+
+    with patch("homeassistant.helpers.template.marshal.loads") as mock_loads:
+        assert compile_cache.get("default", source) is None
+    assert not mock_loads.called
+    assert key not in compile_cache._entries
+    await hass.async_block_till_done()
+
+
+async def test_compile_cache_threads(hass: HomeAssistant) -> None:
+    """Test the compile cache can be used from several threads at once."""
+    compile_cache = template.TemplateCompileCache(hass)
+    code = compile("1 + 1", "<template>", "eval")
+
+    def _use_cache(thread: int) -> None:
+        for idx in range(100):
+            source = f"{{{{ {thread} + {idx} }}}}"
+            compile_cache.put("default", source, code)
+            assert compile_cache.get("default", source) is not None
+            compile_cache._data_to_save()
+
+    with patch.object(template, "COMPILE_CACHE_SIZE", 50):
+        await asyncio.gather(
+            *(hass.async_add_executor_job(_use_cache, thread) for thread in range(4))
+        )
+    await hass.async_block_till_done()
+    assert len(compile_cache._data_to_save()["templates"]) == 50
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
@@ -5481,6 +5625,29 @@ async def test_template_timeout(hass: HomeAssistant) -> None:
     assert await tmp5.async_render_will_timeout(0.000001) is True
 
 
+async def test_template_timeout_render_time(hass: HomeAssistant) -> None:
+    """Test only renders that finish before the timeout are timed."""
+    tmp = template.Template("{{ var1 }}", hass)
+    with patch(
+        "homeassistant.helpers.template.perf_counter", side_effect=[1.0, 1.25]
+    ):
+        assert await tmp.async_render_will_timeout(3, {"var1": "ok"}) is False
+    assert tmp._renders == 1
+    assert tmp._render_time == 0.25
+
+    slow_template_str = """
+{% for var in range(1000) -%}
+  {% for var in range(1000) -%}
+    {{ var }}
+  {%- endfor %}
+{%- endfor %}
+"""
+    tmp = template.Template(slow_template_str, hass)
+    assert await tmp.async_render_will_timeout(0.000001) is True
+    assert tmp._renders == 1
+    assert tmp._render_time == 0
+
+
 async def test_template_timeout_raise(hass: HomeAssistant) -> None:
     """Test we can raise from."""
     tmp2 = template.Template("{{ error_invalid + 1 }}", hass)
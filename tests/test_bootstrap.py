@@ -196,6 +196,59 @@ async def test_preload_translations(hass: HomeAssistant) -> None:
     assert async_translations_loaded(hass, BASE_PLATFORMS)
 
 
+async def test_preload_components_with_installed_requirements(
+    hass: HomeAssistant,
+) -> None:
+    """Test only components with installed requirements are preloaded."""
+
+    def _integration(
+        domain: str, requirements: list[str], dependencies: list[str] | None = None
+    ) -> Integration:
+        integration = Integration(
+            hass,
+            f"homeassistant.components.{domain}",
+            None,
+            {
+                "name": domain,
+                "domain": domain,
+                "dependencies": dependencies or [],
+                "requirements": requirements,
+            },
+        )
+        integration._all_dependencies = set(dependencies or [])
+        return integration
+
+    integrations = {
+        integration.domain: integration
+        for integration in (
+            _integration("installed", ["installed-pkg==1.0"]),
+            _integration("child", [], ["installed"]),
+            _integration("missing", ["missing-pkg==1.0"]),
+            _integration("uses_missing", [], ["missing"]),
+            _integration("after_missing", []),
+        )
+    }
+    with (
+        patch(
+            "homeassistant.requirements.pkg_util.get_installed_versions",
+            return_value={"installed-pkg==1.0"},
+        ),
+        patch("homeassistant.loader.async_preload_components") as mock_preload,
+    ):
+        await bootstrap._async_preload_components(
+            hass,
+            integrations,
+            {domain: itg.requirements for domain, itg in integrations.items()},
+            {"after_missing": {"missing"}},
+        )
+
+    assert [itg.domain for itg in mock_preload.call_args[0][0]] == [
+        "installed",
+        "child",
+    ]
+    assert mock_preload.call_args[0][1] == bootstrap.PRELOAD_COMPONENTS_JOBS
+
+
 async def test_core_failure_loads_recovery_mode(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
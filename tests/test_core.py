@@ -1533,6 +1533,54 @@ async def test_statemachine_remove(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_changes_since(hass: HomeAssistant) -> None:
+    """Test getting the changes since a version."""
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.ceiling", "on")
+    version = hass.states.version
+    assert hass.states.async_changes_since(version) == ([], [])
+
+    # Reported states change last_reported, so they change the version
+    hass.states.async_set("light.ceiling", "on")
+    assert hass.states.version == version + 1
+    assert hass.states.async_changes_since(version) == (
+        [hass.states.get("light.ceiling")],
+        [],
+    )
+    version += 1
+
+    hass.states.async_set("light.bowl", "off")
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_remove("light.ceiling")
+    assert hass.states.version == version + 3
+    assert hass.states.async_changes_since(version) == (
+        [hass.states.get("light.kitchen"), hass.states.get("light.bowl")],
+        ["light.ceiling"],
+    )
+    assert hass.states.async_changes_since(version + 2) == ([], ["light.ceiling"])
+    assert hass.states.async_changes_since(version + 3) == ([], [])
+    # Unknown versions
+    assert hass.states.async_changes_since(version + 4) is None
+    assert hass.states.async_changes_since(0) is None
+
+
+async def test_statemachine_changes_since_bounded(hass: HomeAssistant) -> None:
+    """Test the changes of removed entities are bounded."""
+    hass.states.async_set("light.bowl", "on")
+    version = hass.states.version
+    with patch.object(ha, "MAX_STATE_CHANGE_LOG_REMOVED", 2):
+        for idx in range(3):
+            hass.states.async_set(f"light.removed_{idx}", "on")
+            hass.states.async_remove(f"light.removed_{idx}")
+
+    # The change of light.bowl was dropped from the log
+    assert hass.states.async_changes_since(version - 1) is None
+    assert hass.states.async_changes_since(version) == (
+        [],
+        ["light.removed_2", "light.removed_1", "light.removed_0"],
+    )
+
+
 async def test_state_machine_case_insensitivity(hass: HomeAssistant) -> None:
     """Test setting and getting states entity_id insensitivity."""
     events = async_capture_events(hass, EVENT_STATE_CHANGED)
@@ -2311,6 +2359,51 @@ async def test_async_all(hass: HomeAssistant) -> None:
     } == {"light.bowl", "light.frog", "switch.link"}
 
 
+async def test_async_snapshot(hass: HomeAssistant) -> None:
+    """Test async_snapshot."""
+    assert hass.states.async_snapshot() == ()
+    assert hass.states.async_snapshot("light") == ()
+    assert hass.states.async_snapshot(["light", "switch"]) == ()
+
+    hass.states.async_set("switch.link", "on")
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.frog", "on")
+    hass.states.async_set("vacuum.floor", "on")
+
+    snapshot = hass.states.async_snapshot()
+    assert {state.entity_id for state in snapshot} == {
+        "switch.link",
+        "light.bowl",
+        "light.frog",
+        "vacuum.floor",
+    }
+    light_snapshot = hass.states.async_snapshot("light")
+    assert {state.entity_id for state in light_snapshot} == {
+        "light.bowl",
+        "light.frog",
+    }
+    assert {
+        state.entity_id for state in hass.states.async_snapshot(["light", "switch"])
+    } == {"light.bowl", "light.frog", "switch.link"}
+
+    # Domain snapshots are shared until a state of the domain changes
+    assert hass.states.async_snapshot("LIGHT") is light_snapshot
+    # The snapshot of all states is not cached
+    assert hass.states.async_snapshot() is not snapshot
+
+    hass.states.async_set("switch.link", "off")
+    assert hass.states.async_snapshot("light") is light_snapshot
+    new_snapshot = hass.states.async_snapshot()
+    assert hass.states.get("switch.link") in new_snapshot
+    assert hass.states.get("switch.link") not in snapshot
+
+    hass.states.async_remove("light.frog")
+    new_light_snapshot = hass.states.async_snapshot("light")
+    assert new_light_snapshot is not light_snapshot
+    assert [state.entity_id for state in new_light_snapshot] == ["light.bowl"]
+    assert len(light_snapshot) == 2
+
+
 async def test_async_entity_ids_count(hass: HomeAssistant) -> None:
     """Test async_entity_ids_count."""
 
@@ -3043,7 +3136,7 @@ def test_one_time_listener_repr(hass: HomeAssistant) -> None:
 
 
 async def test_async_add_import_executor_job(hass: HomeAssistant) -> None:
-    """Test async_add_import_executor_job works and is limited to one thread."""
+    """Test async_add_import_executor_job works and is limited in threads."""
     evt = threading.Event()
     loop = asyncio.get_running_loop()
 
@@ -3055,7 +3148,7 @@ async def test_async_add_import_executor_job(hass: HomeAssistant) -> None:
     await loop.run_in_executor(None, evt.wait)
     assert await future is evt
 
-    assert hass.import_executor._max_workers == 1
+    assert hass.import_executor._max_workers == ha.IMPORT_EXECUTOR_WORKERS
 
 
 async def test_async_run_job_deprecated(
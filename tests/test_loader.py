@@ -2023,3 +2023,107 @@ async def test_async_get_integrations_multiple_non_existent(
     ):
         integrations = await loader.async_get_integrations(hass, ["does_not_exist"])
     assert integrations["does_not_exist"] is integration
+
+
+def _preload_integration(
+    hass: HomeAssistant,
+    name: str,
+    dependencies: list[str],
+    after_dependencies: list[str] | None = None,
+) -> loader.Integration:
+    """Return an integration to preload."""
+    return loader.Integration(
+        hass,
+        f"homeassistant.components.{name}",
+        None,
+        {
+            "name": name,
+            "domain": name,
+            "dependencies": dependencies,
+            "after_dependencies": after_dependencies or [],
+            "requirements": [],
+        },
+    )
+
+
+async def test_async_preload_components(hass: HomeAssistant) -> None:
+    """Test components are imported after their (after) dependencies with timings."""
+    integrations = [
+        _preload_integration(hass, "preload_other", [], ["preload_child"]),
+        _preload_integration(hass, "preload_child", ["preload_base", "http"]),
+        _preload_integration(hass, "preload_base", []),
+    ]
+    imports: list[str] = []
+
+    def import_module(name: str) -> Any:
+        imports.append(name)
+        return MagicMock(__file__="__init__.py")
+
+    with patch("homeassistant.loader.importlib.import_module", import_module):
+        await loader.async_preload_components(integrations, 3)
+
+    assert imports == [
+        "homeassistant.components.preload_base",
+        "homeassistant.components.preload_child",
+        "homeassistant.components.preload_other",
+    ]
+    for integration in integrations:
+        assert integration.domain in hass.data[loader.DATA_COMPONENTS]
+
+    import_timings = loader.async_get_import_timings(hass)
+    assert set(import_timings) == set(imports)
+    assert all(import_time >= 0 for import_time in import_timings.values())
+
+
+async def test_async_preload_components_import_error(hass: HomeAssistant) -> None:
+    """Test import errors are left for setup to report."""
+    integration = loader.Integration(
+        hass,
+        "homeassistant.components.preload_broken",
+        None,
+        {"name": "broken", "domain": "preload_broken", "dependencies": []},
+    )
+
+    with patch(
+        "homeassistant.loader.importlib.import_module",
+        side_effect=ImportError("boom"),
+    ):
+        await loader.async_preload_components([integration], 3)
+
+    assert "preload_broken" not in hass.data[loader.DATA_COMPONENTS]
+    assert loader.async_get_import_timings(hass) == {}
+
+
+async def test_async_preload_components_max_jobs(hass: HomeAssistant) -> None:
+    """Test independent components are imported at the same time up to max_jobs."""
+    independent = [f"preload_independent_{idx}" for idx in range(4)]
+    integrations = [
+        _preload_integration(hass, "preload_last", independent),
+        *(_preload_integration(hass, name, []) for name in independent),
+    ]
+    imports: list[str] = []
+    lock = threading.Lock()
+    running = max_running = 0
+    # The independent components are only imported two at a time
+    barrier = threading.Barrier(2, timeout=5)
+
+    def import_module(name: str) -> Any:
+        nonlocal running, max_running
+        with lock:
+            imports.append(name)
+            running += 1
+            max_running = max(max_running, running)
+        if name != "homeassistant.components.preload_last":
+            barrier.wait()
+        with lock:
+            running -= 1
+        return MagicMock(__file__="__init__.py")
+
+    with patch("homeassistant.loader.importlib.import_module", import_module):
+        await loader.async_preload_components(integrations, 2)
+
+    assert max_running == 2
+    assert sorted(imports[:4]) == [
+        f"homeassistant.components.{name}" for name in independent
+    ]
+    assert imports[4] == "homeassistant.components.preload_last"